@@ -11,9 +11,29 @@ Available subpackages
 ---------------------
 StandardWithUncertainty
     Provides a class that represents a typical value with uncertainty.
+DecimalArray
+    Provides a class that represents an array of decimal numbers.
+TvuArray
+    Provides a class that represents an array of typical values with uncertainties.
+TvuAccumulator
+    Provides a class that accumulates a stream of samples into a typical value with uncertainty.
+storage
+    Provides a columnar on-disk format for decimal and Tvu arrays.
 """
 
 from .decimal_value import DecimalNumber
 from .decimal_value import Dn  # alias
+from .decimal_value import DecimalArray
+from .decimal_value import parse_decimals
 from .typical_value import TypicalValueWithUncertainty
 from .typical_value import Tvu  # alias
+from .typical_value import TvuArray
+from .typical_value import TVU_DTYPE, to_structured, from_structured
+from .typical_value import TvuAccumulator
+from .typical_value import covariance_matrix, correlation_matrix
+from .typical_value import lazy
+from .typical_value import monte_carlo
+from .typical_value import groupby_reduce
+from .typical_value import weighted_mean
+from .typical_value import format_tvu
+from .storage import ColumnarWriter, save_columnar, open_columns, load_columnar
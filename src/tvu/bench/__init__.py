@@ -0,0 +1,11 @@
+"""
+bench
+=====
+
+Microbenchmarks for the tvu package.
+
+Each module builds the cases of one group, e.g. tvu.bench.operators.
+``python -m tvu.bench`` runs the suite of tvu.bench.suite over them,
+prints a JSON report and, given ``--baseline report.json``, flags the
+cases that got slower than in an earlier report.
+"""
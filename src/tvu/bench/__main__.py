@@ -0,0 +1,44 @@
+import argparse
+import json
+import sys
+from .suite import GROUPS, THRESHOLD, compare, run, unit
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m tvu.bench', description='Runs the tvu benchmark suite and prints a JSON report.')
+    parser.add_argument('groups', nargs='*', metavar='group', help=f'the groups to run, any of {", ".join(GROUPS)} (default: all)')
+    parser.add_argument('-k', dest='pattern', help='run only the cases whose key contains this substring')
+    parser.add_argument('-o', '--output', help='write the report to this file instead of stdout')
+    parser.add_argument('-b', '--baseline', help='compare against the report in this file and exit with 1 on regressions')
+    parser.add_argument('-t', '--threshold', type=float, default=THRESHOLD, help=f'the tolerated slowdown against the baseline (default: {THRESHOLD})')
+    parser.add_argument('--max-size', type=int, default=10000000, help='the largest array of any case (default: 10000000)')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of measurements per case (default: 3)')
+    parser.add_argument('--min-time', type=float, default=0.02, help='the least duration of a measurement in seconds (default: 0.02)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='do not print progress to stderr')
+    args = parser.parse_args(argv)
+    unknown = [group for group in args.groups if group not in GROUPS]
+    if unknown:
+        parser.error(f'invalid group {unknown[0]!r} (choose from {", ".join(GROUPS)})')
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    progress = None if args.quiet else lambda key, value: print(f'{key:<60}{value:16,.1f} {unit(key)}', file=sys.stderr)
+    report = run(tuple(args.groups) or GROUPS, args.pattern, args.max_size, args.repeat, args.min_time, progress)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if baseline is None:
+        return 0
+    regressions = compare(report, baseline, args.threshold)
+    for key, ratio in sorted(regressions.items(), key=lambda item: -item[1]):
+        print(f'REGRESSION {key}: {ratio:.2f}x the baseline', file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,29 @@
+from typing import Callable
+import numpy as np
+from ..typical_value import Tvu, TvuArray
+
+
+def cases(rng: np.random.Generator, max_size: int) -> dict[str, Callable[[], object]]:
+    """Builds the cases of Tvu and TvuArray construction from float64 arrays.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random generator of the data.
+    max_size : int
+        The largest array; sizes go from 10 by powers of 10.
+
+    Returns
+    -------
+    dict[str, Callable[[], object]]
+        The cases keyed by the benchmarked expression.
+
+    """
+    result = {}
+    n = 10
+    while n <= max_size:
+        t, u = rng.standard_normal(n), rng.uniform(0.1, 1.0, n)
+        result[f'Tvu(float64[{n}])'] = lambda t=t: Tvu(t)
+        result[f'TvuArray(float64[{n}], float64[{n}])'] = lambda t=t, u=u: TvuArray(t, u)
+        n *= 10
+    return result
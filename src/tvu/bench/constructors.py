@@ -0,0 +1,50 @@
+from typing import Callable
+import numpy as np
+from ..decimal_value import DecimalArray, Dn
+from ..typical_value import Tvu
+
+
+def cases(rng: np.random.Generator, max_size: int) -> dict[str, Callable[[], object]]:
+    """Builds the cases of the constructors of each input type.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random generator of the data.
+    max_size : int
+        The largest array; the arrays have 1000 elements at most.
+
+    Returns
+    -------
+    dict[str, Callable[[], object]]
+        The cases keyed by the benchmarked expression.
+
+    """
+    n = min(1000, max_size)
+    d, i = Dn(12.345), np.int64(123456789)
+    t = Tvu(2.0, 0.1)
+    floats = rng.uniform(-1e3, 1e3, n).round(3)
+    ints = rng.integers(-10 ** 9, 10 ** 9, n)
+    strs = floats.astype(str)
+    return {
+        'Dn(int)': lambda: Dn(123456789),
+        'Dn(big int)': lambda: Dn(10 ** 30 + 1),
+        'Dn(float)': lambda: Dn(12.345),
+        'Dn(str)': lambda: Dn('12.345'),
+        'Dn(np.int64)': lambda: Dn(i),
+        'Dn(Dn)': lambda: Dn(d),
+        'Dn(int, e)': lambda: Dn(12345, -3),
+        'Dn.interned(int)': lambda: Dn.interned(7),
+        'Dn.interned(float)': lambda: Dn.interned(12.345),
+        'Tvu(int)': lambda: Tvu(7),
+        'Tvu(float)': lambda: Tvu(12.345),
+        'Tvu(Dn)': lambda: Tvu(d),
+        'Tvu(np.int64)': lambda: Tvu(i),
+        'Tvu(Tvu)': lambda: Tvu(t),
+        'Tvu(float, float)': lambda: Tvu(2.0, 0.1),
+        'Tvu(Dn, Dn)': lambda: Tvu(d, d),
+        f'DecimalArray(int64[{n}])': lambda: DecimalArray(ints),
+        f'DecimalArray(float64[{n}])': lambda: DecimalArray(floats),
+        f'DecimalArray(str[{n}])': lambda: DecimalArray(strs),
+        f'DecimalArray(list[{n}])': lambda: DecimalArray(floats.tolist()),
+    }
@@ -0,0 +1,40 @@
+import os
+from typing import Callable
+import numpy as np
+from ..typical_value import Tvu, groupby_reduce
+from ..typical_value.statistics import segments
+
+
+def _loop(values: np.ndarray, labels: np.ndarray) -> list:
+    """The per-group Python loop that groupby_reduce replaces."""
+    order = np.argsort(labels, kind='stable')
+    keys, v = labels[order], values[order]
+    starts = segments(keys)
+    return [Tvu(group) for group in np.split(v, starts[1:])]
+
+
+def cases(rng: np.random.Generator, max_size: int) -> dict[str, Callable[[], object]]:
+    """Builds the cases of per-group means and standard errors.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random generator of the data.
+    max_size : int
+        The largest array; there are 10000000 readings in 10000 groups at most.
+
+    Returns
+    -------
+    dict[str, Callable[[], object]]
+        The cases keyed by the benchmarked call.
+
+    """
+    n = min(10000000, max_size)
+    values = rng.standard_normal(n)
+    labels = rng.integers(0, max(n // 1000, 1), n)
+    processes = os.cpu_count() or 1
+    return {
+        f'Tvu(ndarray) per group, {n} readings': lambda: _loop(values, labels),
+        f'groupby_reduce, {n} readings': lambda: groupby_reduce(values, labels),
+        f'groupby_reduce(processes={processes}), {n} readings': lambda: groupby_reduce(values, labels, processes),
+    }
@@ -0,0 +1,55 @@
+from typing import Callable
+import numpy as np
+from ..decimal_value import Dn, intern_cache_configure
+from ..decimal_value.intern import MAXSIZE, SMALL_INTS
+from ..typical_value import Tvu
+
+
+def _loop(values: list) -> int:
+    """A typical add/compare-heavy loop over plain Python operands."""
+    total, count = Dn(0), 0
+    for v in values:
+        total = total + v
+        if total > 1000:
+            total = total - 1000
+        if Tvu(v).t >= 0.5:
+            count += 1
+    return count
+
+
+def _configured(values: list, maxsize: int, small_ints: int) -> int:
+    """Runs the loop with the intern cache configured, restoring the default configuration afterwards."""
+    intern_cache_configure(maxsize, small_ints)
+    try:
+        return _loop(values)
+    finally:
+        intern_cache_configure(MAXSIZE, SMALL_INTS)
+
+
+def cases(rng: np.random.Generator, max_size: int) -> dict[str, Callable[[], object]]:
+    """Builds the cases of a conversion-heavy loop with and without the intern cache.
+
+    Without the cache every conversion of an operand allocates a new
+    DecimalNumber; with it only the first conversion of each value does.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random generator of the data.
+    max_size : int
+        The largest loop; it has 10000 iterations over 50 distinct floats and small ints at most.
+
+    Returns
+    -------
+    dict[str, Callable[[], object]]
+        The cases keyed by the cache configuration.
+
+    """
+    n, distinct = min(10000, max_size), 50
+    floats = (rng.integers(0, 10000, distinct) / 100).tolist()
+    values = [floats[i] if i < distinct else i - distinct for i in rng.integers(0, 2 * distinct, n).tolist()]
+    return {
+        f'loop[{n}], no cache': lambda: _configured(values, 0, 0),
+        f'loop[{n}], small ints': lambda: _configured(values, 0, SMALL_INTS),
+        f'loop[{n}], default': lambda: _configured(values, MAXSIZE, SMALL_INTS),
+    }
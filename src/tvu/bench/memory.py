@@ -0,0 +1,56 @@
+import tracemalloc
+from typing import Callable
+import numpy as np
+from ..decimal_value import Dn
+from ..typical_value import Tvu
+
+
+def bytes_per_instance(f: Callable[[], list]) -> float:
+    """Measures the memory held by the objects of a list.
+
+    Parameters
+    ----------
+    f : Callable[[], list]
+        Creates the objects, which are kept alive during the measurement.
+
+    Returns
+    -------
+    float
+        The traced bytes per object, including its slot of the list.
+
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        objs = f()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return size / len(objs)
+
+
+def cases(rng: np.random.Generator, max_size: int) -> dict[str, Callable[[], list]]:
+    """Builds the cases of the memory of DecimalNumber and TypicalValueWithUncertainty instances.
+
+    They are measured with bytes_per_instance instead of being timed.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        Unused; the values are the indices of the objects.
+    max_size : int
+        The largest list; 100000 objects are kept alive at most.
+
+    Returns
+    -------
+    dict[str, Callable[[], list]]
+        The cases keyed by the constructor.
+
+    """
+    n = min(100000, max_size)
+    return {
+        'Dn(int)': lambda: [Dn(i) for i in range(n)],
+        'Dn(float)': lambda: [Dn(i + 0.5) for i in range(n)],
+        'Tvu(int, int)': lambda: [Tvu(i, 1) for i in range(n)],
+    }
@@ -0,0 +1,61 @@
+import operator
+from typing import Callable
+import numpy as np
+from ..decimal_value import Dn
+from ..typical_value import Tvu, TvuArray
+
+_DN_OPERATORS = (
+    operator.add, operator.sub, operator.mul, operator.truediv, operator.floordiv, operator.mod,
+    operator.eq, operator.ne, operator.lt, operator.le, operator.gt, operator.ge,
+)
+_TVU_OPERATORS = (operator.add, operator.sub, operator.mul, operator.truediv, operator.pow)
+_SYMBOLS = {
+    'add': '+', 'sub': '-', 'mul': '*', 'truediv': '/', 'floordiv': '//', 'mod': '%', 'pow': '**',
+    'eq': '==', 'ne': '!=', 'lt': '<', 'le': '<=', 'gt': '>', 'ge': '>=',
+}
+
+
+def cases(rng: np.random.Generator, max_size: int) -> dict[str, Callable[[], object]]:
+    """Builds the cases of every operator of DecimalNumber, Tvu and TvuArray.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random generator of the data.
+    max_size : int
+        The largest array; the TvuArray operands have 1000 elements at most.
+
+    Returns
+    -------
+    dict[str, Callable[[], object]]
+        The cases keyed by the benchmarked expression.
+
+    """
+    n = min(1000, max_size)
+    a, b = Dn(12.345), Dn(6789)
+    c, d = a.normalize(), Dn(12345, -3)
+    x, y = Tvu(2.0, 0.1), Tvu(3.0, 0.2)
+    p, q = TvuArray(rng.uniform(1, 2, n), 0.1), TvuArray(rng.uniform(1, 2, n), 0.1)
+    result = {}
+    for f in _DN_OPERATORS:
+        symbol = _SYMBOLS[f.__name__]
+        result[f'Dn {symbol} Dn'] = lambda f=f: f(a, b)
+        result[f'Dn {symbol} int'] = lambda f=f: f(a, 7)
+        result[f'int {symbol} Dn'] = lambda f=f: f(7, a)
+    result.update({
+        'Dn == Dn (same e)': lambda: c == d,
+        'Dn * float': lambda: a * 2.5,
+        'Dn += Dn': lambda: a.__iadd__(b),
+        'Dn ** int': lambda: a ** 2,
+        '-Dn': lambda: -a,
+        'abs(Dn)': lambda: abs(a),
+        'hash(Dn)': lambda: hash(a),
+    })
+    for f in _TVU_OPERATORS:
+        symbol = _SYMBOLS[f.__name__]
+        result[f'Tvu {symbol} Tvu'] = lambda f=f: f(x, y)
+        result[f'Tvu {symbol} int'] = lambda f=f: f(x, 2)
+        result[f'int {symbol} Tvu'] = lambda f=f: f(2, x)
+        result[f'TvuArray[{n}] {symbol} TvuArray[{n}]'] = lambda f=f: f(p, q)
+    result['-Tvu'] = lambda: -x
+    return result
@@ -0,0 +1,46 @@
+from typing import Callable
+import numpy as np
+from ..decimal_value.power.float_power import float_power, float_power_array
+from ..decimal_value.power.int_power import int_power
+from ..decimal_value.power.npint_power import npint_power
+
+
+def cases(rng: np.random.Generator, max_size: int) -> dict[str, Callable[[], object]]:
+    """Builds the cases of int_power, float_power and npint_power across magnitude ranges.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random generator of the data.
+    max_size : int
+        The largest array; the arrays have 1000 elements at most.
+
+    Returns
+    -------
+    dict[str, Callable[[], object]]
+        The cases keyed by the benchmarked expression.
+
+    """
+    n = min(1000, max_size)
+    result = {}
+    for k in (0, 6, 12, 18, 30, 100):
+        for key, v in ((f'int_power(12345e{k})', 12345 * 10 ** k), (f'int_power(10^{k}+1)', 10 ** k + 1)):
+            result[key] = lambda v=v: int_power(v)
+    for k in (-300, -30, -6, 0, 6, 30, 300):
+        v = float(f'1.2345e{k}')
+        result[f'float_power(1.2345e{k})'] = lambda v=v: float_power(v)
+    for k in (0, 6, 12):
+        v = np.int64(12345 * 10 ** k)
+        result[f'npint_power(12345e{k})'] = lambda v=v: npint_power(v)
+    ints = rng.integers(0, 10 ** 6, n) * 10 ** rng.integers(0, 12, n)
+    result[f'npint_power(int64[{n}])'] = lambda: npint_power(ints)
+    data = {
+        'uniform [0, 1)': rng.random(n),
+        '2 decimals': np.round(rng.random(n) * 100, 2),
+        '1e-30 .. 1e30': 10 ** rng.uniform(-30, 30, n),
+    }
+    for key, values in data.items():
+        floats = values.tolist()
+        result[f'[float_power(v) for v in float64[{n}]], {key}'] = lambda floats=floats: [float_power(v) for v in floats]
+        result[f'float_power_array(float64[{n}]), {key}'] = lambda values=values: float_power_array(values)
+    return result
@@ -0,0 +1,45 @@
+from typing import Callable
+import numpy as np
+from ..typical_value import Tvu, TvuArray, from_structured
+
+
+def cases(rng: np.random.Generator, max_size: int) -> dict[str, Callable[[], object]]:
+    """Builds the cases of the propagating operators, ufuncs and array functions.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random generator of the data.
+    max_size : int
+        The largest array; the TvuArray operands have 1000000 elements at most.
+
+    Returns
+    -------
+    dict[str, Callable[[], object]]
+        The cases keyed by the benchmarked expression.
+
+    """
+    n = min(1000000, max_size)
+    a = TvuArray(rng.uniform(1, 2, n), rng.uniform(0, 0.1, n))
+    b = TvuArray(rng.uniform(1, 2, n), rng.uniform(0, 0.1, n))
+    r = from_structured(a.to_structured())
+    x, y = Tvu(1.5, 0.1), Tvu(2.5, 0.2)
+    return {
+        f'TvuArray[{n}] + TvuArray[{n}]': lambda: a + b,
+        f'TvuArray[{n}] - TvuArray[{n}]': lambda: a - b,
+        f'TvuArray[{n}] * TvuArray[{n}]': lambda: a * b,
+        f'TvuArray[{n}] / TvuArray[{n}]': lambda: a / b,
+        f'TvuArray[{n}] ** TvuArray[{n}]': lambda: a ** b,
+        f'TvuArray[{n}] * float': lambda: a * 2.5,
+        f'np.sin(TvuArray[{n}])': lambda: np.sin(a),
+        f'np.exp(TvuArray[{n}])': lambda: np.exp(a),
+        f'np.arctan2(TvuArray[{n}], TvuArray[{n}])': lambda: np.arctan2(a, b),
+        f'np.logaddexp(TvuArray[{n}], TvuArray[{n}])': lambda: np.logaddexp(a, b),
+        f'np.sum(TvuArray[{n}])': lambda: np.sum(a),
+        f'np.sort(TvuArray[{n}])': lambda: np.sort(a),
+        f'structured[{n}] * TvuArray[{n}]': lambda: r * b,
+        f'np.sum(structured[{n}])': lambda: np.sum(r),
+        'Tvu ** float': lambda: x ** 2.5,
+        'np.sin(Tvu)': lambda: np.sin(x),
+        'np.hypot(Tvu, Tvu)': lambda: np.hypot(x, y),
+    }
@@ -0,0 +1,51 @@
+from typing import Callable
+import numpy as np
+from ..decimal_value import DecimalArray, Dn
+from ..decimal_value.pow10 import pow10
+from ..decimal_value.rounding import ROUNDING_MODES
+
+
+def _legacy_round(d: Dn, ndigits: int = 0) -> Dn:
+    """The rounding of DecimalNumber before the integer kernel, kept as the reference."""
+    min_digits = -ndigits - d.e
+    floordiv = Dn(d.x // pow10(min_digits), d.e + min_digits)
+    mod = Dn(d.x % pow10(min_digits), d.e + min_digits - 1)
+    return floordiv + Dn(1 if mod >= Dn(5) else 0, d.e + min_digits)
+
+
+def cases(rng: np.random.Generator, max_size: int) -> dict[str, Callable[[], object]]:
+    """Builds the cases of round, floor and ceil of DecimalNumber and DecimalArray.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random generator of the data.
+    max_size : int
+        The largest array; the DecimalArray operands have 1000 elements at most.
+
+    Returns
+    -------
+    dict[str, Callable[[], object]]
+        The cases keyed by the benchmarked expression.
+
+    """
+    n = min(1000, max_size)
+    a = Dn('-12.34567')
+    d = DecimalArray(rng.uniform(-1e3, 1e3, n))
+    i = DecimalArray(rng.integers(-10 ** 9, 10 ** 9, n), -6)
+    values = i.tolist()
+    result = {f'Dn.round(2, {mode!r})': lambda mode=mode: a.round(2, mode) for mode in ROUNDING_MODES}
+    result.update({
+        'legacy Dn.round(2)': lambda: _legacy_round(a, 2),
+        'Dn.floor(2)': lambda: a.floor(2),
+        'Dn.ceil(2)': lambda: a.ceil(2),
+        'Dn.round(-1)': lambda: a.round(-1),
+        f'[v.round(2) for v in Dn[{n}]]': lambda: [v.round(2) for v in values],
+    })
+    result.update({f'DecimalArray[{n}].round(2, {mode!r})': lambda mode=mode: d.round(2, mode) for mode in ROUNDING_MODES})
+    result.update({
+        f'DecimalArray[{n}].floor(2)': lambda: d.floor(2),
+        f'DecimalArray[{n}].ceil(2)': lambda: d.ceil(2),
+        f'DecimalArray(int64[{n}], -6).round(2)': lambda: i.round(2),
+    })
+    return result
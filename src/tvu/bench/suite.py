@@ -0,0 +1,181 @@
+"""The benchmark suite behind ``python -m tvu.bench``.
+
+Every case is a callable keyed by 'group/name'. The cases of a group are
+built by the cases function of the module of the same name in tvu.bench,
+and are reported in nanoseconds per call: the fastest of a few
+measurements, each of which calls the case as many times as fit in
+min_time. The memory group is reported in bytes per instance instead. A
+report is a JSON object with the environment and the results, so a report
+saved on one commit can be used as the baseline of another on the same
+machine.
+"""
+import platform
+import time
+from typing import Callable
+import numpy as np
+from . import arrays, constructors, groupby, interning, memory, operators, power, propagation, rounding, weighted_mean
+
+FORMAT = 'tvu-bench'
+VERSION = 1
+THRESHOLD = 0.25
+
+_MODULES = {
+    'constructors': constructors,
+    'operators': operators,
+    'rounding': rounding,
+    'power': power,
+    'arrays': arrays,
+    'propagation': propagation,
+    'groupby': groupby,
+    'weighted_mean': weighted_mean,
+    'interning': interning,
+    'memory': memory,
+}
+GROUPS = tuple(_MODULES)
+
+
+def cases(groups: tuple[str, ...] = GROUPS, max_size: int = 10000000, seed: int = 0) -> dict[str, Callable[[], object]]:
+    """Builds the benchmark cases.
+
+    Parameters
+    ----------
+    groups : tuple[str, ...]
+        The groups to build, a subset of GROUPS.
+    max_size : int
+        The largest array of any case; the 'arrays' group has sizes from 10
+        by powers of 10 up to it, the other groups cap their own sizes by it.
+    seed : int
+        The seed of the random generator.
+
+    Returns
+    -------
+    dict[str, Callable[[], object]]
+        The cases keyed by 'group/name'.
+
+    """
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        raise ValueError(f'Unsupported groups {sorted(unknown)}, expected a subset of {GROUPS}')
+    rng = np.random.default_rng(seed)
+    return {f'{group}/{key}': f for group in groups for key, f in _MODULES[group].cases(rng, max_size).items()}
+
+
+def measure(f: Callable[[], object], repeat: int = 3, min_time: float = 0.02) -> float:
+    """Measures a callable.
+
+    Parameters
+    ----------
+    f : Callable[[], object]
+        The callable.
+    repeat : int
+        The number of measurements; the fastest one is reported.
+    min_time : float
+        The least duration of a measurement in seconds; the number of calls
+        per measurement grows by powers of 10 until it is reached.
+
+    Returns
+    -------
+    float
+        Nanoseconds per call.
+
+    """
+    number = 1
+    while True:
+        elapsed = _time(f, number)
+        if elapsed >= min_time or number >= 10 ** 7:
+            break
+        number *= 10
+    return min([elapsed] + [_time(f, number) for _ in range(repeat - 1)]) / number * 1e9
+
+
+def unit(key: str) -> str:
+    """Returns the unit of the result of a case: 'bytes' per instance for the memory group, otherwise 'ns' per call."""
+    return 'bytes' if key.startswith('memory/') else 'ns'
+
+
+def run(groups: tuple[str, ...] = GROUPS, pattern: str | None = None, max_size: int = 10000000,
+        repeat: int = 3, min_time: float = 0.02, progress: Callable[[str, float], None] | None = None) -> dict:
+    """Runs the benchmark suite.
+
+    Parameters
+    ----------
+    groups : tuple[str, ...]
+        The groups to run, a subset of GROUPS.
+    pattern : str | None
+        Run only the cases whose key contains this substring.
+    max_size : int
+        The largest array of any case, see cases.
+    repeat : int
+        The number of measurements per case, see measure.
+    min_time : float
+        The least duration of a measurement in seconds, see measure.
+    progress : Callable[[str, float], None] | None
+        Called with the key and the result of each case as it finishes.
+
+    Returns
+    -------
+    dict
+        The report: format, version, the environment and the results keyed
+        by case, in the unit of each case.
+
+    """
+    results = {}
+    for key, f in cases(groups, max_size).items():
+        if pattern is not None and pattern not in key:
+            continue
+        results[key] = memory.bytes_per_instance(f) if unit(key) == 'bytes' else measure(f, repeat, min_time)
+        if progress is not None:
+            progress(key, results[key])
+    return {
+        'format': FORMAT,
+        'version': VERSION,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float = THRESHOLD) -> dict[str, float]:
+    """Finds the cases of a report that are slower than in a baseline.
+
+    Parameters
+    ----------
+    report : dict
+        The report, as returned by run.
+    baseline : dict
+        An earlier report.
+    threshold : float
+        The tolerated slowdown, e.g. 0.25 flags cases that take more than
+        1.25 times as long (or as many bytes) as in the baseline.
+
+    Returns
+    -------
+    dict[str, float]
+        The ratio of the result to the baseline result of each flagged case.
+        Cases missing from either report are not compared.
+
+    Raises
+    ------
+    ValueError
+        If baseline is not a report of this format.
+
+    Examples
+    --------
+    >>> compare({'results': {'a': 130.0, 'b': 100.0}}, {'format': 'tvu-bench', 'results': {'a': 100.0, 'b': 100.0}})
+    {'a': 1.3}
+
+    """
+    if baseline.get('format') != FORMAT or baseline.get('version', 0) > VERSION:
+        raise ValueError(f'Unsupported baseline format: {baseline.get("format")} version {baseline.get("version")}')
+    old = baseline['results']
+    ratios = {key: ns / old[key] for key, ns in report['results'].items() if old.get(key)}
+    return {key: ratio for key, ratio in ratios.items() if ratio > 1 + threshold}
+
+
+def _time(f: Callable[[], object], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        f()
+    return time.perf_counter() - start
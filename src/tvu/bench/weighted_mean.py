@@ -0,0 +1,40 @@
+from typing import Callable
+import numpy as np
+from ..typical_value import Tvu, TvuArray, weighted_mean
+
+
+def _loop(values: list) -> Tvu:
+    """The Tvu arithmetic that weighted_mean replaces."""
+    weights = [1 / v.U ** 2 for v in values]
+    total = sum(weights)
+    return sum((v * (w / total) for v, w in zip(values, weights)), Tvu(0))
+
+
+def cases(rng: np.random.Generator, max_size: int) -> dict[str, Callable[[], object]]:
+    """Builds the cases of inverse-variance weighted means.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random generator of the data.
+    max_size : int
+        The largest array; there are 1000000 determinations in 10000 groups
+        at most, and 10000 of them for the Tvu arithmetic baseline.
+
+    Returns
+    -------
+    dict[str, Callable[[], object]]
+        The cases keyed by the benchmarked call.
+
+    """
+    n = min(1000000, max_size)
+    loop = min(10000, n)
+    values = TvuArray(rng.standard_normal(n), rng.uniform(0.5, 2.0, n))
+    labels = rng.integers(0, max(n // 100, 1), n)
+    small = values[:loop].tolist()
+    return {
+        f'Tvu arithmetic[{loop}]': lambda: _loop(small),
+        f'weighted_mean(TvuArray[{n}])': lambda: weighted_mean(values),
+        f'weighted_mean(TvuArray[{n}], birge=True)': lambda: weighted_mean(values, birge=True),
+        f'weighted_mean(TvuArray[{n}], labels, birge=True)': lambda: weighted_mean(values, labels, birge=True),
+    }
@@ -1,2 +1,5 @@
-from .decimal_number import DecimalNumber
+from .decimal_number import DecimalNumber, intern_cache_configure, intern_cache_info, intern_cache_clear
 from .decimal_number import DecimalNumber as Dn  # alias
+from .decimal_array import DECIMAL_DTYPE, DecimalArray
+from .parse import parse_decimals
+from .pow10 import pow10, pow10_cache_info, pow10_cache_clear
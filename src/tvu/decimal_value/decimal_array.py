@@ -0,0 +1,369 @@
+from typing import Sequence
+import numpy as np
+from .decimal_number import DecimalNumber
+from .pow10 import pow10
+from .rounding import ROUNDING_MODES, quantize_array
+from .power.float_power import float_power_array
+from .power.npint_power import npint_power
+from .power.str_power import str_power_array
+
+_INT64_MAX = np.iinfo(np.int64).max
+_INT64_MIN = np.iinfo(np.int64).min
+_POW10 = np.array([10 ** k for k in range(19)], dtype=np.int64)
+
+# the structured dtype of one number, see DecimalArray.from_structured
+DECIMAL_DTYPE = np.dtype([('s', 'i1'), ('x', '<i8'), ('e', '<i8')])
+
+
+def _coefficients(x) -> np.ndarray:
+    """Stores integer coefficients as int64, falling back to object storage on overflow."""
+    if not isinstance(x, np.ndarray):
+        x = np.asarray(x) if len(x) else np.zeros(0, dtype=np.int64)
+    if x.dtype.kind == 'i':
+        return x.astype(np.int64, copy=False)
+    if x.dtype.kind == 'u':
+        if x.size == 0 or x.max() <= _INT64_MAX:
+            return x.astype(np.int64)
+        return np.array(x.tolist(), dtype=object)
+    if x.dtype == object and all(isinstance(v, int | np.integer) for v in x.flat):
+        try:
+            return x.astype(np.int64)
+        except OverflowError:
+            return np.array([int(v) for v in x.flat], dtype=object).reshape(x.shape)
+    raise TypeError(f"Unsupported coefficients of dtype {x.dtype}, expected integers")
+
+
+def _shrink(x: np.ndarray) -> np.ndarray:
+    """Moves object coefficients back to int64 storage when all of them fit."""
+    if x.dtype == object and (len(x) == 0 or (x.max() <= _INT64_MAX and x.min() > _INT64_MIN)):
+        return x.astype(np.int64)
+    return x
+
+
+def _scale(v: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """Calculates v * 10 ** k for non-negative k without silent int64 overflow."""
+    if v.dtype != object:
+        if not k.any():
+            return v
+        if k.max() <= 18:
+            p = _POW10[k]
+            if (np.abs(v) <= _INT64_MAX // p).all():
+                return v * p
+        v = v.astype(object)
+    return v * _pow10_objects(k)
+
+
+def _pow10_objects(k: np.ndarray) -> np.ndarray:
+    """Calculates 10 ** k as Python ints for a non-negative exponent array."""
+    return np.array([pow10(i) for i in k.ravel().tolist()], dtype=object).reshape(k.shape)
+
+
+def _add(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Calculates a + b, promoting to object storage on int64 overflow."""
+    if a.dtype != object and b.dtype != object:
+        with np.errstate(over='ignore'):
+            r = a + b
+        if not ((((a ^ r) & (b ^ r)) < 0) | (r == _INT64_MIN)).any():
+            return r
+    return a.astype(object) + b.astype(object)
+
+
+def _mul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Calculates a * b, promoting to object storage on int64 overflow."""
+    if a.dtype != object and b.dtype != object:
+        a, b = np.broadcast_arrays(a, b)
+        b_abs = np.abs(b)
+        if (np.abs(a) <= _INT64_MAX // np.maximum(b_abs, 1)).all():
+            return a * b
+    return a.astype(object) * b.astype(object)
+
+
+class DecimalArray:
+    """DecimalArray is a class that represents an array of numbers in decimal form.
+
+    Each element has the same meaning as a DecimalNumber, but the sign, the
+    coefficient and the exponent are stored as parallel NumPy arrays so that
+    arithmetic runs over whole columns at once.
+
+    Attributes
+    ----------
+    s : np.ndarray
+        The signs of the numbers (int8).
+    x : np.ndarray
+        The numbers in decimal form (int64).
+        Falls back to object dtype when a coefficient overflows int64.
+    e : np.ndarray
+        The exponents of the numbers (int64).
+
+    """
+    s: np.ndarray
+    x: np.ndarray
+    e: np.ndarray
+
+    # let NumPy defer to the reflected operators instead of converting to float
+    __array_ufunc__ = None
+
+    @property
+    def X(self) -> np.ndarray:
+        return self.s * self.x.astype(np.float64) * 10.0 ** self.e
+
+    def __init__(self, x, e=None) -> None:
+        if isinstance(x, DecimalArray) and e is None:
+            self.s = x.s.copy()
+            self.x = x.x.copy()
+            self.e = x.e.copy()
+        elif e is not None:
+            # signed coefficients with exponents, like DecimalNumber(x, e)
+            v = _coefficients(x if isinstance(x, np.ndarray) else list(x))
+            v, e = np.broadcast_arrays(v, np.asarray(e, dtype=np.int64))
+            self._set_signed(v.copy(), e.copy())
+        elif isinstance(x, str | bytes | dict) or not hasattr(x, '__iter__'):
+            raise TypeError(f"Unsupported type {type(x)}")
+        else:
+            if isinstance(x, np.ndarray):
+                if x.ndim != 1:
+                    raise TypeError(f"Unsupported number of dimensions: {x.ndim}")
+                if x.dtype.kind in 'iu':
+                    self.x, self.e = npint_power(x)
+                    self.s = (x > 0).astype(np.int8) - (x < 0).astype(np.int8)
+                    return
+                if x.dtype.kind in 'SU':
+                    self.s, self.x, self.e, invalid = str_power_array(x)
+                    if invalid.any():
+                        i = int(np.argmax(invalid))
+                        raise ValueError(f"Invalid decimal string {x[i]!r} at row {i}")
+                    return
+                if x.dtype.kind == 'f':
+                    self.x, self.e = float_power_array(x)
+                    self.s = (x > 0).astype(np.int8) - (x < 0).astype(np.int8)
+                    return
+            s, c, p = [], [], []
+            for v in x:
+                d = v if isinstance(v, DecimalNumber) else DecimalNumber(v)
+                s.append(d.s)
+                c.append(d.x)
+                p.append(d.e)
+            self.s = np.array(s, dtype=np.int8)
+            self.x = _coefficients(c)
+            self.e = np.array(p, dtype=np.int64)
+
+    @classmethod
+    def from_parts(cls, s: np.ndarray, x: np.ndarray, e: np.ndarray) -> 'DecimalArray':
+        """from_parts is a method that builds a DecimalArray from its columns without validation.
+
+        Parameters
+        ----------
+        s : np.ndarray
+            The signs of the numbers.
+        x : np.ndarray
+            The non-negative coefficients of the numbers.
+        e : np.ndarray
+            The exponents of the numbers.
+        """
+        self = cls.__new__(cls)
+        self.s = s
+        self.x = x
+        self.e = e
+        return self
+
+    @classmethod
+    def from_numbers(cls, numbers: Sequence[DecimalNumber]) -> 'DecimalArray':
+        """from_numbers is a method that builds a DecimalArray from the fields of DecimalNumbers without converting them.
+
+        Parameters
+        ----------
+        numbers : Sequence[DecimalNumber]
+            The numbers; the coefficients are stored as int64, or object if one does not fit.
+        """
+        s = np.array([n.s for n in numbers], dtype=np.int8)
+        e = np.array([n.e for n in numbers], dtype=np.int64)
+        return cls.from_parts(s, _coefficients([n.x for n in numbers]), e)
+
+    @classmethod
+    def from_structured(cls, a: np.ndarray) -> 'DecimalArray':
+        """from_structured is a method that views a 1-D array of DECIMAL_DTYPE as a DecimalArray without copying.
+
+        Parameters
+        ----------
+        a : np.ndarray
+            A 1-D array of DECIMAL_DTYPE; the columns are its fields.
+        """
+        if not isinstance(a, np.ndarray) or a.dtype != DECIMAL_DTYPE:
+            raise TypeError(f"Expected an array of dtype {DECIMAL_DTYPE}, got {getattr(a, 'dtype', type(a))}")
+        if a.ndim != 1:
+            raise TypeError(f"Unsupported number of dimensions: {a.ndim}")
+        return cls.from_parts(a['s'], a['x'], a['e'])
+
+    # public methods
+    def to_structured(self) -> np.ndarray:
+        """to_structured is a method that returns the numbers as a new 1-D array of DECIMAL_DTYPE.
+
+        Raises
+        ------
+        OverflowError
+            If a coefficient does not fit int64.
+        """
+        if self.x.dtype == object:
+            raise OverflowError('Some coefficients do not fit int64')
+        a = np.empty(len(self), dtype=DECIMAL_DTYPE)
+        a['s'] = self.s
+        a['x'] = self.x
+        a['e'] = self.e
+        return a
+
+    def round(self, ndigits=0, mode='half-up') -> 'DecimalArray':
+        """round is a method that rounds to ndigits decimal places, ties away from zero by default.
+
+        Parameters
+        ----------
+        ndigits : int | np.ndarray, default 0
+            The number of decimal places to keep, per element or for all elements.
+        mode : str, default 'half-up'
+            One of 'half-up', 'half-even', 'toward-zero', 'floor' and 'ceil'.
+        """
+        return self.__quantize(ndigits, mode)
+
+    def floor(self, ndigits=0) -> 'DecimalArray':
+        """floor is a method that rounds toward negative infinity to ndigits decimal places."""
+        return self.__quantize(ndigits, 'floor')
+
+    def ceil(self, ndigits=0) -> 'DecimalArray':
+        """ceil is a method that rounds toward positive infinity to ndigits decimal places."""
+        return self.__quantize(ndigits, 'ceil')
+
+    def to_integers(self, exponent) -> np.ndarray:
+        """to_integers is a method that returns the signed integers v with value == v * 10 ** exponent.
+
+        Parameters
+        ----------
+        exponent : int | np.ndarray
+            The exponent of the unit, per element or for all elements.
+
+        Raises
+        ------
+        ValueError
+            If a value has digits below 10 ** exponent, e.g. before rounding.
+        """
+        shift = self.e - exponent
+        if (shift < 0).any():
+            raise ValueError('Some values have digits below the requested exponent')
+        return _scale(self._signed(), np.broadcast_to(shift, self.e.shape))
+
+    def tolist(self) -> list[DecimalNumber]:
+        return [self[i] for i in range(len(self))]
+
+    # private methods
+    def _set_signed(self, v: np.ndarray, e: np.ndarray) -> None:
+        v = _shrink(v)
+        if v.dtype != object and (v == _INT64_MIN).any():
+            v = v.astype(object)  # np.abs would wrap around, like npint_power
+        self.s = ((v > 0).astype(np.int8) - (v < 0).astype(np.int8)).astype(np.int8)
+        self.x = np.abs(v)
+        self.e = e
+
+    def _signed(self) -> np.ndarray:
+        return self.s * self.x if self.x.dtype == object else self.s.astype(np.int64) * self.x
+
+    @classmethod
+    def _from_signed(cls, v: np.ndarray, e: np.ndarray) -> 'DecimalArray':
+        self = cls.__new__(cls)
+        self._set_signed(v, e)
+        return self
+
+    def __quantize(self, ndigits, mode: str) -> 'DecimalArray':
+        shift = np.maximum(-ndigits - self.e, 0)
+        if not shift.any():
+            if mode not in ROUNDING_MODES:
+                raise ValueError(f'Unsupported rounding mode {mode!r}, expected one of {ROUNDING_MODES}')
+            return DecimalArray(self)
+        return DecimalArray._from_signed(quantize_array(self._signed(), shift, mode), self.e + shift)
+
+    def __coerce(self, other) -> 'DecimalArray':
+        if isinstance(other, DecimalArray):
+            return other
+        elif isinstance(other, DecimalNumber):
+            return DecimalArray.from_parts(np.array([other.s], dtype=np.int8), _coefficients([other.x]), np.array([other.e], dtype=np.int64))
+        elif isinstance(other, np.ndarray | list | tuple):
+            return DecimalArray(other)
+        else:
+            return self.__coerce(DecimalNumber(other))
+
+    def __align(self, other) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        other = self.__coerce(other)
+        e = np.minimum(self.e, other.e)
+        return _scale(self._signed(), self.e - e), _scale(other._signed(), other.e - e), e
+
+    def __len__(self) -> int:
+        return len(self.s)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, key) -> 'DecimalNumber | DecimalArray':
+        if isinstance(key, int | np.integer):
+            return DecimalNumber.from_parts(int(self.s[key]), int(self.x[key]), int(self.e[key]))
+        return DecimalArray.from_parts(self.s[key], self.x[key], self.e[key])
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        return self.X if dtype is None else self.X.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f"DecimalArray([{', '.join(str(d) for d in self)}])"
+
+    def __str__(self) -> str:
+        return f"[{' '.join(str(d) for d in self)}]"
+
+    def __eq__(self, other) -> np.ndarray:
+        a, b, _ = self.__align(other)
+        return np.asarray(a == b, dtype=bool)
+
+    def __ne__(self, other) -> np.ndarray:
+        a, b, _ = self.__align(other)
+        return np.asarray(a != b, dtype=bool)
+
+    def __lt__(self, other) -> np.ndarray:
+        a, b, _ = self.__align(other)
+        return np.asarray(a < b, dtype=bool)
+
+    def __le__(self, other) -> np.ndarray:
+        a, b, _ = self.__align(other)
+        return np.asarray(a <= b, dtype=bool)
+
+    def __gt__(self, other) -> np.ndarray:
+        a, b, _ = self.__align(other)
+        return np.asarray(a > b, dtype=bool)
+
+    def __ge__(self, other) -> np.ndarray:
+        a, b, _ = self.__align(other)
+        return np.asarray(a >= b, dtype=bool)
+
+    def __abs__(self) -> 'DecimalArray':
+        return DecimalArray.from_parts(np.abs(self.s), self.x.copy(), self.e.copy())
+
+    def __neg__(self) -> 'DecimalArray':
+        return DecimalArray.from_parts(-self.s, self.x.copy(), self.e.copy())
+
+    def __pos__(self) -> 'DecimalArray':
+        return DecimalArray(self)
+
+    def __add__(self, other) -> 'DecimalArray':
+        a, b, e = self.__align(other)
+        return DecimalArray._from_signed(_add(a, b), e)
+
+    def __sub__(self, other) -> 'DecimalArray':
+        a, b, e = self.__align(other)
+        return DecimalArray._from_signed(_add(a, -b), e)
+
+    def __mul__(self, other) -> 'DecimalArray':
+        other = self.__coerce(other)
+        return DecimalArray._from_signed(_mul(self._signed(), other._signed()), self.e + other.e)
+
+    def __radd__(self, other) -> 'DecimalArray':
+        return self.__coerce(other).__add__(self)
+
+    def __rsub__(self, other) -> 'DecimalArray':
+        return self.__coerce(other).__sub__(self)
+
+    def __rmul__(self, other) -> 'DecimalArray':
+        return self.__coerce(other).__mul__(self)
@@ -1,6 +1,17 @@
+import math
 import numpy as np
+import operator
+import sys
 import warnings
-from .power import decimal_power
+from decimal import Decimal
+from fractions import Fraction
+from .power.float_power import float_power
+from .power.int_power import int_power
+from .power.str_power import str_power
+from .intern import InternCache
+from .pow10 import pow10
+from .rounding import ROUNDING_MODES, quantize
+from ..dispatch import TypeDispatcher
 
 
 class DecimalNumber:
@@ -8,10 +19,6 @@ class DecimalNumber:
 
     Attributes
     ----------
-    _x : int | float | np.integer
-        The number what is given as an argument.
-    _dd : int
-        The number of decimal digits which is given as an argument.
     s : int
         The sign of the number.
     x : int
@@ -19,43 +26,85 @@ class DecimalNumber:
     e : int
         The exponent of the number.
 
+    Notes
+    -----
+    Instances are immutable: the fields cannot be assigned, and methods
+    such as ie return a new number. They can therefore be shared between
+    threads, caches and other values; unary plus, abs of a non-negative
+    number and normalize of a canonical number return the number itself.
+
+    The same value has many representations, e.g. Dn(1.0) is 10e-1 and
+    Dn(1) is 1e0; normalize gives the canonical one. The hash does not
+    depend on the representation and equals the hash of an int, float,
+    Fraction or Decimal with the same exact value, so equal numbers can be
+    deduplicated in sets and used as dict keys. It is computed once and
+    cached. Comparisons with ints, Fractions and Decimals use their exact
+    value. Floats are compared at their shortest repr, the value they
+    have in arithmetic, so Dn(0.1) == 0.1 and Dn(0.1) - 0.1 == 0 agree;
+    such a float shares the hash only if it is exact, like 0.5, so do not
+    mix floats and DecimalNumbers as set or dict keys. Strs and other types
+    are not numbers and are never equal to a DecimalNumber.
+
     """
-    _x: int | float | np.integer | str
+    __slots__ = ('s', 'x', 'e', '_hash')
     s: int
     x: int
     e: int
 
     @property
     def X(self) -> int | float | np.integer:
-        return self.s * self.x * 10 ** self.e
+        if self.e >= 0:
+            return self.s * self.x * pow10(self.e)
+        return self.s * self.x / pow10(-self.e)
 
     def __init__(self, x, e=None, s=None) -> None:
-        if isinstance(x, DecimalNumber) and e is None and s is None:
-            self._x = x.x * 10 ** x.e
-            self.s = x.s
-            self.x = x.x
-            self.e = x.e
+        if e is None:
+            _sign, _x, _e = _INIT.lookup(type(x))(x)
         elif isinstance(e, int) and isinstance(x, int | np.integer):
-            self._x = x * 10 ** e
-            self.s = (1 if x > 0 else -1 if x < 0 else 0) * (1 if s is None else s)
-            self.x, self.e = int(abs(x)), e
-        elif isinstance(x, str):
-            self._x = x
-            dp = x.find('.')
-            __ = x.find('e')
-            self.x = int(x[:(__ if __ != -1 else None)].replace('-', '').replace('.', ''))
-            self.e = 0 if dp == -1 else (dp - (__ if __ != -1 else len(x)) + 1 + (0 if __ == -1 else int(x[__ + 1:])))
-            self.s = -1 if x.find('-') == 0 else 0 if self.x == 0 else 1
-        elif not isinstance(x, np.floating) and isinstance(x, int | float | np.integer):
-            self._x = x
-            self.s = 1 if x > 0 else -1 if x < 0 else 0
-            self.x, self.e = decimal_power(abs(x))
+            _sign = (1 if x > 0 else -1 if x < 0 else 0) * (1 if s is None else s)
+            _x, _e = int(abs(x)), e
         else:
-            raise TypeError(f"Unsupported type {type(x)}")
+            raise TypeError(f"Unsupported type {type(x)} with exponent {type(e)}")
+        _set_s(self, _sign)
+        _set_x(self, _x)
+        _set_e(self, _e)
+
+    @classmethod
+    def from_parts(cls, s: int, x: int, e: int) -> 'DecimalNumber':
+        """from_parts is a method that builds a DecimalNumber from its fields without validation.
+
+        Parameters
+        ----------
+        s : int
+            The sign of the number: 1, 0 or -1.
+        x : int
+            The non-negative number in decimal form.
+        e : int
+            The exponent of the number.
+        """
+        self = object.__new__(cls)
+        _set_s(self, s)
+        _set_x(self, x)
+        _set_e(self, e)
+        return self
+
+    @classmethod
+    def interned(cls, x) -> 'DecimalNumber':
+        """interned is a method that converts x like the constructor, sharing the result for equal small ints and recent values.
+
+        The cache is configured with intern_cache_configure and reported by
+        intern_cache_info.
+
+        Parameters
+        ----------
+        x : int | float | str | np.integer | DecimalNumber
+            The value to be converted. Only ints, floats and strs are shared.
+        """
+        return _INTERNED(x)
 
     # public methods
-    def ie(self, e: int) -> None:
-        """ie is a method that changes the exponent of the number.
+    def ie(self, e: int) -> 'DecimalNumber':
+        """ie is a method that returns the number with e added to the exponent and x scaled by 10 ** e.
 
         Parameters
         ----------
@@ -66,8 +115,25 @@ class DecimalNumber:
         if not e > 0:
             warnings.warn(f"e is not a positive integer: {e}")
             warnings.warn("This action can cause a loss of precision.")
-        self.e += e
-        self.x *= 10 ** e
+        return _new(self.s * self.x * pow10(e), self.e + e)
+
+    def normalize(self) -> 'DecimalNumber':
+        """normalize is a method that returns the canonical form of the number.
+
+        The canonical form has no trailing zeros in x, and zero is 0e0, so
+        equal numbers have equal fields.
+
+        Examples
+        --------
+        >>> Dn(1.0).normalize(), Dn(1200).normalize(), Dn(-0.0).normalize()
+        (DecimalNumber(1e0), DecimalNumber(12e2), DecimalNumber(0e0))
+        """
+        if self.x == 0:
+            return self if self.e == 0 else DecimalNumber.from_parts(0, 0, 0)
+        if self.x % 10:
+            return self
+        x, k = int_power(self.x)
+        return DecimalNumber.from_parts(self.s, x, self.e + k)
 
     # private methods
     def __repr__(self) -> str:
@@ -79,78 +145,72 @@ class DecimalNumber:
         return f"{s}{self.x}e{self.e}"
 
     def __eq__(self, other) -> bool:
-        other = DecimalNumber(other)
-        if self.e == other.e:
-            return self.s * self.x == other.s * other.x
-        elif self.e > other.e:
-            return self.s * self.x * 10 ** (self.e - other.e) == other.s * other.x
-        else:
-            return self.s * self.x == other.s * other.x * 10 ** (other.e - self.e)
+        if type(other) is DecimalNumber:
+            # equal exponents (e.g. canonical forms) compare field by field
+            if self.e == other.e:
+                return self.s == other.s and self.x == other.x
+            if self.s != other.s:
+                return False
+            a, b, _ = _align(self, other)
+            return a == b
+        return _compare(self, other, operator.eq)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            h = _hash(self.s, self.x, self.e)
+            _set_hash(self, h)  # an idempotent cache, so concurrent writes are harmless
+            return h
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"DecimalNumber is immutable, cannot set {name!r}")
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError(f"DecimalNumber is immutable, cannot delete {name!r}")
 
     def __ne__(self, other) -> bool:
-        return not self.__eq__(other)
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
 
     def __lt__(self, other) -> bool:
-        other = DecimalNumber(other)
-        if self.e == other.e:
-            return self.s * self.x < other.s * other.x
-        elif self.e > other.e:
-            return self.s * self.x * 10 ** (self.e - other.e) < other.s * other.x
-        else:
-            return self.s * self.x < other.s * other.x * 10 ** (other.e - self.e)
+        return _compare(self, other, operator.lt)
 
     def __le__(self, other) -> bool:
-        other = DecimalNumber(other)
-        return not self.__gt__(other)
+        return _compare(self, other, operator.le)
 
     def __gt__(self, other) -> bool:
-        other = DecimalNumber(other)
-        if self.e == other.e:
-            return self.s * self.x > other.s * other.x
-        elif self.e > other.e:
-            return self.s * self.x * 10 ** (self.e - other.e) > other.s * other.x
-        else:
-            return self.s * self.x > other.s * other.x * 10 ** (other.e - self.e)
+        return _compare(self, other, operator.gt)
 
     def __ge__(self, other) -> bool:
-        return not self.__lt__(other)
+        return _compare(self, other, operator.ge)
 
     def __abs__(self) -> 'DecimalNumber':
-        return DecimalNumber(self.x, self.e)
+        return self if self.s >= 0 else _new(self.x, self.e)
 
     def __add__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        if self.e == other.e:
-            return DecimalNumber(self.s * self.x + other.s * other.x, self.e)
-        elif self.e > other.e:
-            return DecimalNumber(self.s * self.x * 10 ** (self.e - other.e) + other.s * other.x, e=other.e)
-        else:
-            return DecimalNumber(self.s * self.x + other.s * other.x * 10 ** (other.e - self.e), self.e)
+        a, b, e = _align(self, _coerce(other))
+        return _new(a + b, e)
 
     def __sub__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        if self.e == other.e:
-            return DecimalNumber(self.s * self.x - other.s * other.x, self.e)
-        elif self.e > other.e:
-            return DecimalNumber(self.s * self.x * 10 ** (self.e - other.e) - other.s * other.x, e=other.e)
-        else:
-            return DecimalNumber(self.s * self.x - other.s * other.x * 10 ** (other.e - self.e), self.e)
+        a, b, e = _align(self, _coerce(other))
+        return _new(a - b, e)
 
     def __mul__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return DecimalNumber(self.s * self.x * other.s * other.x, self.e + other.e)
+        other = _coerce(other)
+        return _new(self.s * self.x * other.s * other.x, self.e + other.e)
 
     def __truediv__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return DecimalNumber(self.s * self.x / (other.s * other.x), self.e - other.e)
+        other = _coerce(other)
+        return _new(self.s * self.x / (other.s * other.x), self.e - other.e)
 
     def __floordiv__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return DecimalNumber(int(self.s * self.x // (other.s * other.x)), self.e - other.e)
+        other = _coerce(other)
+        return _new(int(self.s * self.x // (other.s * other.x)), self.e - other.e)
 
     def __mod__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return DecimalNumber(self.s * self.x % (other.s * other.x), self.e - other.e)
+        other = _coerce(other)
+        return _new(self.s * self.x % (other.s * other.x), self.e - other.e)
 
     def __pow__(self, other) -> 'DecimalNumber':
         """
@@ -159,109 +219,243 @@ class DecimalNumber:
         --------
         This method is not accurate.
         """
-        other = DecimalNumber(other)
+        other = _coerce(other)
         power = self.e * other.X
-        return DecimalNumber(((self.s * self.x) ** other.X) * 10 ** (power - int(power)), int(power))
+        return _new(((self.s * self.x) ** other.X) * 10 ** (power - int(power)), int(power))
 
     def __radd__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return other.__add__(self)
+        return _coerce(other).__add__(self)
 
     def __rsub__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return other.__sub__(self)
+        return _coerce(other).__sub__(self)
 
     def __rmul__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return other.__mul__(self)
+        return _coerce(other).__mul__(self)
 
     def __rtruediv__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return other.__truediv__(self)
+        return _coerce(other).__truediv__(self)
 
     def __rfloordiv__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return other.__floordiv__(self)
+        return _coerce(other).__floordiv__(self)
 
     def __rmod__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return other.__mod__(self)
+        return _coerce(other).__mod__(self)
 
     def __rpow__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return other.__pow__(self)
-
-    def __iadd__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return self.__add__(other)
-
-    def __isub__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return self.__sub__(other)
+        return _coerce(other).__pow__(self)
 
-    def __imul__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return self.__mul__(other)
-
-    def __itruediv__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return self.__truediv__(other)
-
-    def __ifloordiv__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return self.__floordiv__(other)
-
-    def __imod__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return self.__mod__(other)
-
-    def __ipow__(self, other) -> 'DecimalNumber':
-        other = DecimalNumber(other)
-        return self.__pow__(other)
+    # operators never modify self, so the in-place forms are the binary ones
+    __iadd__ = __add__
+    __isub__ = __sub__
+    __imul__ = __mul__
+    __itruediv__ = __truediv__
+    __ifloordiv__ = __floordiv__
+    __imod__ = __mod__
+    __ipow__ = __pow__
 
     def __neg__(self) -> 'DecimalNumber':
-        return DecimalNumber(self.x, self.e, self.s * -1)
+        return _new(-self.s * self.x, self.e)
 
     def __pos__(self) -> 'DecimalNumber':
-        return DecimalNumber(self.x, self.e, self.s)
+        return self
 
-    def round(self, ndigits=0) -> 'DecimalNumber':
-        min_digits = -ndigits - self.e
-        floordiv = DecimalNumber(self.x // (10 ** min_digits), self.e + min_digits)
-        mod = DecimalNumber(self.x % (10 ** min_digits), self.e + min_digits - 1)
-        return floordiv + DecimalNumber(1 if mod >= DecimalNumber(5) else 0, self.e + min_digits)
+    def round(self, ndigits=0, mode='half-up') -> 'DecimalNumber':
+        """round is a method that rounds to ndigits decimal places, ties away from zero by default.
+
+        Parameters
+        ----------
+        ndigits : int, default 0
+            The number of decimal places to keep, negative for tens, hundreds, etc.
+        mode : str, default 'half-up'
+            One of 'half-up', 'half-even', 'toward-zero', 'floor' and 'ceil'.
+        """
+        shift = -ndigits - self.e
+        if shift <= 0:
+            if mode not in ROUNDING_MODES:
+                raise ValueError(f'Unsupported rounding mode {mode!r}, expected one of {ROUNDING_MODES}')
+            return self
+        return _new(quantize(self.s * self.x, shift, mode), -ndigits)
 
     def floor(self, ndigits=0) -> 'DecimalNumber':
-        min_digits = -ndigits - self.e
-        floordiv = DecimalNumber(self.x // (10 ** min_digits), self.e + min_digits)
-        return floordiv
+        """floor is a method that rounds toward negative infinity to ndigits decimal places."""
+        return self.round(ndigits, 'floor')
 
     def ceil(self, ndigits=0) -> 'DecimalNumber':
-        min_digits = -ndigits - self.e
-        floordiv = DecimalNumber(self.x // (10 ** min_digits), self.e + min_digits)
-        mod = DecimalNumber(self.x % (10 ** min_digits), self.e + min_digits - 1)
-        return floordiv + DecimalNumber(1 if mod > DecimalNumber(0) else 0, self.e + min_digits)
+        """ceil is a method that rounds toward positive infinity to ndigits decimal places."""
+        return self.round(ndigits, 'ceil')
 
     def __int__(self) -> int:
         if self.s == 0:
             return 0
         elif self.e > 0:
-            return self.s * int(str(self.x * 10 ** self.e))
+            return self.s * self.x * pow10(self.e)
         elif self.e == 0:
             return self.s * self.x
         else:
-            return self.s * int(str(self.x)[:self.e])
+            return self.s * (self.x // pow10(-self.e))
 
     def __float__(self) -> float:
-        return float(self.s * self.x * 10 ** self.e)
+        return float(self.X)
 
     def __bool__(self) -> bool:
         return self.s > 0
 
     def __format__(self, format_spec) -> str:
         if format_spec == 'console':
-            return f'{self.s * self.x * 10 ** self.e}'
+            return self.__plain()
         elif format_spec == 'latex':
-            return f'{self.s * self.x * 10 ** self.e}'
+            return f'\\num{{{self.__plain()}}}'
         else:
             return self.__str__()
+
+    def __plain(self) -> str:
+        """Writes the number in plain decimal notation from its digits, keeping trailing zeros."""
+        s = '-' if self.s == -1 else ''
+        if self.e >= 0:
+            return f'{s}{self.x}{"0" * self.e if self.x else ""}'
+        digits = str(self.x).rjust(1 - self.e, '0')
+        return f'{s}{digits[:self.e]}.{digits[self.e:]}'
+
+
+_set_s = DecimalNumber.s.__set__
+_set_x = DecimalNumber.x.__set__
+_set_e = DecimalNumber.e.__set__
+_set_hash = DecimalNumber._hash.__set__
+
+_INIT = TypeDispatcher('DecimalNumber')
+_INIT.reject(np.floating)
+
+
+@_INIT.register(DecimalNumber)
+def _init_copy(x: DecimalNumber) -> tuple[int, int, int]:
+    return x.s, x.x, x.e
+
+
+@_INIT.register(str)
+def _init_str(x: str) -> tuple[int, int, int]:
+    return str_power(x)
+
+
+@_INIT.register(int)
+def _init_int(x: int) -> tuple[int, int, int]:
+    return (1 if x > 0 else -1 if x < 0 else 0), *int_power(abs(x))
+
+
+@_INIT.register(float)
+def _init_float(x: float) -> tuple[int, int, int]:
+    return (1 if x > 0 else -1 if x < 0 else 0), *float_power(abs(x))
+
+
+@_INIT.register(np.integer)
+def _init_npint(x: np.integer) -> tuple[int, int, int]:
+    v = int(x)  # np.abs wraps around at the int64 minimum
+    return (1 if v > 0 else -1 if v < 0 else 0), *int_power(abs(v))
+
+
+_MODULUS = sys.hash_info.modulus
+_INTERNED = InternCache(DecimalNumber)
+
+
+def intern_cache_configure(maxsize: int | None = None, small_ints: int | None = None, eviction: str | None = None) -> None:
+    """Changes the cache behind DecimalNumber.interned and operand conversions, and empties it.
+
+    Parameters
+    ----------
+    maxsize : int | None, default None
+        The bound of the recently converted ints, floats and strs; 0 disables them.
+    small_ints : int | None, default None
+        Ints in [-small_ints, small_ints] are converted once and never evicted.
+    eviction : str | None, default None
+        'lru', 'fifo' or 'clear', see InternCache.
+    """
+    _INTERNED.configure(maxsize, small_ints, eviction)
+
+
+def intern_cache_info() -> dict[str, int]:
+    """Reports how conversions through the intern cache were served.
+
+    Returns
+    -------
+    dict[str, int]
+        small_hits, hits, misses, evictions, the number of recent entries and its bound.
+
+    """
+    return _INTERNED.info()
+
+
+def intern_cache_clear() -> None:
+    """Resets the counters and empties the intern cache."""
+    _INTERNED.clear()
+
+
+def _coerce(x) -> DecimalNumber:
+    """Converts an operand to DecimalNumber.
+
+    DecimalNumber operands are returned as they are, and the conversions of
+    plain ints, floats and strs are interned. The returned object is only
+    read by the operators, never handed back to the caller.
+    """
+    t = type(x)
+    if t is DecimalNumber:
+        return x
+    if t is int or t is float or t is str:
+        return _INTERNED(x)
+    if isinstance(x, DecimalNumber):
+        return x
+    return DecimalNumber(x)
+
+
+def _compare(a: DecimalNumber, b, op):
+    """Compares a with the value of a number, or returns NotImplemented if b is not a number."""
+    if isinstance(b, DecimalNumber):
+        pass
+    elif isinstance(b, int | np.integer):
+        b = _coerce(b)
+    elif isinstance(b, float | np.floating):
+        if not math.isfinite(b):
+            return op(0.0, b)  # every finite number compares like 0 with inf and nan
+        b = _coerce(float(b))  # the shortest repr, as in arithmetic and DecimalArray
+    elif isinstance(b, Decimal):
+        if not b.is_finite():
+            return op(0.0, float(b))
+        sign, digits, exponent = b.as_tuple()
+        v = int(''.join(map(str, digits)))
+        b = _new(-v if sign else v, exponent)
+    elif isinstance(b, Fraction):
+        v = Fraction(a.s * a.x) * Fraction(10) ** a.e
+        return op(v, b)
+    else:
+        return NotImplemented
+    x, y, _ = _align(a, b)
+    return op(x, y)
+
+
+def _hash(s: int, x: int, e: int) -> int:
+    """Hashes s * x * 10 ** e like the numeric types of Python do, modulo a Mersenne prime."""
+    h = int(x) % _MODULUS * pow(10, e, _MODULUS) % _MODULUS  # 10 ** e is the modular inverse for e < 0
+    if s < 0:
+        h = -h
+    return -2 if h == -1 else h
+
+
+def _align(a: DecimalNumber, b: DecimalNumber) -> tuple[int, int, int]:
+    """Returns the signed coefficients of a and b at their common (smaller) exponent."""
+    if a.e == b.e:
+        return a.s * a.x, b.s * b.x, a.e
+    elif a.e > b.e:
+        return a.s * a.x * pow10(a.e - b.e), b.s * b.x, b.e
+    else:
+        return a.s * a.x, b.s * b.x * pow10(b.e - a.e), a.e
+
+
+def _new(v: int | float, e: int) -> DecimalNumber:
+    """Builds the DecimalNumber v * 10 ** e from a signed coefficient without the constructor checks."""
+    if type(v) is not int:
+        # float results (e.g. truediv) are decomposed first, then shifted by e
+        d = DecimalNumber(v)
+        return DecimalNumber.from_parts(d.s, d.x, d.e + e)
+    self = object.__new__(DecimalNumber)
+    _set_s(self, 1 if v > 0 else -1 if v < 0 else 0)
+    _set_x(self, v if v >= 0 else -v)
+    _set_e(self, e)
+    return self
@@ -0,0 +1,144 @@
+import threading
+from typing import Callable
+
+MAXSIZE = 1024
+SMALL_INTS = 256
+EVICTIONS = ('lru', 'fifo', 'clear')
+
+
+class InternCache:
+    """InternCache is a class that shares the results of a conversion for small ints and recently converted values.
+
+    Ints in [-small_ints, small_ints] are kept in a table that is never
+    evicted. Other ints, floats and strs are kept in a dict of at most
+    maxsize entries, keyed by type and value so that 1 and 1.0 are
+    distinct. Values of any other type are converted without caching.
+    The cached objects are shared by all callers and must not be modified.
+    The recent entries are guarded by a lock, so a cache can be shared
+    between threads; the conversion itself runs outside of it.
+
+    Attributes
+    ----------
+    convert : Callable
+        The conversion, e.g. the DecimalNumber constructor.
+    maxsize : int
+        The bound of the recent entries; 0 disables them.
+    small_ints : int
+        The bound of the small int table; 0 leaves only 0 in it.
+    eviction : str
+        What happens when the recent entries are full: 'lru' drops the least
+        recently used entry, 'fifo' the oldest one and 'clear' all of them.
+
+    Examples
+    --------
+    >>> cache = InternCache(Dn)
+    >>> cache(1) is cache(1), cache(0.5) is cache(0.5)
+    (True, True)
+    >>> cache.info()['small_hits'], cache.info()['hits']
+    (1, 1)
+
+    """
+    __slots__ = ('convert', 'maxsize', 'small_ints', 'eviction', '_lru', '_small', '_recent', '_lock',
+                 '_small_hits', '_hits', '_misses', '_evictions')
+    convert: Callable
+    maxsize: int
+    small_ints: int
+    eviction: str
+
+    def __init__(self, convert: Callable, maxsize: int = MAXSIZE, small_ints: int = SMALL_INTS, eviction: str = 'lru') -> None:
+        self.convert = convert
+        self.maxsize = self.small_ints = 0
+        self.eviction = 'lru'
+        self._recent = {}
+        self._lock = threading.Lock()
+        self.configure(maxsize, small_ints, eviction)
+
+    # public methods
+    def configure(self, maxsize: int | None = None, small_ints: int | None = None, eviction: str | None = None) -> None:
+        """configure is a method that changes the bounds or the eviction policy and empties the cache.
+
+        Parameters
+        ----------
+        maxsize : int | None, default None
+            The new bound of the recent entries, if given.
+        small_ints : int | None, default None
+            The new bound of the small int table, if given.
+        eviction : str | None, default None
+            The new eviction policy, one of EVICTIONS, if given.
+        """
+        if eviction is not None and eviction not in EVICTIONS:
+            raise ValueError(f'Unsupported eviction {eviction!r}, expected one of {EVICTIONS}')
+        if (maxsize is not None and maxsize < 0) or (small_ints is not None and small_ints < 0):
+            raise ValueError('maxsize and small_ints must not be negative')
+        self.maxsize = self.maxsize if maxsize is None else maxsize
+        self.small_ints = self.small_ints if small_ints is None else small_ints
+        self.eviction = self.eviction if eviction is None else eviction
+        self._lru = self.eviction == 'lru'
+        self.clear()
+
+    def info(self) -> dict[str, int]:
+        """info is a method that reports how the conversions were served.
+
+        Returns
+        -------
+        dict[str, int]
+            small_hits, hits, misses, evictions, the number of recent
+            entries and its bound.
+        """
+        return {
+            'small_hits': self._small_hits,
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'size': len(self._recent),
+            'maxsize': self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """clear is a method that empties the cache and resets the counters."""
+        # indexed by the int itself, so negative ints wrap around to the end
+        self._small = [None] * (2 * self.small_ints + 1)
+        with self._lock:
+            self._recent.clear()
+            self._small_hits = self._hits = self._misses = self._evictions = 0
+
+    # private methods
+    def __call__(self, x):
+        t = type(x)
+        if t is int and -self.small_ints <= x <= self.small_ints:
+            d = self._small[x]
+            if d is None:
+                self._misses += 1
+                d = self._small[x] = self.convert(x)
+            else:
+                self._small_hits += 1
+            return d
+        if t is not int and t is not float and t is not str:
+            return self.convert(x)
+        key = (t, x)
+        recent = self._recent
+        with self._lock:
+            d = recent.get(key)
+            if d is not None:
+                self._hits += 1
+                if self._lru:
+                    recent[key] = recent.pop(key)  # move to the end
+                return d
+            self._misses += 1
+        d = self.convert(x)
+        if self.maxsize:
+            with self._lock:
+                if key in recent:
+                    return recent[key]  # converted by another thread meanwhile
+                if len(recent) >= self.maxsize:
+                    if self.eviction == 'clear':
+                        self._evictions += len(recent)
+                        recent.clear()
+                    else:
+                        del recent[next(iter(recent))]
+                        self._evictions += 1
+                recent[key] = d
+        return d
+
+    def __repr__(self) -> str:
+        return f'InternCache(maxsize={self.maxsize}, small_ints={self.small_ints}, eviction={self.eviction!r})'
@@ -0,0 +1,64 @@
+from typing import Iterable
+import numpy as np
+from .decimal_array import DecimalArray, _coefficients
+from .decimal_number import DecimalNumber
+from .power.str_power import str_power
+
+_INT64 = np.iinfo(np.int64)
+
+
+def parse_decimals(values: Iterable[str | bytes] | np.ndarray, as_list: bool = False) -> DecimalArray | list[DecimalNumber]:
+    """Parses a column of decimal strings.
+
+    NumPy string arrays are scanned as bytes in a few vectorized passes;
+    other iterables are matched row by row with one compiled regex. Every
+    row must be a complete decimal number such as '-12.5', '.5', '15e-3'
+    or '1.5E+3'; surrounding whitespace is not accepted.
+
+    Parameters
+    ----------
+    values : Iterable[str | bytes] | np.ndarray
+        The strings to be parsed.
+    as_list : bool, default False
+        Return a list of DecimalNumber instead of a DecimalArray.
+
+    Returns
+    -------
+    DecimalArray | list[DecimalNumber]
+        The parsed numbers.
+
+    Raises
+    ------
+    ValueError
+        If a row is not a decimal number. The message contains the row index.
+    TypeError
+        If a row is neither str nor bytes.
+
+    Examples
+    --------
+    >>> parse_decimals(['1.5', '-2e3'])
+    DecimalArray([15e-1, -2e3])
+
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'SU':
+        result = DecimalArray(values.ravel())
+    else:
+        result = DecimalArray.from_parts(*_parse_rows(values))
+    return result.tolist() if as_list else result
+
+
+def _parse_rows(values: Iterable[str | bytes]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    signs, coefficients, exponents = [], [], []
+    for i, v in enumerate(values):
+        if not isinstance(v, str | bytes):
+            raise TypeError(f"Unsupported type {type(v)} at row {i}")
+        try:
+            s, x, e = str_power(v)
+        except ValueError:
+            raise ValueError(f"Invalid decimal string {v!r} at row {i}") from None
+        if not _INT64.min <= e <= _INT64.max:
+            raise ValueError(f"Exponent out of range in {v!r} at row {i}")
+        signs.append(s)
+        coefficients.append(x)
+        exponents.append(e)
+    return np.array(signs, dtype=np.int8), _coefficients(coefficients), np.array(exponents, dtype=np.int64)
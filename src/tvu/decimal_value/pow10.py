@@ -0,0 +1,64 @@
+from functools import lru_cache
+
+TABLE_SIZE = 64
+LRU_SIZE = 1024
+
+_TABLE = tuple(10 ** k for k in range(TABLE_SIZE))
+
+
+def pow10(k: int) -> int | float:
+    """Calculates 10 ** k.
+
+    Exponents in [0, TABLE_SIZE) are read from a precomputed table, larger
+    ones go through a bounded LRU cache. Negative exponents are not cached
+    and give a float, like the builtin power operator.
+
+    Parameters
+    ----------
+    k : int
+        The exponent.
+
+    Returns
+    -------
+    int | float
+        The power of ten.
+
+    Examples
+    --------
+    >>> pow10(3)
+    1000
+
+    """
+    if k < TABLE_SIZE:
+        return _TABLE[k] if k >= 0 else 10 ** k
+    return _pow10_lru(k)
+
+
+@lru_cache(maxsize=LRU_SIZE)
+def _pow10_lru(k: int) -> int:
+    return 10 ** k
+
+
+def pow10_cache_info() -> dict[str, int]:
+    """Reports how the LRU cache served the exponents beyond the table.
+
+    Table lookups are not counted, so that they stay a plain tuple index.
+
+    Returns
+    -------
+    dict[str, int]
+        lru_hits, misses, the current LRU size and its bound.
+
+    """
+    info = _pow10_lru.cache_info()
+    return {
+        'lru_hits': info.hits,
+        'misses': info.misses,
+        'lru_size': info.currsize,
+        'lru_maxsize': info.maxsize,
+    }
+
+
+def pow10_cache_clear() -> None:
+    """Resets the counters and empties the LRU cache."""
+    _pow10_lru.cache_clear()
@@ -1,27 +1,142 @@
+import math
+import numpy as np
+
+_WIDTH = 24  # longest repr of a positive float64 is 23 bytes ('2.2250738585072014e-308')
+_DIGIT0 = ord('0')
+_FLOAT_POW10 = [10.0 ** q for q in range(23)]
+
+
 def float_power(x: float) -> tuple[int, int]:
     """Calculates the power of a float.
 
+    The float is decomposed exactly as its shortest repr, so the result is
+    free of binary rounding errors and supports exponent notation.
+
     Parameters
     ----------
     x : float
-        The float to be calculated.
+        The float to be calculated. Must be finite.
 
     Returns
     -------
     tuple[int, int]
         The power of the float.
 
+    Raises
+    ------
+    ValueError
+        If x is inf or nan.
+
     Examples
     --------
     >>> float_power(1.2)
     (12, -1)
+    >>> float_power(1e-07)
+    (1, -7)
 
     """
     if x == 0:
         return 0, 0
-    else:
-        e = len(str(x).split(".")[1])
-        return int(x * 10 ** e), -e
+    if not math.isfinite(x):
+        raise ValueError("Cannot decompose inf or nan")
+    mantissa, _, exponent = repr(x).partition('e')
+    integer, _, fraction = mantissa.partition('.')
+    return int(integer + fraction), (int(exponent) if exponent else 0) - len(fraction)
+
+
+def float_power_array(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Calculates the powers of the absolute values of a float array.
+
+    The results are identical to float_power applied to each element, but
+    no Python code runs per element. Values with at most 15 significant
+    digits are decomposed arithmetically; the others are formatted to their
+    shortest repr by NumPy and parsed column by column.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The floats to be calculated. Must be finite.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The coefficients (int64) and the exponents (int64).
+
+    """
+    x = np.abs(np.asarray(x, dtype=np.float64))
+    if not np.isfinite(x).all():
+        raise ValueError("Cannot decompose inf or nan")
+    shape = x.shape
+    x = x.ravel()
+    coefficient = np.zeros(len(x), dtype=np.int64)
+    e = np.zeros(len(x), dtype=np.int64)
+    rest = np.flatnonzero(x)
+    rest = _decompose_short(x, rest, coefficient, e)
+    if len(rest):
+        coefficient[rest], e[rest] = _decompose_repr(x[rest])
+    return coefficient.reshape(shape), e.reshape(shape)
+
+
+def _decompose_short(x: np.ndarray, idx: np.ndarray, coefficient: np.ndarray, e: np.ndarray) -> np.ndarray:
+    """Decomposes the values whose shortest repr is positional with at most 15 digits.
+
+    For q = 1, 2, ... the candidate rint(v * 10 ** q) is accepted when it
+    divides back to v exactly, which is the shortest repr since both 10 ** q
+    and the candidate are exact doubles. Values where float rounding could
+    pick the wrong candidate (near a half, or an exact power of two with its
+    asymmetric rounding interval) are left to the repr parser.
+
+    Returns
+    -------
+    np.ndarray
+        The indices which still have to be decomposed.
+    """
+    v = x[idx]
+    easy = (v >= 1e-4) & (v < 1e15) & (np.frexp(v)[0] != 0.5)
+    rest = [idx[~easy]]
+    idx, v = idx[easy], v[easy]
+    for q in range(1, 20):
+        if not len(idx):
+            break
+        p = _FLOAT_POW10[q]
+        y = v * p
+        c = np.rint(y)
+        ambiguous = np.abs(y - np.floor(y) - 0.5) <= y * 2.0 ** -50
+        done = ~ambiguous & (c < 1e15) & (c / p == v)
+        coefficient[idx[done]] = c[done]
+        e[idx[done]] = -q
+        give_up = ambiguous | (c >= 1e15)
+        rest.append(idx[give_up & ~done])
+        keep = ~(done | give_up)
+        idx, v = idx[keep], v[keep]
+    rest.append(idx)
+    return np.sort(np.concatenate(rest))
+
+
+def _decompose_repr(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Parses the shortest reprs of positive floats, one character column at a time."""
+    n = len(x)
+    # transposed so that every column is contiguous
+    b = np.ascontiguousarray(x.astype(f'S{_WIDTH}').view(np.uint8).reshape(n, _WIDTH).T)
+    coefficient = np.zeros(n, dtype=np.int64)
+    exponent = np.zeros(n, dtype=np.int64)
+    fraction = np.zeros(n, dtype=np.int64)
+    in_fraction = np.zeros(n, dtype=bool)
+    in_exponent = np.zeros(n, dtype=bool)
+    negative = np.zeros(n, dtype=bool)
+    for row in b:
+        if not row.any():
+            break
+        d = row.astype(np.int64) - _DIGIT0
+        digit = (d >= 0) & (d <= 9)
+        m = digit & ~in_exponent
+        coefficient = np.where(m, coefficient * 10 + d, coefficient)
+        fraction += m & in_fraction
+        exponent = np.where(digit & in_exponent, exponent * 10 + d, exponent)
+        in_fraction |= row == ord('.')
+        in_exponent |= row == ord('e')
+        negative |= row == ord('-')
+    return coefficient, np.where(negative, -exponent, exponent) - fraction
 
 
 if __name__ == "__main__":
@@ -1,3 +1,6 @@
+from ..pow10 import pow10
+
+
 def int_power(x: int) -> tuple[int, int]:
     """Calculates the power of an integer.
 
@@ -14,8 +17,44 @@ def int_power(x: int) -> tuple[int, int]:
     """
     if x == 0:
         return (0, 0)
+    if x % 10:
+        return (x, 0)
+    if x.bit_length() <= 64:
+        e = 0
+        while x % 10 == 0:
+            x //= 10
+            e += 1
+        return (x, e)
+    return strip_zeros(x)
+
+
+def strip_zeros(x: int) -> tuple[int, int]:
+    """Removes the trailing zeros of a large integer in O(log n) divisions.
+
+    Divides by 10 ** (2 ** k) for the largest k that divides x, then by
+    the smaller squares in decreasing order, like a binary search over the
+    number of trailing zeros.
+
+    Parameters
+    ----------
+    x : int
+        The non-zero integer to be calculated.
+
+    Returns
+    -------
+    tuple[int, int]
+        The integer without trailing zeros and the number of removed zeros.
+
+    """
+    steps = []
+    k = 1
+    while x % pow10(k) == 0:
+        steps.append(k)
+        k *= 2
     e = 0
-    while x % 10 == 0:
-        x //= 10
-        e += 1
+    for k in reversed(steps):
+        q, r = divmod(x, pow10(k))
+        if r == 0:
+            x = q
+            e += k
     return (x, e)
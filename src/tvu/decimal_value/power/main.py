@@ -1,8 +1,11 @@
 import numpy as np
+from ...dispatch import TypeDispatcher
 from .float_power import float_power
 from .int_power import int_power
 from .npint_power import npint_power
 
+_POWER = TypeDispatcher('decimal_power')
+
 
 def decimal_power(x: int | float | np.integer) -> tuple[int, int]:
     """Calculates the power of the number.
@@ -18,11 +21,19 @@ def decimal_power(x: int | float | np.integer) -> tuple[int, int]:
         The power of the number.
 
     """
-    if isinstance(x, int):
-        return int_power(abs(x))
-    elif isinstance(x, float):
-        return float_power(abs(x))
-    elif isinstance(x, np.integer):
-        return npint_power(np.abs(x))
-    else:
-        raise TypeError(f"Unsupported type {type(x)}")
+    return _POWER(x)
+
+
+@_POWER.register(int)
+def _int_power(x: int) -> tuple[int, int]:
+    return int_power(abs(x))
+
+
+@_POWER.register(float)
+def _float_power(x: float) -> tuple[int, int]:
+    return float_power(abs(x))
+
+
+@_POWER.register(np.integer)
+def _npint_power(x: np.integer) -> tuple[int, int]:
+    return npint_power(np.abs(x))
@@ -1,24 +1,61 @@
 import numpy as np
+from .int_power import int_power
 
+_INT64_MAX = np.iinfo(np.int64).max
+# 10 ** k for the binary decomposition of up to 31 trailing zeros of an uint64
+_STEPS = [(k, np.uint64(10 ** k)) for k in (16, 8, 4, 2, 1)]
 
-def npint_power(x: np.integer) -> tuple[int, int]:
+
+def npint_power(x: np.integer | np.ndarray) -> tuple[int, int] | tuple[np.ndarray, np.ndarray]:
     """Calculates the power of an integer.
 
     Parameters
     ----------
-    x : np.integer
-        The integer to be calculated.
+    x : np.integer | np.ndarray
+        The integer to be calculated, or an array of integers.
 
     Returns
     -------
-    tuple[np.integer, int]
-        The power of the integer.
+    tuple[int, int] | tuple[np.ndarray, np.ndarray]
+        The power of the integer. For an array, the coefficients of the
+        absolute values (int64, or object if one does not fit) and the
+        exponents (int64).
 
     """
+    if isinstance(x, np.ndarray):
+        return npint_power_array(x)
     if x == 0:
         return (0, 0)
-    e = 0
-    while x % 10 == 0:
-        x //= 10
-        e += 1
-    return (int(x), e)
+    return int_power(int(x))
+
+
+def npint_power_array(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Calculates the powers of an array of integers in one vectorized pass.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The integers to be calculated (any signed or unsigned integer dtype).
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The coefficients of the absolute values and the exponents.
+
+    """
+    if x.dtype.kind not in 'iu':
+        raise TypeError(f"Unsupported dtype {x.dtype}")
+    m = x.astype(np.uint64)
+    if x.dtype.kind == 'i':
+        neg = x < 0
+        m[neg] = ~m[neg] + np.uint64(1)  # two's complement, also exact for the minimum
+    e = np.zeros(x.shape, dtype=np.int64)
+    nonzero = m != 0
+    for k, p in _STEPS:
+        d = nonzero & (m % p == 0)
+        if d.any():
+            m[d] //= p
+            e[d] += k
+    if m.size == 0 or m.max() <= _INT64_MAX:
+        return m.astype(np.int64), e
+    return np.array(m.tolist(), dtype=object), e
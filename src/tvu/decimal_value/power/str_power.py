@@ -0,0 +1,132 @@
+import re
+import numpy as np
+
+PATTERN = re.compile(r'([+-]?)([0-9]*)(?:\.([0-9]*))?(?:[eE]([+-]?[0-9]+))?')
+BYTES_PATTERN = re.compile(PATTERN.pattern.encode())
+
+_MAX_DIGITS = 18  # digits that always fit in an int64 coefficient or exponent
+_INT64 = np.iinfo(np.int64)
+
+
+def str_power(x: str | bytes) -> tuple[int, int, int]:
+    """Calculates the sign and the power of a decimal string.
+
+    The coefficient keeps the digits as written, so '1.50' gives (1, 150, -2).
+
+    Parameters
+    ----------
+    x : str | bytes
+        The string to be calculated, e.g. '-12.5', '.5', '15e-3' or '1.5E+3'.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        The sign, the coefficient and the exponent of the string.
+
+    Raises
+    ------
+    ValueError
+        If the string is not a decimal number.
+
+    Examples
+    --------
+    >>> str_power('-1.5e-3')
+    (-1, 15, -4)
+
+    """
+    m = (BYTES_PATTERN if isinstance(x, bytes) else PATTERN).fullmatch(x)
+    if m is None or not (m[2] or m[3]):
+        raise ValueError(f"Invalid decimal string: {x!r}")
+    sign, integer, fraction, exponent = m.groups()
+    fraction = fraction or x[:0]
+    c = int(integer + fraction)
+    s = 0 if c == 0 else -1 if sign in ('-', b'-') else 1
+    return s, c, (int(exponent) if exponent else 0) - len(fraction)
+
+
+def str_power_array(x: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Calculates the signs and the powers of an array of decimal strings.
+
+    The strings are scanned as bytes one character column at a time, so no
+    Python code runs per element except for rows with more than 18
+    significant digits in the coefficient or the exponent.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        The strings to be calculated (dtype 'S' or 'U'). Rows with non-ASCII
+        characters are invalid.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        The signs (int8), the coefficients (int64, or object if one does not
+        fit), the exponents (int64), and a boolean mask of the invalid rows.
+
+    Raises
+    ------
+    ValueError
+        If an exponent does not fit int64. The message contains the row index.
+
+    """
+    x = rows = np.asarray(x).ravel()
+    non_ascii = np.zeros(len(x), dtype=bool)
+    if x.dtype.kind == 'U':
+        if x.dtype.itemsize:
+            non_ascii = (np.ascontiguousarray(x).view(np.uint32).reshape(len(x), -1) > 127).any(axis=1)
+        x = (np.where(non_ascii, '', x) if non_ascii.any() else x).astype('S')
+    n, width = len(x), x.dtype.itemsize
+    b = np.ascontiguousarray(x.view(np.uint8).reshape(n, width).T) if width else np.zeros((0, n), dtype=np.uint8)
+    coefficient = np.zeros(n, dtype=np.int64)
+    exponent = np.zeros(n, dtype=np.int64)
+    digits = np.zeros(n, dtype=np.int64)
+    significant = np.zeros(n, dtype=np.int64)
+    exponent_digits = np.zeros(n, dtype=np.int64)
+    fraction = np.zeros(n, dtype=np.int64)
+    negative = np.zeros(n, dtype=bool)
+    exponent_negative = np.zeros(n, dtype=bool)
+    in_fraction = np.zeros(n, dtype=bool)
+    in_exponent = np.zeros(n, dtype=bool)
+    after_e = np.zeros(n, dtype=bool)
+    ended = np.zeros(n, dtype=bool)
+    invalid = np.zeros(n, dtype=bool)
+    for j, row in enumerate(b):
+        d = row.astype(np.int64) - ord('0')
+        digit = (d >= 0) & (d <= 9)
+        end = row == 0
+        sign = (row == ord('-')) | (row == ord('+'))
+        dot = row == ord('.')
+        e = (row == ord('e')) | (row == ord('E'))
+        invalid |= ended & ~end
+        invalid |= ~(digit | end | sign | dot | e)
+        if j:
+            invalid |= sign & ~after_e
+        invalid |= dot & (in_fraction | in_exponent)
+        invalid |= e & (in_exponent | (digits == 0))
+        m = digit & ~in_exponent
+        digits += m
+        significant += m & ((coefficient > 0) | (d > 0))
+        coefficient = np.where(m & (significant <= _MAX_DIGITS), coefficient * 10 + d, coefficient)
+        fraction += m & in_fraction
+        m = digit & in_exponent
+        exponent = np.where(m & (exponent_digits < _MAX_DIGITS), exponent * 10 + d, exponent)
+        exponent_digits += m
+        if j == 0:
+            negative = row == ord('-')
+        exponent_negative |= after_e & (row == ord('-'))
+        in_fraction |= dot
+        in_exponent |= e
+        after_e = e
+        ended |= end
+    invalid |= (digits == 0) | (in_exponent & (exponent_digits == 0)) | non_ascii
+    s = np.where(coefficient == 0, 0, np.where(negative, -1, 1)).astype(np.int8)
+    e = np.where(exponent_negative, -exponent, exponent) - fraction
+    long = np.flatnonzero(((significant > _MAX_DIGITS) | (exponent_digits > _MAX_DIGITS)) & ~invalid)
+    if len(long):
+        coefficient = coefficient.astype(object)
+        for i in long.tolist():
+            s[i], coefficient[i], v = str_power(x[i])
+            if not _INT64.min <= v <= _INT64.max:
+                raise ValueError(f"Exponent out of range in {rows[i]!r} at row {i}")
+            e[i] = v
+    return s, coefficient, e, invalid
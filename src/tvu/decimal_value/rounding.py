@@ -0,0 +1,84 @@
+import numpy as np
+from .pow10 import pow10
+
+ROUNDING_MODES = ('half-up', 'half-even', 'toward-zero', 'floor', 'ceil')
+
+_POW10 = np.array([10 ** k for k in range(19)], dtype=np.int64)
+
+
+def quantize(v: int, shift: int, mode: str = 'half-up') -> int:
+    """Rounds a signed integer to a multiple of 10 ** shift with integer arithmetic only.
+
+    Parameters
+    ----------
+    v : int
+        The signed coefficient.
+    shift : int
+        The number of trailing digits to drop. Nothing is dropped if it is not positive.
+    mode : str, default 'half-up'
+        'half-up' rounds ties away from zero, 'half-even' rounds ties to the
+        even neighbour, 'toward-zero' truncates, 'floor' and 'ceil' round
+        toward negative and positive infinity.
+
+    Returns
+    -------
+    int
+        The rounded coefficient, in units of 10 ** shift (v itself if shift <= 0).
+
+    Examples
+    --------
+    >>> quantize(-25, 1, 'half-up'), quantize(-25, 1, 'half-even'), quantize(-25, 1, 'toward-zero')
+    (-3, -2, -2)
+
+    """
+    if mode not in _INCREMENT:
+        raise ValueError(f'Unsupported rounding mode {mode!r}, expected one of {ROUNDING_MODES}')
+    if shift <= 0:
+        return v
+    p = pow10(shift)
+    q, r = divmod(v, p)  # floor division, 0 <= r < p
+    return q + 1 if r and _INCREMENT[mode](v, q, r, p) else q
+
+
+def quantize_array(v: np.ndarray, shift: np.ndarray, mode: str = 'half-up') -> np.ndarray:
+    """Rounds signed integers to multiples of 10 ** shift, element by element.
+
+    The vectorized counterpart of quantize: int64 coefficients with shifts
+    up to 18 stay in int64, anything larger is computed on Python ints.
+
+    Parameters
+    ----------
+    v : np.ndarray
+        The signed coefficients (int64 or object).
+    shift : np.ndarray
+        The non-negative numbers of trailing digits to drop.
+    mode : str, default 'half-up'
+        One of ROUNDING_MODES, see quantize.
+
+    Returns
+    -------
+    np.ndarray
+        The rounded coefficients, in units of 10 ** shift.
+
+    """
+    if mode not in _INCREMENT:
+        raise ValueError(f'Unsupported rounding mode {mode!r}, expected one of {ROUNDING_MODES}')
+    shift = np.broadcast_to(shift, v.shape)
+    if v.dtype == object or (shift.size and shift.max() > 18):
+        v = v.astype(object)
+        p = np.array([pow10(k) for k in shift.tolist()], dtype=object)
+    else:
+        p = _POW10[shift]
+    q, r = v // p, v % p  # floor division, 0 <= r < p; np.divmod has no object loop
+    increment = (r != 0) & _INCREMENT[mode](v, q, r, p)
+    return q + increment.astype(q.dtype)
+
+
+# whether to add one to the floor quotient q, given a non-zero remainder r
+_INCREMENT = {
+    'half-up': lambda v, q, r, p: (2 * r > p) | ((2 * r == p) & (v > 0)),
+    'half-even': lambda v, q, r, p: (2 * r > p) | ((2 * r == p) & (q % 2 == 1)),
+    'toward-zero': lambda v, q, r, p: v < 0,
+    'floor': lambda v, q, r, p: False,
+    'ceil': lambda v, q, r, p: True,
+}
@@ -0,0 +1,80 @@
+from typing import Callable
+
+
+class TypeDispatcher:
+    """TypeDispatcher is a class that selects a handler by the type of an argument.
+
+    The exact type is looked up in a dict first. Unknown types are resolved
+    once by walking their MRO, and the result is cached, so subclasses and
+    NumPy scalar types cost a single dict lookup after the first call.
+
+    Attributes
+    ----------
+    name : str
+        The name used in error messages.
+
+    Examples
+    --------
+    >>> power = TypeDispatcher('power')
+    >>> power.register(int)(lambda x: x * x)
+    >>> power(3)
+    9
+
+    """
+    name: str
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._registry: dict[type, Callable | None] = {}
+        self._cache: dict[type, Callable | None] = {}
+
+    # public methods
+    def register(self, *types: type) -> Callable[[Callable], Callable]:
+        """register is a method that returns a decorator which registers a handler for types.
+
+        Parameters
+        ----------
+        *types : type
+            The types handled by the decorated function, including their subclasses.
+        """
+        def decorator(handler: Callable) -> Callable:
+            for t in types:
+                self._registry[t] = handler
+            self._cache.clear()
+            return handler
+        return decorator
+
+    def reject(self, *types: type) -> None:
+        """reject is a method that marks types as unsupported, even if a base class is registered.
+
+        Parameters
+        ----------
+        *types : type
+            The types to be rejected, including their subclasses.
+        """
+        for t in types:
+            self._registry[t] = None
+        self._cache.clear()
+
+    def lookup(self, t: type) -> Callable:
+        """lookup is a method that returns the handler for a type.
+
+        Raises
+        ------
+        TypeError
+            If neither the type nor one of its bases is registered, or if it is rejected.
+        """
+        try:
+            handler = self._cache[t]
+        except KeyError:
+            handler = self._cache[t] = next((self._registry[b] for b in t.__mro__ if b in self._registry), None)
+        if handler is None:
+            raise TypeError(f"Unsupported type {t}")
+        return handler
+
+    # private methods
+    def __call__(self, x, *args):
+        return self.lookup(type(x))(x, *args)
+
+    def __repr__(self) -> str:
+        return f"TypeDispatcher({self.name!r})"
@@ -0,0 +1 @@
+from .columnar import ColumnarWriter, save_columnar, open_columns, load_columnar
@@ -0,0 +1,288 @@
+"""A columnar on-disk format for decimal and Tvu arrays.
+
+A dataset is a directory. Every decimal column is stored as three raw
+little-endian files, one per field of DecimalArray: the signs (int8), the
+coefficients (int64) and the exponents (int64). A coefficient too big for
+int64 is written as -1 and kept in an overflow side table of row indices,
+byte offsets and little-endian magnitudes. header.json records the kind,
+the length and the columns; it is written when the writer is closed.
+
+Decimal arrays have one column, 'value'; Tvu arrays have 't' and 'u'.
+The files are opened with np.memmap, so opening a dataset reads only the
+header and rows are read from disk when they are used.
+"""
+import json
+import os
+from typing import Sequence
+import numpy as np
+from ..decimal_value import DecimalArray
+from ..typical_value import TvuArray, TypicalValueWithUncertainty
+
+FORMAT = 'tvu-columnar'
+VERSION = 1
+KINDS = {'decimal': ('value',), 'tvu': ('t', 'u')}
+
+_HEADER = 'header.json'
+_FIELDS = {'s': '<i1', 'x': '<i8', 'e': '<i8'}
+_OVERFLOW = {'overflow_index': '<i8', 'overflow_offsets': '<i8', 'overflow_bytes': 'u1'}
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+class ColumnarWriter:
+    """ColumnarWriter is a class that streams decimal or Tvu arrays to a columnar dataset chunk by chunk.
+
+    Each chunk is appended to the column files as it is written, so the
+    memory does not depend on the size of the dataset. The dataset can be
+    read once the writer is closed.
+
+    Attributes
+    ----------
+    path : str
+        The directory of the dataset.
+    kind : str
+        'decimal' or 'tvu'.
+    length : int
+        The number of rows written so far.
+
+    Examples
+    --------
+    >>> with ColumnarWriter('prices', 'decimal') as writer:
+    ...     for chunk in chunks:
+    ...         writer.write(chunk)
+    >>> prices = load_columnar('prices')
+
+    """
+    path: str
+    kind: str
+    length: int
+
+    def __init__(self, path: str | os.PathLike, kind: str = 'decimal') -> None:
+        if kind not in KINDS:
+            raise ValueError(f'Unsupported kind {kind!r}, expected one of {tuple(KINDS)}')
+        self.path = os.fspath(path)
+        self.kind = kind
+        self.length = 0
+        os.makedirs(self.path, exist_ok=True)
+        header = os.path.join(self.path, _HEADER)
+        if os.path.exists(header):
+            os.remove(header)  # the old dataset is gone until close writes the new header
+        self._files = {}
+        self._overflow = {}
+        for column in KINDS[kind]:
+            for field in (*_FIELDS, *_OVERFLOW):
+                self._files[column, field] = open(_file(self.path, column, field), 'wb')
+            self._files[column, 'overflow_offsets'].write(np.zeros(1, dtype='<i8').tobytes())
+            self._overflow[column] = [0, 0]  # rows and bytes
+
+    # public methods
+    def write(self, values) -> None:
+        """write is a method that appends a chunk of values.
+
+        Parameters
+        ----------
+        values : DecimalArray | Sequence | TvuArray | Sequence[TypicalValueWithUncertainty]
+            The values of a 'decimal' dataset, in any form DecimalArray
+            accepts, or the values of a 'tvu' dataset.
+        """
+        if self._files is None:
+            raise ValueError('The writer is closed')
+        columns = _columns(values, self.kind)
+        n = len(columns[0])
+        for column, d in zip(KINDS[self.kind], columns):
+            self.__write_column(column, d)
+        self.length += n
+
+    def close(self) -> None:
+        """close is a method that closes the column files and writes the header."""
+        if self._files is None:
+            return
+        self.__close_files()
+        header = {
+            'format': FORMAT,
+            'version': VERSION,
+            'kind': self.kind,
+            'length': self.length,
+            'columns': list(KINDS[self.kind]),
+            'overflow': {column: rows for column, (rows, _) in self._overflow.items()},
+        }
+        with open(os.path.join(self.path, _HEADER), 'w') as f:
+            json.dump(header, f)
+
+    # private methods
+    def __close_files(self) -> None:
+        for f in self._files.values():
+            f.close()
+        self._files = None
+
+    def __write_column(self, column: str, d: DecimalArray) -> None:
+        files = {field: self._files[column, field] for field in (*_FIELDS, *_OVERFLOW)}
+        x = d.x
+        if x.dtype == object:
+            big = np.array([v > _INT64_MAX for v in x.tolist()], dtype=bool)
+            rows = np.flatnonzero(big)
+            magnitudes = [x[i].to_bytes((x[i].bit_length() + 7) // 8, 'little') for i in rows.tolist()]
+            x = np.where(big, -1, x).astype(np.int64)
+            rows_written, bytes_written = self._overflow[column]
+            ends = bytes_written + np.cumsum([len(m) for m in magnitudes], dtype=np.int64)
+            files['overflow_index'].write((rows + self.length).astype('<i8').tobytes())
+            files['overflow_offsets'].write(ends.astype('<i8').tobytes())
+            files['overflow_bytes'].write(b''.join(magnitudes))
+            self._overflow[column] = [rows_written + len(rows), int(ends[-1]) if len(ends) else bytes_written]
+        files['s'].write(np.asarray(d.s, dtype='<i1').tobytes())
+        files['x'].write(np.asarray(x, dtype='<i8').tobytes())
+        files['e'].write(np.asarray(d.e, dtype='<i8').tobytes())
+
+    def __enter__(self) -> 'ColumnarWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.close()
+        elif self._files is not None:
+            self.__close_files()  # no header, so the incomplete dataset cannot be opened
+        return False
+
+    def __repr__(self) -> str:
+        return f'ColumnarWriter({self.path!r}, {self.kind!r}, length={self.length})'
+
+
+def save_columnar(path: str | os.PathLike, values) -> None:
+    """Writes decimal or Tvu arrays to a columnar dataset in one chunk.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The directory of the dataset. Existing column files are replaced.
+    values : DecimalArray | Sequence | TvuArray | Sequence[TypicalValueWithUncertainty]
+        A TvuArray or a sequence of TypicalValueWithUncertainty gives a
+        'tvu' dataset, anything else a 'decimal' dataset.
+
+    Examples
+    --------
+    >>> save_columnar('measurements', [Tvu(Dn('1.25'), Dn('0.05')), Tvu(3, 1)])
+    >>> load_columnar('measurements').T
+    array([1.25, 3.  ])
+
+    """
+    kind = 'tvu' if _is_tvu(values) else 'decimal'
+    with ColumnarWriter(path, kind) as writer:
+        writer.write(values)
+
+
+def open_columns(path: str | os.PathLike) -> dict[str, DecimalArray]:
+    """Opens the decimal columns of a dataset without reading them.
+
+    The fields of each DecimalArray are read-only memory maps of the column
+    files. A column with overflow rows has its coefficients read into an
+    object array, since they cannot be mapped.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The directory of the dataset.
+
+    Returns
+    -------
+    dict[str, DecimalArray]
+        The columns by name: 'value', or 't' and 'u'.
+
+    Raises
+    ------
+    ValueError
+        If the directory has no header of this format, e.g. while it is
+        still being written.
+
+    """
+    path = os.fspath(path)
+    header = _header(path)
+    n = header['length']
+    columns = {}
+    for column in header['columns']:
+        s, x, e = (_memmap(_file(path, column, field), dtype, n) for field, dtype in _FIELDS.items())
+        if header['overflow'][column]:
+            k = header['overflow'][column]
+            rows = _memmap(_file(path, column, 'overflow_index'), '<i8', k)
+            offsets = _memmap(_file(path, column, 'overflow_offsets'), '<i8', k + 1)
+            data = np.fromfile(_file(path, column, 'overflow_bytes'), dtype='u1').tobytes()
+            x = x.astype(object)
+            for i, start, end in zip(rows.tolist(), offsets[:-1].tolist(), offsets[1:].tolist()):
+                x[i] = int.from_bytes(data[start:end], 'little')
+        columns[column] = DecimalArray.from_parts(s, x, e)
+    return columns
+
+
+def load_columnar(path: str | os.PathLike) -> DecimalArray | TvuArray:
+    """Opens a columnar dataset.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The directory of the dataset.
+
+    Returns
+    -------
+    DecimalArray | TvuArray
+        A 'decimal' dataset as a memory-mapped DecimalArray, see
+        open_columns. A 'tvu' dataset is converted to the float64 columns
+        of a TvuArray, which reads it; use open_columns to read its decimal
+        columns lazily.
+
+    """
+    columns = open_columns(path)
+    if 'value' in columns:
+        return columns['value']
+    return TvuArray.from_columns(_floats(columns['t']), _floats(columns['u']))
+
+
+def _file(path: str, column: str, field: str) -> str:
+    return os.path.join(path, f'{column}.{field}.bin')
+
+
+def _header(path: str) -> dict:
+    try:
+        with open(os.path.join(path, _HEADER)) as f:
+            header = json.load(f)
+    except FileNotFoundError:
+        raise ValueError(f'{path!r} is not a complete columnar dataset') from None
+    if header.get('format') != FORMAT or header.get('version', 0) > VERSION:
+        raise ValueError(f'{path!r} has an unsupported format: {header.get("format")} version {header.get("version")}')
+    return header
+
+
+def _memmap(file: str, dtype: str, n: int) -> np.ndarray:
+    if n == 0:
+        return np.empty(0, dtype=dtype)  # np.memmap cannot map an empty file
+    return np.memmap(file, dtype=dtype, mode='r', shape=(n,))
+
+
+def _floats(d: DecimalArray) -> np.ndarray:
+    """Converts decimals to the nearest float64, unlike DecimalArray.X which rounds twice."""
+    result = np.empty(len(d), dtype=np.float64)
+    x, e = d.x, d.e
+    # x and 10 ** |e| are exact floats, so one multiplication or division rounds once
+    fast = (np.abs(e) <= 22) & (x <= 2 ** 53) if x.dtype != object else np.zeros(len(d), dtype=bool)
+    xf, ef = x[fast].astype(np.float64), e[fast]
+    result[fast] = np.where(ef >= 0, xf * 10.0 ** np.maximum(ef, 0), xf / 10.0 ** np.maximum(-ef, 0))
+    slow = np.flatnonzero(~fast)
+    result[slow] = [float(f'{v}e{k}') for v, k in zip(x[slow].tolist(), e[slow].tolist())]
+    return result * d.s
+
+
+def _is_tvu(values) -> bool:
+    if isinstance(values, TvuArray):
+        return True
+    return isinstance(values, Sequence) and len(values) > 0 and isinstance(values[0], TypicalValueWithUncertainty)
+
+
+def _columns(values, kind: str) -> list[DecimalArray]:
+    if kind == 'decimal':
+        if _is_tvu(values):
+            raise TypeError('Tvu values are written to a dataset of kind \'tvu\'')
+        return [values if isinstance(values, DecimalArray) else DecimalArray(values)]
+    if isinstance(values, TvuArray):
+        return [DecimalArray(values.t), DecimalArray(values.u)]
+    values = list(values)
+    if not all(isinstance(v, TypicalValueWithUncertainty) for v in values):
+        raise TypeError('Expected a TvuArray or a sequence of TypicalValueWithUncertainty')
+    return [DecimalArray.from_numbers([v.t for v in values]), DecimalArray.from_numbers([v.u for v in values])]
+
@@ -1,2 +1,11 @@
 from .typical_value_with_uncertainty import TypicalValueWithUncertainty
 from .typical_value_with_uncertainty import TypicalValueWithUncertainty as Tvu
+from .tvu_array import TVU_DTYPE, TvuArray
+from .accumulator import TvuAccumulator
+from .correlation import covariance_matrix, correlation_matrix
+from .expression import Expression, Variable, lazy
+from .simulation import MonteCarloResult, monte_carlo
+from .formatting import format_tvu
+from .structured import to_structured, from_structured
+from .groupby import GroupbyResult, groupby_reduce
+from .averaging import weighted_mean
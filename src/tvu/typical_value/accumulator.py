@@ -0,0 +1,115 @@
+import math
+import numpy as np
+from ..decimal_value import Dn
+from .typical_value_with_uncertainty import TypicalValueWithUncertainty
+
+
+class TvuAccumulator:
+    """TvuAccumulator is a class that accumulates a stream of samples into a typical value with uncertainty.
+
+    The mean and the sum of squared deviations are updated incrementally:
+    scalars with Welford's update and ndarray chunks with Chan's parallel
+    merge, so memory stays constant whatever the number of samples.
+    Accumulators filled by different workers can be merged.
+
+    Attributes
+    ----------
+    n : int
+        The number of samples.
+    mean : float
+        The mean of the samples.
+    m2 : float
+        The sum of squared deviations from the mean.
+
+    Properties
+    ----------
+    variance : float
+        The sample variance (ddof=1).
+    stderr : float
+        The standard error of the mean.
+
+    Examples
+    --------
+    >>> acc = TvuAccumulator()
+    >>> acc.update(np.array([1.0, 2.0]))
+    >>> acc.update(3.0)
+    >>> tvu = acc.tvu()
+    >>> tvu.T, tvu.U
+    (2.0, 0.5773502691896257)
+
+    """
+    __slots__ = ('n', 'mean', 'm2')
+    n: int
+    mean: float
+    m2: float
+
+    @property
+    def variance(self) -> float:
+        if self.n < 2:
+            raise ValueError(f'At least two samples are required, got {self.n}')
+        return self.m2 / (self.n - 1)
+
+    @property
+    def stderr(self) -> float: return math.sqrt(self.variance / self.n)
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    # public methods
+    def update(self, x: int | float | np.number | np.ndarray) -> None:
+        """update is a method that adds a sample or a chunk of samples.
+
+        Parameters
+        ----------
+        x : int | float | np.number | np.ndarray
+            A single sample, or an array of samples of any shape.
+        """
+        if isinstance(x, int | float | np.number):
+            x = float(x)  # np.float64 is a float too; keep the running statistics Python floats
+            self.n += 1
+            d = x - self.mean
+            self.mean += d / self.n
+            self.m2 += d * (x - self.mean)
+            return
+        x = np.asarray(x, dtype=np.float64)
+        if x.size == 0:
+            return
+        mean = x.mean()
+        d = x - mean
+        self.__merge(x.size, float(mean), float(np.vdot(d, d)))
+
+    def merge(self, other: 'TvuAccumulator') -> None:
+        """merge is a method that adds the samples accumulated by another accumulator.
+
+        Parameters
+        ----------
+        other : TvuAccumulator
+            The accumulator to be merged. It is left unchanged.
+        """
+        if not isinstance(other, TvuAccumulator):
+            raise TypeError(f'Unsupported type {type(other)}')
+        if other.n:
+            self.__merge(other.n, other.mean, other.m2)
+
+    def tvu(self) -> TypicalValueWithUncertainty:
+        """tvu is a method that returns the mean with its standard error, like Tvu(np.ndarray).
+
+        Raises
+        ------
+        ValueError
+            If fewer than two samples have been accumulated.
+        """
+        return TypicalValueWithUncertainty.from_parts(Dn(self.mean), Dn(self.stderr))
+
+    # private methods
+    def __merge(self, n: int, mean: float, m2: float) -> None:
+        total = self.n + n
+        d = mean - self.mean
+        self.mean += d * n / total
+        self.m2 += m2 + d * d * self.n * n / total
+        self.n = total
+
+    def __repr__(self) -> str:
+        return f'TvuAccumulator(n={self.n}, mean={self.mean!r}, m2={self.m2!r})'
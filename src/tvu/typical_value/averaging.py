@@ -0,0 +1,97 @@
+from typing import Sequence
+import numpy as np
+from ..decimal_value import Dn
+from . import correlation
+from .groupby import GroupbyResult
+from .statistics import segments
+from .tvu_array import TvuArray
+from .typical_value_with_uncertainty import TypicalValueWithUncertainty
+
+
+def weighted_mean(
+    values: TvuArray | Sequence[TypicalValueWithUncertainty],
+    labels: np.ndarray | None = None,
+    birge: bool = False,
+) -> TypicalValueWithUncertainty | GroupbyResult:
+    """Combines independent determinations of the same quantity by their inverse-variance weighted mean.
+
+    With weights w = 1 / u ** 2, the mean is sum(w * t) / sum(w) and its
+    uncertainty is 1 / sqrt(sum(w)). With birge, the uncertainty is
+    multiplied by the Birge ratio sqrt(chi2 / (n - 1)) where it exceeds 1,
+    i.e. where the determinations scatter more than their uncertainties
+    allow. Everything is computed on the float64 columns in a few NumPy
+    passes; with labels, the determinations are sorted by label once and
+    each group is reduced with np.add.reduceat.
+
+    Parameters
+    ----------
+    values : TvuArray | Sequence[TypicalValueWithUncertainty]
+        The determinations. Every uncertainty must be positive and finite.
+    labels : np.ndarray | None, default None
+        1-D array of the group of each determination, to get one weighted
+        mean per group.
+    birge : bool, default False
+        Scale the uncertainties by the Birge ratio where it exceeds 1.
+
+    Returns
+    -------
+    TypicalValueWithUncertainty | GroupbyResult
+        The weighted mean, correlated with the determinations (also with
+        the items of a sequence, which is converted to a TvuArray first),
+        or with labels the distinct labels, a TvuArray of the weighted
+        means, each correlated with the determinations of its group, and
+        the number of determinations of each group.
+
+    Raises
+    ------
+    ValueError
+        If values is empty, an uncertainty is not positive and finite, or
+        labels do not match values.
+
+    Examples
+    --------
+    >>> weighted_mean(TvuArray([10.0, 12.0], [1.0, 2.0])).T
+    10.4
+    >>> weighted_mean(TvuArray([10.0, 14.0], [1.0, 1.0]), birge=True).U
+    2.0
+
+    """
+    if not isinstance(values, TvuArray):
+        values = TvuArray(list(values))
+    t, u = values.t, values.u
+    if len(t) == 0:
+        raise ValueError('At least one determination is required')
+    if not (np.isfinite(u) & (u > 0)).all():
+        raise ValueError('Every uncertainty must be positive and finite')
+    w = 1.0 / (u * u)
+    if labels is None:
+        total = w.sum()
+        mean = float(w @ t / total)
+        d = t - mean
+        scale = float(_scale(w @ (d * d), len(t))) if birge else 1.0
+        deps = correlation.array_reduce(values._dependency_terms(), w / total * scale)
+        return TypicalValueWithUncertainty._from_dependencies(Dn(mean), Dn(float(scale / np.sqrt(total))), deps)
+    labels = np.asarray(labels)
+    if labels.shape != t.shape:
+        raise ValueError(f'labels must be a 1-D array of the same length as values, got {labels.shape}')
+    order = np.argsort(labels, kind='stable')
+    keys, t, w = labels[order], t[order], w[order]
+    starts = segments(keys)
+    n = np.diff(np.append(starts, len(t)))
+    total = np.add.reduceat(w, starts)
+    mean = np.add.reduceat(w * t, starts) / total
+    scale = np.ones(len(starts))
+    if birge:
+        d = t - np.repeat(mean, n)
+        scale = _scale(np.add.reduceat(w * d * d, starts), n)
+    result = TvuArray.from_columns(mean, scale / np.sqrt(total))
+    terms = correlation.array_take(values._dependency_terms(), order)
+    result._terms = correlation.array_reduceat(terms, starts, w * np.repeat(scale / total, n))
+    return GroupbyResult(keys[starts], result, n)
+
+
+def _scale(chi2, n):
+    """Returns the Birge ratio sqrt(chi2 / (n - 1)) where it exceeds 1, otherwise 1."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.sqrt(chi2 / (n - 1))
+    return np.where(ratio > 1.0, ratio, 1.0)
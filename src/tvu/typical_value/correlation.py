@@ -0,0 +1,287 @@
+"""Sparse first-order dependency maps.
+
+Every TypicalValueWithUncertainty with a non-zero uncertainty depends
+linearly on a set of independent sources. The dependency map stores the
+source IDs as a sorted int64 array together with the contribution of each
+source to the uncertainty (the partial derivative times the source's
+uncertainty), so the uncertainty is the norm of the contributions and the
+covariance of two values is the dot product over their shared sources.
+
+The elements of a TvuArray share one map per term instead: a term gives
+every element at most one source and its contribution, as arrays of the
+length of the array, and the dependency map of an element is the union of
+its entries in all terms.
+"""
+from typing import Sequence
+import numpy as np
+from .statistics import segments
+
+Dependencies = tuple[np.ndarray, np.ndarray]
+
+# (start, idx, c): element i depends on source start + idx[i] (start + i if
+# idx is None), or on idx[i] itself if start is None, with contribution c[i];
+# the padding ID -1 always has a zero contribution
+ArrayTerm = tuple[int | None, np.ndarray | None, np.ndarray]
+
+EMPTY: Dependencies = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64))
+
+_next_source = 0
+
+
+def new_sources(n: int = 1) -> int:
+    """Reserves n consecutive source IDs and returns the first one."""
+    global _next_source
+    start = _next_source
+    _next_source += n
+    return start
+
+
+def source(u: float) -> Dependencies:
+    """Returns the dependency map of a new independent source with uncertainty u."""
+    if not u:
+        return EMPTY
+    return np.array([new_sources()], dtype=np.int64), np.array([u], dtype=np.float64)
+
+
+def combine(a: Dependencies, da: float, b: Dependencies, db: float) -> Dependencies:
+    """Returns the dependency map of da * a + db * b.
+
+    The two sorted maps are concatenated and merged with a stable sort,
+    which detects the two sorted runs and merges them in linear time.
+    Sources whose contributions cancel exactly are dropped.
+    """
+    (ia, ca), (ib, cb) = a, b
+    if not len(ib):
+        return (ia, ca * da) if len(ia) else EMPTY
+    if not len(ia):
+        return ib, cb * db
+    if ia is ib:
+        ids, c = ia, ca * da + cb * db
+    elif ia[-1] < ib[0]:
+        ids, c = np.concatenate((ia, ib)), np.concatenate((ca * da, cb * db))
+    elif ib[-1] < ia[0]:
+        ids, c = np.concatenate((ib, ia)), np.concatenate((cb * db, ca * da))
+    else:
+        ids = np.concatenate((ia, ib))
+        order = np.argsort(ids, kind='stable')
+        ids, c = ids[order], np.concatenate((ca * da, cb * db))[order]
+        first = segments(ids)
+        ids, c = ids[first], np.add.reduceat(c, first)
+    keep = c != 0
+    return (ids, c) if keep.all() else (ids[keep], c[keep])
+
+
+def array_source(start: int, u: np.ndarray) -> list[ArrayTerm]:
+    """Returns the terms of an array whose elements are the consecutive independent sources from start."""
+    return [(start, None, u)]
+
+
+def array_from_maps(maps: Sequence[Dependencies]) -> list[ArrayTerm]:
+    """Stacks the dependency maps of values into the terms of an array of them, one term per entry of the longest map."""
+    k = max((len(i) for i, _ in maps), default=0)
+    ids = np.full((k, len(maps)), -1, dtype=np.int64)
+    c = np.zeros((k, len(maps)))
+    for j, (i, ci) in enumerate(maps):
+        ids[:len(i), j] = i
+        c[:len(i), j] = ci
+    return [(None, ids[j], c[j]) for j in range(k)]
+
+
+def array_ids(term: ArrayTerm) -> np.ndarray:
+    """Returns the source ID of each element in a term."""
+    start, idx, c = term
+    if start is None:
+        return idx
+    return start + (np.arange(len(c), dtype=np.int64) if idx is None else idx)
+
+
+def array_broadcast(terms: list[ArrayTerm], n: int) -> list[ArrayTerm]:
+    """Repeats the terms of an array of length one n times."""
+    if not terms or len(terms[0][2]) == n:
+        return terms
+    return [(start, np.zeros(n, dtype=np.int64) if idx is None else np.broadcast_to(idx, n), np.broadcast_to(c, n))
+            for start, idx, c in terms]
+
+
+def array_combine(a: list[ArrayTerm], da, b: list[ArrayTerm], db) -> list[ArrayTerm]:
+    """Returns the terms of da * a + db * b element by element; da and db are floats or arrays.
+
+    Terms over the same sources, e.g. of an array combined with itself, are
+    merged and dropped if their contributions cancel exactly. A zero
+    contribution stays zero where a derivative is not finite.
+    """
+    merged = {}
+    with np.errstate(invalid='ignore'):
+        for terms, d in ((a, da), (b, db)):
+            finite = np.ndim(d) == 0 and np.isfinite(d)
+            for start, idx, c in terms:
+                if finite:
+                    c = c if d == 1.0 else c * d  # terms are never modified, so they can be shared
+                else:
+                    c = np.where(c == 0, 0.0, c * d)
+                key = start, id(idx)
+                if key in merged:
+                    merged[key] = start, idx, merged[key][2] + c, True
+                else:
+                    merged[key] = start, idx, c, False
+    return [(start, idx, c) for start, idx, c, summed in merged.values() if not summed or c.any()]
+
+
+def array_take(terms: list[ArrayTerm], key) -> list[ArrayTerm]:
+    """Returns the terms of the elements selected by an index, e.g. a slice, a mask or an index array."""
+    result = []
+    for start, idx, c in terms:
+        if idx is None:
+            idx = np.arange(*key.indices(len(c)), dtype=np.int64) if isinstance(key, slice) else np.arange(len(c), dtype=np.int64)[key]
+        else:
+            idx = idx[key]
+        result.append((start, idx, c[key]))
+    return result
+
+
+def array_concatenate(parts: Sequence[list[ArrayTerm]], lengths: Sequence[int]) -> list[ArrayTerm]:
+    """Returns the terms of the concatenation of arrays, padding the arrays with fewer terms."""
+    k = max((len(terms) for terms in parts), default=0)
+    return [(
+        None,
+        np.concatenate([array_ids(terms[j]) if j < len(terms) else np.full(n, -1, dtype=np.int64) for terms, n in zip(parts, lengths)]),
+        np.concatenate([terms[j][2] if j < len(terms) else np.zeros(n) for terms, n in zip(parts, lengths)]),
+    ) for j in range(k)]
+
+
+def array_norm(terms: list[ArrayTerm], n: int) -> np.ndarray:
+    """Returns the uncertainty of each element, adding the covariances of terms which share a source at the same element."""
+    if not terms:
+        return np.zeros(n)
+    covariances = []
+    for j, a in enumerate(terms):
+        for b in terms[j + 1:]:
+            if a[0] is not None and b[0] is not None and a[0] != b[0]:
+                continue  # the blocks of two arrays never overlap
+            same = array_ids(a) == array_ids(b)
+            if same.any():
+                covariances.append(2 * np.where(same, a[2] * b[2], 0.0))
+    if not covariances and len(terms) <= 2:
+        return np.abs(terms[0][2]) if len(terms) == 1 else np.hypot(terms[0][2], terms[1][2])
+    return np.sqrt(np.maximum(sum(c * c for _, _, c in terms) + sum(covariances), 0.0))
+
+
+def array_element(terms: list[ArrayTerm], i: int) -> Dependencies:
+    """Returns the dependency map of element i."""
+    ids = np.array([idx[i] if start is None else start + (i if idx is None else idx[i]) for start, idx, _ in terms], dtype=np.int64)
+    return _unique(ids, np.array([c[i] for _, _, c in terms], dtype=np.float64))
+
+
+def array_reduce(terms: list[ArrayTerm], w=None) -> Dependencies:
+    """Returns the dependency map of the sum of the elements, each multiplied by w if given."""
+    if len(terms) == 1 and terms[0][1] is None:
+        start, _, c = terms[0]
+        c = c if w is None else c * w
+        nonzero = np.flatnonzero(c)
+        return start + nonzero, c[nonzero]
+    if not terms:
+        return EMPTY
+    ids = np.concatenate([array_ids(term) for term in terms])
+    c = np.concatenate([term[2] if w is None else term[2] * w for term in terms])
+    return _unique(ids, c)
+
+
+def array_reduceat(terms: list[ArrayTerm], starts: np.ndarray, w) -> list[ArrayTerm]:
+    """Returns the terms of the sums of the runs of elements from each of starts, each element multiplied by w."""
+    n = len(terms[0][2]) if terms else 0
+    groups = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    g = np.tile(groups, len(terms))
+    ids = np.concatenate([array_ids(term) for term in terms] + [EMPTY[0]])
+    c = np.concatenate([term[2] * w for term in terms] + [EMPTY[1]])
+    keep = c != 0
+    g, ids, c = g[keep], ids[keep], c[keep]
+    if not len(c):
+        return []
+    order = np.lexsort((ids, g))
+    g, ids, c = g[order], ids[order], c[order]
+    first = np.union1d(segments(g), segments(ids))  # a (group, source) pair changes where either does
+    g, ids, c = g[first], ids[first], np.add.reduceat(c, first)
+    keep = c != 0
+    g, ids, c = g[keep], ids[keep], c[keep]
+    if not len(c):
+        return []
+    runs = segments(g)
+    rank = np.arange(len(g)) - np.repeat(runs, np.diff(np.append(runs, len(g))))
+    k = int(rank.max()) + 1
+    matrix_ids = np.full((k, len(starts)), -1, dtype=np.int64)
+    matrix_c = np.zeros((k, len(starts)))
+    matrix_ids[rank, g] = ids
+    matrix_c[rank, g] = c
+    return [(None, matrix_ids[j], matrix_c[j]) for j in range(k)]
+
+
+def _unique(ids: np.ndarray, c: np.ndarray) -> Dependencies:
+    """Sorts a dependency map and sums the contributions of repeated sources, dropping zeros."""
+    if not len(ids):
+        return EMPTY
+    order = np.argsort(ids, kind='stable')
+    ids, c = ids[order], c[order]
+    first = segments(ids)
+    ids, c = ids[first], np.add.reduceat(c, first)
+    keep = c != 0
+    return ids[keep], c[keep]
+
+
+def jacobian(values: Sequence) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the source IDs shared by values and the matrix of contributions, one row per value."""
+    maps = [v._dependencies() for v in values]
+    ids = np.unique(np.concatenate([i for i, _ in maps] + [EMPTY[0]]))
+    matrix = np.zeros((len(maps), len(ids)))
+    for row, (i, c) in zip(matrix, maps):
+        row[np.searchsorted(ids, i)] = c
+    return ids, matrix
+
+
+def covariance_matrix(values: Sequence) -> np.ndarray:
+    """Calculates the covariance matrix of typical values with uncertainties.
+
+    Parameters
+    ----------
+    values : Sequence[TypicalValueWithUncertainty]
+        The values, e.g. results of calculations sharing some inputs.
+
+    Returns
+    -------
+    np.ndarray
+        The (n, n) covariance matrix; its diagonal holds the squared uncertainties.
+
+    Examples
+    --------
+    >>> a = Tvu(2.0, 0.1)
+    >>> covariance_matrix([a, 2 * a])
+    array([[0.01, 0.02],
+           [0.02, 0.04]])
+
+    """
+    _, matrix = jacobian(values)
+    return matrix @ matrix.T
+
+
+def correlation_matrix(values: Sequence) -> np.ndarray:
+    """Calculates the correlation matrix of typical values with uncertainties.
+
+    Values without uncertainty are uncorrelated with everything else and
+    have a correlation of 1 with themselves.
+
+    Parameters
+    ----------
+    values : Sequence[TypicalValueWithUncertainty]
+        The values.
+
+    Returns
+    -------
+    np.ndarray
+        The (n, n) correlation matrix.
+
+    """
+    covariance = covariance_matrix(values)
+    u = np.sqrt(np.diag(covariance))
+    scale = np.where(u == 0, 1.0, u)
+    correlation = covariance / np.outer(scale, scale)
+    np.fill_diagonal(correlation, 1.0)
+    return correlation
@@ -0,0 +1,194 @@
+import operator
+import weakref
+import numpy as np
+from ..decimal_value import Dn
+from .typical_value_with_uncertainty import TypicalValueWithUncertainty
+
+_OPS = {
+    'add': operator.add,
+    'sub': operator.sub,
+    'mul': operator.mul,
+    'truediv': operator.truediv,
+    'pow': operator.pow,
+    'neg': operator.neg,
+}
+_COMMUTATIVE = frozenset(('add', 'mul'))
+
+# hash-consing table: one live node per (operation, operand identities)
+_NODES: 'weakref.WeakValueDictionary[tuple, Expression]' = weakref.WeakValueDictionary()
+
+
+class Expression:
+    """Expression is a class that represents a node of a lazy formula over typical values with uncertainties.
+
+    Arithmetic on expressions builds a DAG instead of computing a result.
+    Nodes are hash-consed: the same operation on the same operands always
+    returns the same node, so repeated subexpressions are evaluated once.
+    Results are cached per node, and updating a Variable only invalidates
+    the nodes that depend on it.
+
+    Attributes
+    ----------
+    op : str
+        The operation, e.g. 'add', or 'leaf' for inputs and constants.
+    args : tuple[Expression, ...]
+        The operands.
+
+    Examples
+    --------
+    >>> x = lazy(Tvu(2.0, 0.1))
+    >>> y = x * x + 1
+    >>> y.evaluate().T
+    5.0
+    >>> x.value = Tvu(3.0, 0.1)
+    >>> y.evaluate().T
+    10.0
+
+    """
+    __slots__ = ('op', 'args', '_value', '_parents', '__weakref__')
+    op: str
+    args: tuple['Expression', ...]
+
+    def __init__(self, op: str, args: tuple['Expression', ...]) -> None:
+        self.op = op
+        self.args = args
+        self._value = None
+        self._parents = weakref.WeakSet()
+        for a in args:
+            a._parents.add(self)
+
+    # public methods
+    def evaluate(self) -> TypicalValueWithUncertainty:
+        """evaluate is a method that returns the value of the expression, recomputing only invalidated nodes.
+
+        The invalidated part of the DAG is visited once in topological
+        order; each node propagates value and uncertainty together with
+        the arithmetic of TypicalValueWithUncertainty, so correlations
+        between shared inputs are accounted for.
+        """
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node._value is not None:
+                continue
+            if expanded:
+                node._value = _OPS[node.op](*(a._value for a in node.args))
+                continue
+            stack.append((node, True))
+            stack.extend((a, False) for a in node.args if a._value is None)
+        return self._value
+
+    # private methods
+    def _invalidate(self) -> None:
+        stack = list(self._parents)
+        while stack:
+            node = stack.pop()
+            if node._value is not None:
+                node._value = None
+                stack.extend(node._parents)
+
+    def __add__(self, other): return _node('add', self, other)
+
+    def __radd__(self, other): return _node('add', other, self)
+
+    def __sub__(self, other): return _node('sub', self, other)
+
+    def __rsub__(self, other): return _node('sub', other, self)
+
+    def __mul__(self, other): return _node('mul', self, other)
+
+    def __rmul__(self, other): return _node('mul', other, self)
+
+    def __truediv__(self, other): return _node('truediv', self, other)
+
+    def __rtruediv__(self, other): return _node('truediv', other, self)
+
+    def __pow__(self, other): return _node('pow', self, other)
+
+    def __rpow__(self, other): return _node('pow', other, self)
+
+    def __neg__(self): return _node('neg', self)
+
+    def __repr__(self) -> str:
+        return f'Expression({self.op!r}, {len(self.args)} args)'
+
+
+class Variable(Expression):
+    """Variable is an Expression whose value can be replaced.
+
+    Attributes
+    ----------
+    value : TypicalValueWithUncertainty
+        The current value. Assigning it invalidates the dependent nodes.
+
+    """
+    __slots__ = ()
+
+    @property
+    def value(self) -> TypicalValueWithUncertainty: return self._value
+
+    @value.setter
+    def value(self, x) -> None:
+        self._value = _tvu(x)
+        self._invalidate()
+
+    def __init__(self, x) -> None:
+        super().__init__('leaf', ())
+        self._value = _tvu(x)
+
+    def __repr__(self) -> str:
+        return f'Variable(T={self._value.T!r}, U={self._value.U!r})'
+
+
+def lazy(x) -> Variable:
+    """Wraps a value as a Variable, so arithmetic on it builds a lazy expression.
+
+    Parameters
+    ----------
+    x : TypicalValueWithUncertainty | DecimalNumber | int | float | np.integer
+        The initial value.
+
+    Returns
+    -------
+    Variable
+        A new input of the expression DAG.
+
+    """
+    return Variable(x)
+
+
+def _tvu(x) -> TypicalValueWithUncertainty:
+    return x if isinstance(x, TypicalValueWithUncertainty) else TypicalValueWithUncertainty(x)
+
+
+def _leaf(x) -> Expression:
+    """Returns the constant node of a non-expression operand, shared by equal constants."""
+    if isinstance(x, Expression):
+        return x
+    if isinstance(x, TypicalValueWithUncertainty):
+        key = ('leaf', id(x))
+    elif isinstance(x, Dn):
+        key = ('leaf', Dn, x.s, x.x, x.e)
+    elif isinstance(x, int | float | np.integer) and not isinstance(x, np.floating):
+        key = ('leaf', type(x), x)
+    else:
+        raise TypeError(f'Unsupported type {type(x)}')
+    node = _NODES.get(key)
+    if node is None:
+        node = _NODES[key] = Expression('leaf', ())
+        node._value = _tvu(x)
+    return node
+
+
+def _node(op: str, *args) -> Expression:
+    try:
+        args = tuple(_leaf(a) for a in args)
+    except TypeError:
+        return NotImplemented
+    if op in _COMMUTATIVE:
+        args = tuple(sorted(args, key=id))
+    key = (op, *map(id, args))
+    node = _NODES.get(key)
+    if node is None:
+        node = _NODES[key] = Expression(op, args)
+    return node
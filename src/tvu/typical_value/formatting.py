@@ -0,0 +1,109 @@
+from typing import Sequence
+import numpy as np
+from ..decimal_value import DecimalArray
+from .typical_value_with_uncertainty import TypicalValueWithUncertainty
+from .tvu_array import TvuArray
+
+STYLES = ('console', 'latex', 'plain')
+
+_POW10 = 10 ** np.arange(19, dtype=np.int64)
+_SCIENTIFIC = (-3, 6)  # plain notation for leading exponents in [-3, 6)
+
+
+def format_tvu(
+    values: TvuArray | Sequence[TypicalValueWithUncertainty] | TypicalValueWithUncertainty,
+    style: str = 'console',
+    digits: int = 2,
+) -> np.ndarray | str:
+    """Formats typical values with uncertainties for reports.
+
+    Each uncertainty is rounded half away from zero to digits significant
+    digits, and the typical value is rounded to the same decimal place.
+    The rounding works on the exact decimal digits of the values in a few
+    integer array passes, and only the final strings are assembled per row;
+    the inputs are not modified. A value whose leading digit
+    is below 1e-3 or at least 1e6 is written with a common power of ten.
+    A value without uncertainty keeps all of its digits.
+
+    Parameters
+    ----------
+    values : TvuArray | Sequence[TypicalValueWithUncertainty] | TypicalValueWithUncertainty
+        The values to be formatted.
+    style : str, default 'console'
+        'console' gives '1.23 ± 0.45', 'plain' gives '1.23 +/- 0.45' and
+        'latex' gives '\\num{1.23 \\pm 0.45}' for siunitx.
+    digits : int, default 2
+        The number of significant digits of the uncertainties.
+
+    Returns
+    -------
+    np.ndarray | str
+        The formatted strings, or a single string for a single value.
+
+    Examples
+    --------
+    >>> format_tvu(TvuArray([1.23456, -0.000123456], [0.0123, 0.0000456]))
+    array(['1.235 ± 0.012', '(-1.23 ± 0.46)e-4'], dtype='<U17')
+    >>> format_tvu(Tvu(1.23456, 0.0123), 'latex', 1)
+    '\\\\num{1.23 \\\\pm 0.01}'
+
+    """
+    if style not in STYLES:
+        raise ValueError(f'Unsupported style {style!r}, expected one of {STYLES}')
+    if digits < 1:
+        raise ValueError(f'digits must be positive, got {digits}')
+    if isinstance(values, TypicalValueWithUncertainty):
+        return str(format_tvu([values], style, digits)[0])
+    t, u = _decimals(values)
+    zero = u.s == 0
+    # the decimal place of the last significant digit of the uncertainty
+    lead_u = u.e + _ndigits(u.x) - 1
+    q = np.where(zero, np.minimum(t.e, 0), lead_u - digits + 1)
+    rounded = u.round(-q)
+    q = q + (~zero & (rounded.e + _ndigits(rounded.x) - 1 > lead_u))  # 0.096 -> 0.10, not 0.100
+    ti, ui = t.round(-q).to_integers(q), u.round(-q).to_integers(q)
+    # the common power of ten
+    lead = np.where(ti != 0, q + _ndigits(np.abs(ti)) - 1, np.where(ui != 0, q + _ndigits(ui) - 1, 0))
+    n = np.where((lead < _SCIENTIFIC[0]) | (lead >= _SCIENTIFIC[1]), lead, 0)
+    places = np.maximum(n - q, 0)
+    unit = _scaled(np.ones(len(q), dtype=np.int64), places)
+    mantissa, mantissa_fraction = _divmod(_scaled(np.abs(ti), q - n + places), unit)
+    uncertainty, uncertainty_fraction = _divmod(_scaled(ui, q - n + places), unit)
+    pm = {'console': ' ± ', 'plain': ' +/- ', 'latex': ' \\pm '}[style]
+    wrap = '\\num{%s}' if style == 'latex' else '%s'
+    scientific = '\\num{%se%d}' if style == 'latex' else '(%s)e%d'
+    result = []
+    for negative, m, mf, d, df, f, k in zip(
+        (ti < 0).tolist(), mantissa.tolist(), mantissa_fraction.tolist(),
+        uncertainty.tolist(), uncertainty_fraction.tolist(), places.tolist(), n.tolist(),
+    ):
+        body = '%s%d.%0*d%s%d.%0*d' % ('-' if negative else '', m, f, mf, pm, d, f, df) if f else '%s%d%s%d' % ('-' if negative else '', m, pm, d)
+        result.append(scientific % (body, k) if k else wrap % body)
+    return np.array(result, dtype=str)
+
+
+def _decimals(values) -> tuple[DecimalArray, DecimalArray]:
+    if isinstance(values, TvuArray):
+        return DecimalArray(values.t), DecimalArray(values.u)
+    values = list(values)
+    if not all(isinstance(v, TypicalValueWithUncertainty) for v in values):
+        raise TypeError('Expected a TvuArray or a sequence of TypicalValueWithUncertainty')
+    return DecimalArray.from_numbers([v.t for v in values]), DecimalArray.from_numbers([v.u for v in values])
+
+
+def _ndigits(x: np.ndarray) -> np.ndarray:
+    """Counts the decimal digits of non-negative integers, 0 for 0."""
+    if x.dtype == object:
+        return np.array([len(str(v)) if v else 0 for v in x.tolist()], dtype=np.int64)
+    return np.searchsorted(_POW10, x, side='right')
+
+
+def _scaled(v: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """Calculates v * 10 ** k for non-negative k."""
+    return DecimalArray.from_parts(np.ones(len(v), dtype=np.int8), v, k).to_integers(0)
+
+
+def _divmod(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    if a.dtype == object or b.dtype == object:
+        a, b = a.astype(object), b.astype(object)
+    return a // b, a % b
@@ -0,0 +1,130 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import NamedTuple
+import numpy as np
+from .tvu_array import TvuArray
+from .statistics import segments
+
+
+class GroupbyResult(NamedTuple):
+    """GroupbyResult is the result of groupby_reduce.
+
+    Attributes
+    ----------
+    labels : np.ndarray
+        The distinct labels in ascending order.
+    tvu : TvuArray
+        The mean of each group with its standard error (ddof=1) as the
+        uncertainty; nan for a group of one reading.
+    counts : np.ndarray
+        The number of readings of each group.
+
+    """
+    labels: np.ndarray
+    tvu: TvuArray
+    counts: np.ndarray
+
+
+def groupby_reduce(values: np.ndarray, labels: np.ndarray, processes: int | None = None) -> GroupbyResult:
+    """Calculates the mean and the standard error of the readings of each group.
+
+    The readings are sorted by label once, and the sums and the squared
+    deviations of each group are taken with segmented reductions
+    (np.add.reduceat), without a Python loop over the groups. With a
+    process pool, each worker reduces a contiguous part of the input to
+    per-group counts, means and squared deviations, which are then merged
+    with Chan's formula. The input is copied once into shared memory, so it
+    is not pickled for the workers.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        1-D array of readings.
+    labels : np.ndarray
+        1-D array of the group of each reading, e.g. sensor IDs. Any
+        sortable dtype; object labels are only supported without processes.
+    processes : int | None, default None
+        Reduce in a pool of this many processes.
+
+    Returns
+    -------
+    GroupbyResult
+        The distinct labels, a TvuArray of the means with their standard
+        errors, and the counts.
+
+    Examples
+    --------
+    >>> result = groupby_reduce(np.array([1.0, 5.0, 2.0, 3.0]), np.array(['a', 'b', 'a', 'a']))
+    >>> result.labels, result.tvu.T, result.counts
+    (array(['a', 'b'], dtype='<U1'), array([2., 5.]), array([3, 1]))
+
+    """
+    values = np.asarray(values, dtype=np.float64)
+    labels = np.asarray(labels)
+    if values.ndim != 1 or labels.shape != values.shape:
+        raise ValueError(f'values and labels must be 1-D arrays of the same length, got {values.shape} and {labels.shape}')
+    if processes is None or processes < 2 or len(values) < 2 * processes:
+        keys, n, mean, m2 = _reduce(values, labels)
+    else:
+        if labels.dtype == object:
+            raise TypeError('Object labels cannot be shared with other processes')
+        keys, n, mean, m2 = _merge(*_reduce_shared(values, labels, processes))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u = np.sqrt(m2 / (n - 1) / n)
+    return GroupbyResult(keys, TvuArray.from_columns(mean, u), n)
+
+
+def _reduce(values: np.ndarray, labels: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Reduces readings to the labels, counts, means and sums of squared deviations of their groups."""
+    if len(values) == 0:
+        return labels[:0], np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0)
+    order = np.argsort(labels, kind='stable')
+    keys, v = labels[order], values[order]
+    starts = segments(keys)
+    n = np.diff(np.append(starts, len(v)))
+    mean = np.add.reduceat(v, starts) / n
+    d = v - np.repeat(mean, n)  # two passes, so large offsets do not cancel
+    return keys[starts], n, mean, np.add.reduceat(d * d, starts)
+
+
+def _merge(keys, n, mean, m2) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Merges partial reductions of the same groups with Chan's formula."""
+    order = np.argsort(keys, kind='stable')
+    keys, n, mean, m2 = keys[order], n[order], mean[order], m2[order]
+    starts = segments(keys)
+    total = np.add.reduceat(n, starts)
+    merged = np.add.reduceat(n * mean, starts) / total
+    d = mean - np.repeat(merged, np.diff(np.append(starts, len(keys))))
+    return keys[starts], total, merged, np.add.reduceat(m2 + n * d * d, starts)
+
+
+def _reduce_shared(values: np.ndarray, labels: np.ndarray, processes: int) -> tuple[np.ndarray, ...]:
+    blocks = []
+    try:
+        specs = []
+        for a in (values, labels):
+            block = shared_memory.SharedMemory(create=True, size=max(a.nbytes, 1))
+            blocks.append(block)
+            np.ndarray(a.shape, dtype=a.dtype, buffer=block.buf)[:] = a
+            specs.append((block.name, a.dtype.str, a.shape))
+        bounds = np.linspace(0, len(values), processes + 1).astype(np.int64).tolist()
+        with ProcessPoolExecutor(processes) as executor:
+            parts = list(executor.map(_reduce_part, [specs] * processes, bounds[:-1], bounds[1:]))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return tuple(np.concatenate(columns) for columns in zip(*parts))
+
+
+def _reduce_part(specs, start: int, stop: int) -> tuple[np.ndarray, ...]:
+    """Reduces rows [start, stop) of the arrays in shared memory, in a worker."""
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in specs]
+    try:
+        values, labels = (np.ndarray(shape, dtype=dtype, buffer=block.buf)[start:stop] for block, (_, dtype, shape) in zip(blocks, specs))
+        result = _reduce(values, labels)
+        del values, labels  # release the buffers before closing them
+        return result
+    finally:
+        for block in blocks:
+            block.close()
@@ -0,0 +1,37 @@
+"""Closed-form first-order propagation of uncertainties.
+
+Each kernel takes the typical values of two operands and returns the
+typical value of the result with its two partial derivatives, for
+propagation through dependency maps; both TypicalValueWithUncertainty and
+TvuArray use them, so correlated operands are accounted for. The operands
+may be floats or float64 arrays of broadcastable shapes.
+"""
+import numpy as np
+
+
+def d_add(ta, tb):
+    """Returns a + b and its partial derivatives."""
+    return ta + tb, 1.0, 1.0
+
+
+def d_sub(ta, tb):
+    """Returns a - b and its partial derivatives."""
+    return ta - tb, 1.0, -1.0
+
+
+def d_mul(ta, tb):
+    """Returns a * b and its partial derivatives."""
+    return ta * tb, tb, ta
+
+
+def d_truediv(ta, tb):
+    """Returns a / b and its partial derivatives."""
+    t = ta / tb
+    return t, 1.0 / tb, -t / tb
+
+
+def d_power(ta, tb):
+    """Returns a ** b and its partial derivatives; a derivative may be nan where it does not exist."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.power(ta, tb)
+        return t, tb * np.power(ta, tb - 1), t * np.log(ta)
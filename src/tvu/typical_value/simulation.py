@@ -0,0 +1,214 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, NamedTuple, Sequence
+import numpy as np
+from ..decimal_value import Dn
+from .accumulator import TvuAccumulator
+from .expression import _OPS, Expression
+from .typical_value_with_uncertainty import TypicalValueWithUncertainty
+
+
+class MonteCarloResult(NamedTuple):
+    """MonteCarloResult is the result of monte_carlo.
+
+    Attributes
+    ----------
+    tvu : TypicalValueWithUncertainty
+        The mean of the samples with their standard deviation as the uncertainty.
+    percentiles : dict[float, float]
+        The requested percentiles of the samples, estimated from a uniform
+        random subset of them if there are more than percentile_samples.
+    n : int
+        The number of samples drawn, which is less than requested after an early stop.
+    invalid : int
+        The number of samples for which f was not finite, e.g. a negative
+        base to a fractional power. They are excluded from the statistics.
+
+    """
+    tvu: TypicalValueWithUncertainty
+    percentiles: dict[float, float]
+    n: int
+    invalid: int
+
+
+def monte_carlo(
+    f: Callable[..., np.ndarray] | Expression,
+    *inputs,
+    n: int = 1000000,
+    chunk_size: int = 100000,
+    seed: int | np.random.SeedSequence | None = None,
+    processes: int | None = None,
+    rtol: float | None = None,
+    percentiles: Sequence[float] = (2.5, 50.0, 97.5),
+    percentile_samples: int | None = 100000,
+) -> MonteCarloResult:
+    """Propagates uncertainties by Monte Carlo sampling.
+
+    Every input is drawn from a normal distribution with its typical value
+    as the mean and its uncertainty as the standard deviation, independently
+    of the other inputs. The samples are drawn and evaluated in chunks of
+    chunk_size and reduced to running statistics, so the memory is bounded
+    by chunk_size and percentile_samples whatever n is. Each
+    chunk has its own child of SeedSequence(seed), so a seed gives the same
+    result with or without a process pool.
+
+    Parameters
+    ----------
+    f : Callable[..., np.ndarray] | Expression
+        A vectorized function called with one float64 array per input, or a
+        lazy Expression whose leaves are the inputs.
+    *inputs : TypicalValueWithUncertainty | DecimalNumber | int | float
+        The inputs of f. Must be empty if f is an Expression.
+    n : int, default 1000000
+        The maximum number of samples.
+    chunk_size : int, default 100000
+        The number of samples evaluated at once.
+    seed : int | np.random.SeedSequence | None, default None
+        The seed of the random generators.
+    processes : int | None, default None
+        Evaluate chunks in a pool of this many processes. f must be picklable.
+    rtol : float | None, default None
+        Stop early once a chunk changes neither the mean nor the standard
+        deviation by more than rtol times the standard deviation.
+    percentiles : Sequence[float], default (2.5, 50.0, 97.5)
+        The percentiles to be reported, in percent.
+    percentile_samples : int | None, default 100000
+        The number of finite samples kept for the percentiles, a uniform
+        random subset (reservoir) of all of them; the percentiles are exact
+        up to this many samples. None keeps every sample, for exact
+        percentiles with memory proportional to n.
+
+    Returns
+    -------
+    MonteCarloResult
+        The mean and standard deviation as a TypicalValueWithUncertainty,
+        the percentiles, the number of samples drawn and the number of
+        non-finite samples left out.
+
+    Raises
+    ------
+    ValueError
+        If fewer than two samples are finite.
+
+    Examples
+    --------
+    >>> x = lazy(Tvu(1.0, 0.5))
+    >>> result = monte_carlo(x ** 0.5, n=100000, seed=0)
+    >>> result.invalid
+    2261
+    >>> round(result.percentiles[50.0], 3)
+    1.006
+
+    """
+    if isinstance(f, Expression):
+        if inputs:
+            raise TypeError('Inputs are taken from the leaves of the expression')
+        f, inputs = _compile(f)
+    inputs = [x if isinstance(x, TypicalValueWithUncertainty) else TypicalValueWithUncertainty(x) for x in inputs]
+    t = np.array([float(x.T) for x in inputs])
+    u = np.array([float(x.U) for x in inputs])
+    sizes = [chunk_size] * (n // chunk_size) + ([n % chunk_size] if n % chunk_size else [])
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    seeds = root.spawn(len(sizes))
+    wave = processes or 1
+    acc = TvuAccumulator()
+    samples = _Reservoir(percentile_samples, root.spawn(1)[0])
+    drawn = 0
+    previous = None
+    with ProcessPoolExecutor(processes) if processes else _Serial() as executor:
+        for start in range(0, len(sizes), wave):
+            chunk_seeds, chunk_sizes = seeds[start:start + wave], sizes[start:start + wave]
+            for y in executor.map(_run_chunk, [f] * len(chunk_sizes), [t] * len(chunk_sizes), [u] * len(chunk_sizes), chunk_seeds, chunk_sizes):
+                drawn += len(y)
+                y = y[np.isfinite(y)]
+                acc.update(y)
+                samples.update(y)
+            if rtol is not None and acc.n > 1:
+                current = acc.mean, np.sqrt(acc.variance)
+                if previous is not None and max(abs(current[0] - previous[0]), abs(current[1] - previous[1])) <= rtol * current[1]:
+                    break
+                previous = current
+    tvu = TypicalValueWithUncertainty.from_parts(Dn(acc.mean), Dn(float(np.sqrt(acc.variance))))
+    values = np.percentile(samples.values(), percentiles)
+    return MonteCarloResult(tvu, dict(zip(percentiles, values.tolist())), drawn, drawn - acc.n)
+
+
+class _Serial:
+    """Runs the chunks in this process, with the interface of an executor."""
+
+    def __enter__(self): return self
+
+    def __exit__(self, *exc): return False
+
+    def map(self, fn, *iterables): return map(fn, *iterables)
+
+
+class _Reservoir:
+    """Keeps a uniform random subset of at most size samples: those with the smallest random keys."""
+    __slots__ = ('size', 'rng', 'samples', 'keys')
+
+    def __init__(self, size: int | None, seed: np.random.SeedSequence) -> None:
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.samples = []
+        self.keys = []
+
+    def update(self, y: np.ndarray) -> None:
+        self.samples.append(y)
+        if self.size is None:
+            return
+        self.keys.append(self.rng.random(len(y)))
+        if sum(len(k) for k in self.keys) > self.size:
+            samples, keys = np.concatenate(self.samples), np.concatenate(self.keys)
+            keep = np.argpartition(keys, self.size)[:self.size]
+            self.samples, self.keys = [samples[keep]], [keys[keep]]
+
+    def values(self) -> np.ndarray:
+        return np.concatenate(self.samples)
+
+
+class _Program:
+    """A picklable lazy expression: the operations in topological order over slots of values."""
+    __slots__ = ('steps',)
+
+    def __init__(self, steps: list[tuple[str, tuple[int, ...]]]) -> None:
+        self.steps = steps
+
+    def __getstate__(self): return self.steps
+
+    def __setstate__(self, steps): self.steps = steps
+
+    def __call__(self, *inputs: np.ndarray) -> np.ndarray:
+        values = []
+        for op, args in self.steps:
+            values.append(inputs[args[0]] if op == 'leaf' else _OPS[op](*(values[i] for i in args)))
+        return values[-1]
+
+
+def _compile(expr: Expression) -> tuple[_Program, list[TypicalValueWithUncertainty]]:
+    slots: dict[int, int] = {}
+    steps: list[tuple[str, tuple[int, ...]]] = []
+    leaves: list[TypicalValueWithUncertainty] = []
+    stack = [(expr, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in slots:
+            continue
+        if node.op == 'leaf':
+            steps.append(('leaf', (len(leaves),)))
+            leaves.append(node._value)
+        elif expanded:
+            steps.append((node.op, tuple(slots[id(a)] for a in node.args)))
+        else:
+            stack.append((node, True))
+            stack.extend((a, False) for a in reversed(node.args))
+            continue
+        slots[id(node)] = len(steps) - 1
+    return _Program(steps), leaves
+
+
+def _run_chunk(f, t: np.ndarray, u: np.ndarray, seed: np.random.SeedSequence, size: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    x = t[:, None] + u[:, None] * rng.standard_normal((len(t), size))
+    with np.errstate(all='ignore'):
+        y = f(*x)
+    return np.broadcast_to(np.asarray(y, dtype=np.float64), (size,))
@@ -0,0 +1,52 @@
+import numpy as np
+
+
+def mean_stderr(samples: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Calculates the mean and the standard error of each row.
+
+    Parameters
+    ----------
+    samples : np.ndarray
+        2-D array of repeated measurements, one quantity per row.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The means and the standard errors (ddof=1) of the rows.
+
+    Raises
+    ------
+    ValueError
+        If there are fewer than two measurements per row.
+
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    n = samples.shape[1]
+    if n < 2:
+        raise ValueError(f'At least two samples are required, got {n}')
+    t = samples.mean(axis=1)
+    d = samples - t[:, None]
+    u = np.sqrt(np.einsum('ij,ij->i', d, d) / (n - 1) / n)
+    return t, u
+
+
+def segments(keys: np.ndarray) -> np.ndarray:
+    """Finds the runs of equal keys in a sorted array.
+
+    Parameters
+    ----------
+    keys : np.ndarray
+        Non-empty 1-D array of sorted keys.
+
+    Returns
+    -------
+    np.ndarray
+        The index of the first key of each run, for np.add.reduceat.
+
+    Examples
+    --------
+    >>> segments(np.array([1, 1, 2, 5, 5, 5])).tolist()
+    [0, 2, 3]
+
+    """
+    return np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
@@ -0,0 +1,58 @@
+from typing import Sequence
+import numpy as np
+from ..decimal_value import Dn
+from .tvu_array import TVU_DTYPE, TvuArray
+from .typical_value_with_uncertainty import TypicalValueWithUncertainty
+
+
+def to_structured(values: TvuArray | Sequence[TypicalValueWithUncertainty] | TypicalValueWithUncertainty) -> np.ndarray | np.void:
+    """Converts typical values with uncertainties to the structured dtype TVU_DTYPE.
+
+    The result is an ordinary NumPy array of float64 pairs, so it can be
+    saved with np.save, mapped with np.memmap, fancy-indexed, concatenated
+    and sorted with np.sort(a, order='t') without object dtype.
+
+    Parameters
+    ----------
+    values : TvuArray | Sequence[TypicalValueWithUncertainty] | TypicalValueWithUncertainty
+        The values to be converted.
+
+    Returns
+    -------
+    np.ndarray | np.void
+        A 1-D array of TVU_DTYPE, or a single record for a single value.
+
+    Examples
+    --------
+    >>> a = to_structured([Tvu(2.0, 0.1), Tvu(1.0, 0.2)])
+    >>> np.sort(a, order='t')
+    array([(1., 0.2), (2., 0.1)], dtype=[('t', '<f8'), ('u', '<f8')])
+
+    """
+    if isinstance(values, TypicalValueWithUncertainty):
+        return np.array((float(values.T), float(values.U)), dtype=TVU_DTYPE)[()]
+    if not isinstance(values, TvuArray):
+        values = TvuArray(list(values))
+    return values.to_structured()
+
+
+def from_structured(a: np.ndarray | np.void) -> TvuArray | TypicalValueWithUncertainty:
+    """Converts an array or a record of TVU_DTYPE back, viewing arrays without copying.
+
+    Parameters
+    ----------
+    a : np.ndarray | np.void
+        A 1-D array of TVU_DTYPE, or one of its records.
+
+    Returns
+    -------
+    TvuArray | TypicalValueWithUncertainty
+        A TvuArray whose columns share the memory of a, see
+        TvuArray.from_structured, or a TypicalValueWithUncertainty for a record.
+
+    """
+    if isinstance(a, np.void):
+        if a.dtype != TVU_DTYPE:
+            raise TypeError(f'Expected a record of dtype {TVU_DTYPE}, got {a.dtype}')
+        return TypicalValueWithUncertainty.from_parts(Dn(float(a['t'])), Dn(float(a['u'])))
+    return TvuArray.from_structured(a)
@@ -0,0 +1,354 @@
+import numpy as np
+from ..decimal_value import Dn
+from . import correlation, propagation, ufuncs
+from .statistics import mean_stderr
+from .typical_value_with_uncertainty import TypicalValueWithUncertainty
+
+# the structured dtype of one typical value with its uncertainty, see TvuArray.from_structured
+TVU_DTYPE = np.dtype([('t', '<f8'), ('u', '<f8')])
+
+
+class TvuView(TypicalValueWithUncertainty):
+    """TvuView is a TypicalValueWithUncertainty which reads one element of a TvuArray.
+
+    The typical value and the uncertainty are read from the columns of the
+    array on access, so creating a view does not copy any data. An element
+    of an array made from columns is an independent source with a stable
+    ID, and an element of a derived array depends on the sources of its
+    inputs, so two views of the same element are fully correlated.
+
+    """
+    __slots__ = ('_base', '_i')
+
+    def __init__(self, base: 'TvuArray', i: int):
+        _set_base(self, base)
+        _set_i(self, i)
+
+    @property
+    def t(self) -> Dn: return Dn(float(self._base.t[self._i]))
+
+    @property
+    def u(self) -> Dn: return Dn(float(self._base.u[self._i]))
+
+    @property
+    def T(self) -> float: return float(self._base.t[self._i])
+
+    @property
+    def U(self) -> float: return float(self._base.u[self._i])
+
+    def _dependencies(self) -> correlation.Dependencies:
+        if self._base._terms is not None:
+            return correlation.array_element(self._base._terms, self._i)
+        u = self.U
+        if not u:
+            return correlation.EMPTY
+        return np.array([self._base._sources() + self._i], dtype=np.int64), np.array([u])
+
+
+_set_base = TvuView._base.__set__
+_set_i = TvuView._i.__set__
+
+
+class TvuArray:
+    """TvuArray is a class that represents an array of typical values with uncertainties.
+
+    Attributes
+    ----------
+    t : np.ndarray
+        The typical values (float64).
+    u : np.ndarray
+        The uncertainties (float64).
+
+    Properties
+    ----------
+    T : np.ndarray
+        The typical values.
+    U : np.ndarray
+        The uncertainties.
+
+    Notes
+    -----
+    Arithmetic works element by element. The elements of an array made
+    from columns (e.g. TvuArray(t, u)) are independent sources; an array
+    derived from others, by arithmetic, indexing, np.concatenate or from a
+    list of values, keeps the dependencies of its elements on their
+    sources, one float64 array per input term. So a * a, (2 * a)[0] - 2 * a[0]
+    and TvuArray([x])[0] - x account for the correlations, and a copy
+    TvuArray(a) is fully correlated with a.
+
+    An array of the structured dtype TVU_DTYPE can be viewed as a TvuArray
+    and back without copying, see from_structured. np.sort and np.argsort
+    order the elements by their typical values.
+
+    """
+    t: np.ndarray
+    u: np.ndarray
+    _source: int | None = None
+    _terms: list[correlation.ArrayTerm] | None = None
+    _records: np.ndarray | None = None
+
+    @property
+    def T(self) -> np.ndarray: return self.t
+
+    @property
+    def U(self) -> np.ndarray: return self.u
+
+    def __init__(self, *args):
+        if len(args) == 1:
+            arg1 = args[0]
+            if isinstance(arg1, TvuArray):
+                self.t = arg1.t.copy()
+                self.u = arg1.u.copy()
+                self._terms = arg1._terms if arg1._terms is not None else correlation.array_source(arg1._sources(), self.u)
+            elif isinstance(arg1, np.ndarray) and arg1.ndim == 2:
+                self.t, self.u = mean_stderr(arg1)
+            elif isinstance(arg1, np.ndarray) and arg1.ndim == 1:
+                self.t = arg1.astype(np.float64)
+                self.u = np.zeros(len(arg1))
+            elif isinstance(arg1, list | tuple):
+                tvus = [a if isinstance(a, TypicalValueWithUncertainty) else TypicalValueWithUncertainty(a) for a in arg1]
+                self.t = np.array([float(a.T) for a in tvus], dtype=np.float64)
+                self.u = np.array([float(a.U) for a in tvus], dtype=np.float64)
+                self._terms = correlation.array_from_maps([a._dependencies() for a in tvus])
+            else:
+                raise TypeError(f'Unsupported type: {type(arg1)}')
+        elif len(args) == 2:
+            t, u = np.broadcast_arrays(np.asarray(args[0], dtype=np.float64), np.asarray(args[1], dtype=np.float64))
+            if t.ndim != 1:
+                raise TypeError(f'Unsupported number of dimensions: {t.ndim}')
+            self.t = np.ascontiguousarray(t)
+            self.u = np.ascontiguousarray(np.abs(u))
+        else:
+            raise TypeError(f'Unsupported number of arguments: {len(args)}')
+
+    @classmethod
+    def from_columns(cls, t: np.ndarray, u: np.ndarray) -> 'TvuArray':
+        """from_columns is a method that wraps existing float64 columns without copying them."""
+        self = cls.__new__(cls)
+        self.t = t
+        self.u = u
+        return self
+
+    @classmethod
+    def from_structured(cls, a: np.ndarray) -> 'TvuArray':
+        """from_structured is a method that views a 1-D array of TVU_DTYPE as a TvuArray without copying.
+
+        The columns are the 't' and 'u' fields of a, so they share its memory,
+        e.g. of an np.memmap or of the result of np.load.
+
+        Parameters
+        ----------
+        a : np.ndarray
+            A 1-D array of TVU_DTYPE.
+        """
+        if not isinstance(a, np.ndarray) or a.dtype != TVU_DTYPE:
+            raise TypeError(f'Expected an array of dtype {TVU_DTYPE}, got {getattr(a, "dtype", type(a))}')
+        if a.ndim != 1:
+            raise TypeError(f'Unsupported number of dimensions: {a.ndim}')
+        self = cls.from_columns(a['t'], a['u'])
+        self._records = a
+        return self
+
+    # public methods
+    def to_structured(self) -> np.ndarray:
+        """to_structured is a method that returns the elements as a 1-D array of TVU_DTYPE.
+
+        An array made by from_structured returns the array it views;
+        otherwise the columns are interleaved into a new array.
+        """
+        if self._records is not None:
+            return self._records
+        a = np.empty(len(self), dtype=TVU_DTYPE)
+        a['t'] = self.t
+        a['u'] = self.u
+        return a
+
+    def tolist(self) -> list[TypicalValueWithUncertainty]:
+        return [
+            TypicalValueWithUncertainty._from_dependencies(Dn(t), Dn(u), TvuView(self, i)._dependencies())
+            for i, (t, u) in enumerate(zip(self.t.tolist(), self.u.tolist()))
+        ]
+
+    # private methods
+    def _sources(self) -> int:
+        """_sources is a method that returns the source ID of the first element, reserving one ID per element on first use."""
+        if self._source is None:
+            self._source = correlation.new_sources(len(self))
+        return self._source
+
+    def _dependency_terms(self) -> list[correlation.ArrayTerm]:
+        """_dependency_terms is a method that returns the dependencies of the elements as terms, see correlation.ArrayTerm."""
+        if self._terms is not None:
+            return self._terms
+        return correlation.array_source(self._sources(), self.u)
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield TvuView(self, i)
+
+    def __getitem__(self, key) -> 'TvuView | TvuArray':
+        if isinstance(key, int | np.integer):
+            if not -len(self) <= key < len(self):
+                raise IndexError(f'index {key} is out of bounds for TvuArray of length {len(self)}')
+            return TvuView(self, int(key) % len(self))
+        result = TvuArray.from_columns(self.t[key], self.u[key])
+        result._terms = correlation.array_take(self._dependency_terms(), key)
+        return result
+
+    # arithmetic: first-order propagation, element by element
+    def __add__(self, other): return _apply(propagation.d_add, self, other)
+
+    def __radd__(self, other): return _apply(propagation.d_add, other, self)
+
+    def __sub__(self, other): return _apply(propagation.d_sub, self, other)
+
+    def __rsub__(self, other): return _apply(propagation.d_sub, other, self)
+
+    def __mul__(self, other): return _apply(propagation.d_mul, self, other)
+
+    def __rmul__(self, other): return _apply(propagation.d_mul, other, self)
+
+    def __truediv__(self, other): return _apply(propagation.d_truediv, self, other)
+
+    def __rtruediv__(self, other): return _apply(propagation.d_truediv, other, self)
+
+    def __pow__(self, other): return _apply(propagation.d_power, self, other)
+
+    def __rpow__(self, other): return _apply(propagation.d_power, other, self)
+
+    def __neg__(self) -> 'TvuArray':
+        result = TvuArray.from_columns(-self.t, self.u.copy())
+        result._terms = correlation.array_combine(self._dependency_terms(), -1.0, [], 0.0)
+        return result
+
+    # NumPy protocols: ufuncs propagate element by element in one call per column
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or kwargs or not ufuncs.supports(ufunc):
+            return NotImplemented
+        if ufunc in _PARTIALS:
+            return _apply(_PARTIALS[ufunc], *inputs)
+        operands = [_operand(x) for x in inputs]
+        if any(x is None for x in operands):
+            return NotImplemented
+        y, *d = ufuncs.derivatives(ufunc, *(t for t, _ in operands))
+        if not d:
+            return y
+        return _from_derivatives(y, [(di, terms) for di, (_, terms) in zip(d, operands)])
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func not in _FUNCTIONS or not all(issubclass(t, TvuArray | np.ndarray) for t in types):
+            return NotImplemented
+        return _FUNCTIONS[func](*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f'TvuArray(t={self.t!r}, u={self.u!r})'
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(f'{t} ± {u}' for t, u in zip(self.t, self.u)) + ']'
+
+
+def _columns(x) -> tuple[np.ndarray | float, np.ndarray | float] | None:
+    if isinstance(x, TvuArray):
+        return x.t, x.u
+    if isinstance(x, TypicalValueWithUncertainty):
+        return float(x.T), float(x.U)
+    if isinstance(x, Dn | int | float | np.number):
+        return float(x), 0.0
+    if isinstance(x, np.ndarray) and x.ndim == 1 and x.dtype.kind in 'iuf':
+        return x.astype(np.float64, copy=False), 0.0
+    return None
+
+
+def _operand(x) -> tuple[np.ndarray | float, list[correlation.ArrayTerm]] | None:
+    """Returns the typical values of an operand and the terms of its dependencies."""
+    if isinstance(x, TvuArray):
+        return x.t, x._dependency_terms()
+    if isinstance(x, TypicalValueWithUncertainty):
+        return float(x.T), correlation.array_from_maps([x._dependencies()])
+    if isinstance(x, Dn | int | float | np.number):
+        return float(x), []
+    if isinstance(x, np.ndarray) and x.ndim == 1 and x.dtype.kind in 'iuf':
+        return x.astype(np.float64, copy=False), []
+    return None
+
+
+def _apply(partials, a, b) -> 'TvuArray':
+    """Evaluates partials on the typical values of two operands in one batch and propagates their dependencies."""
+    a, b = _operand(a), _operand(b)
+    if a is None or b is None:
+        return NotImplemented
+    t, da, db = partials(a[0], b[0])
+    return _from_derivatives(t, [(da, a[1]), (db, b[1])])
+
+
+_PARTIALS = {
+    np.add: propagation.d_add,
+    np.subtract: propagation.d_sub,
+    np.multiply: propagation.d_mul,
+    np.true_divide: propagation.d_truediv,
+    np.power: propagation.d_power,
+}
+
+
+def _from_derivatives(y, operands: list[tuple]) -> TvuArray:
+    """Builds the result of an element-wise function from its value and the (derivative, terms) pair of each input."""
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    n = len(y)
+    (da, a), (db, b) = operands if len(operands) == 2 else (operands[0], (0.0, []))
+    terms = correlation.array_combine(correlation.array_broadcast(a, n), da, correlation.array_broadcast(b, n), db)
+    result = TvuArray.from_columns(y, correlation.array_norm(terms, n))
+    result._terms = terms
+    return result
+
+
+_FUNCTIONS = {}
+
+
+def _implements(func):
+    def decorator(f):
+        _FUNCTIONS[func] = f
+        return f
+    return decorator
+
+
+@_implements(np.sum)
+def _sum(a: TvuArray, axis=None) -> TypicalValueWithUncertainty:
+    if axis not in (None, 0):
+        raise ValueError(f'axis {axis} is out of bounds for TvuArray')
+    ids, c = correlation.array_reduce(a._dependency_terms())
+    return TypicalValueWithUncertainty._from_dependencies(Dn(float(a.t.sum())), Dn(float(np.sqrt(c @ c))), (ids, c))
+
+
+@_implements(np.mean)
+def _mean(a: TvuArray, axis=None) -> TypicalValueWithUncertainty:
+    return _sum(a, axis) / len(a)
+
+
+@_implements(np.sort)
+def _sort(a: TvuArray, axis=-1, kind=None) -> TvuArray:
+    if axis not in (-1, 0, None):
+        raise ValueError(f'axis {axis} is out of bounds for TvuArray')
+    return a[np.argsort(a.t, kind=kind)]
+
+
+@_implements(np.argsort)
+def _argsort(a: TvuArray, axis=-1, kind=None) -> np.ndarray:
+    if axis not in (-1, 0, None):
+        raise ValueError(f'axis {axis} is out of bounds for TvuArray')
+    return np.argsort(a.t, kind=kind)
+
+
+@_implements(np.concatenate)
+def _concatenate(arrays, axis=0) -> TvuArray:
+    if axis != 0:
+        raise ValueError(f'axis {axis} is out of bounds for TvuArray')
+    columns = [_columns(x) for x in arrays]
+    if any(c is None or np.ndim(c[0]) != 1 for c in columns):
+        raise TypeError('Only TvuArray and 1-D arrays can be concatenated')
+    result = TvuArray.from_columns(np.concatenate([t for t, _ in columns]), np.concatenate([np.broadcast_to(u, np.shape(t)) for t, u in columns]))
+    parts = [x._dependency_terms() if isinstance(x, TvuArray) else [] for x in arrays]
+    result._terms = correlation.array_concatenate(parts, [len(t) for t, _ in columns])
+    return result
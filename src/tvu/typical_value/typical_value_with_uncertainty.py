@@ -1,6 +1,9 @@
-import math
+import operator
 import numpy as np
 from ..decimal_value import Dn
+from ..dispatch import TypeDispatcher
+from . import correlation, propagation, ufuncs
+from .statistics import mean_stderr
 
 
 class TypicalValueWithUncertainty:
@@ -18,7 +21,19 @@ class TypicalValueWithUncertainty:
     e : int
         The exponent of the typical value.
 
+    Notes
+    -----
+    Each value keeps a sparse map of the independent sources it depends on,
+    so arithmetic accounts for correlations: for a = Tvu(2.0, 0.1), a - a
+    has no uncertainty and a * b / a has the uncertainty of b. Values built
+    by the constructor or from_parts are new independent sources.
+
+    Instances are immutable: the fields cannot be assigned, so Tvu(a)
+    returns a itself rather than a copy; like a copy, it is fully
+    correlated with a.
+
     """
+    __slots__ = ('t', 'u', '_deps')
     t: Dn
     u: Dn
 
@@ -28,36 +43,186 @@ class TypicalValueWithUncertainty:
     @property
     def U(self) -> int | float | np.integer: return self.u.X
 
+    def __new__(cls, *args):
+        if len(args) == 1 and type(args[0]) is cls:
+            return args[0]
+        return object.__new__(cls)
+
     def __init__(self, *args):
+        if len(args) == 1 and args[0] is self:
+            return
+        deps = None
         if len(args) == 1:
-            arg1 = args[0]
-            if isinstance(arg1, Dn):
-                self.t = arg1
-                self.u = Dn(0)
-            elif isinstance(arg1, TypicalValueWithUncertainty):
-                self.t = arg1.t
-                self.u = arg1.u
-            elif not isinstance(arg1, np.floating) and isinstance(arg1, int | float | np.integer):
-                self.t = Dn(arg1)
-                self.u = Dn(0)
-            elif isinstance(arg1, np.ndarray) and arg1.ndim == 1:
-                self.t = Dn(np.average(arg1))
-                self.u = Dn(np.std(arg1, ddof=1) / math.sqrt(len(arg1)))
-            else:
-                raise TypeError(f'Unsupported type: {type(arg1)}')
+            t, u = _INIT.lookup(type(args[0]))(args[0])
+            if isinstance(args[0], TypicalValueWithUncertainty):
+                deps = args[0]._dependencies()
         elif len(args) == 2:
-            arg1, arg2 = args
-            if isinstance(arg1, Dn):
-                self.t = arg1
-            elif not isinstance(arg1, np.floating) and isinstance(arg1, int | float | np.integer):
-                self.t = Dn(arg1)
-            else:
-                raise TypeError(f'Unsupported type: {type(arg1)}')
-            if isinstance(arg2, Dn):
-                self.u = arg2
-            elif not isinstance(arg2, np.floating) and isinstance(arg2, int | float | np.integer):
-                self.u = Dn(arg2)
-            else:
-                raise TypeError(f'Unsupported type: {type(arg2)}')
+            t = _VALUE.lookup(type(args[0]))(args[0])
+            u = _VALUE.lookup(type(args[1]))(args[1])
         else:
             raise TypeError(f'Unsupported number of arguments: {len(args)}')
+        _set_t(self, t)
+        _set_u(self, u)
+        _set_deps(self, deps)
+
+    @classmethod
+    def from_parts(cls, t: Dn, u: Dn) -> 'TypicalValueWithUncertainty':
+        """from_parts is a method that builds a TypicalValueWithUncertainty without validation.
+
+        Parameters
+        ----------
+        t : DecimalNumber
+            The typical value.
+        u : DecimalNumber
+            The uncertainty.
+        """
+        return cls._from_dependencies(t, u, None)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"TypicalValueWithUncertainty is immutable, cannot set {name!r}")
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError(f"TypicalValueWithUncertainty is immutable, cannot delete {name!r}")
+
+    # private methods
+    @classmethod
+    def _from_dependencies(cls, t: Dn, u: Dn, deps: correlation.Dependencies | None) -> 'TypicalValueWithUncertainty':
+        """_from_dependencies is a method that builds a TypicalValueWithUncertainty with a dependency map, or a new source if None."""
+        self = object.__new__(cls)
+        _set_t(self, t)
+        _set_u(self, u)
+        _set_deps(self, deps)
+        return self
+
+    def _dependencies(self) -> correlation.Dependencies:
+        """_dependencies is a method that returns the sparse dependency map, registering the value as a source on first use."""
+        if self._deps is None:
+            _set_deps(self, correlation.source(float(self.u)))
+        return self._deps
+
+    # arithmetic: first-order propagation through the dependency maps
+    def __add__(self, other): return _apply(propagation.d_add, Dn.__add__, self, other)
+
+    def __radd__(self, other): return _apply(propagation.d_add, Dn.__add__, other, self)
+
+    def __sub__(self, other): return _apply(propagation.d_sub, Dn.__sub__, self, other)
+
+    def __rsub__(self, other): return _apply(propagation.d_sub, Dn.__sub__, other, self)
+
+    def __mul__(self, other): return _apply(propagation.d_mul, Dn.__mul__, self, other)
+
+    def __rmul__(self, other): return _apply(propagation.d_mul, Dn.__mul__, other, self)
+
+    def __truediv__(self, other): return _apply(propagation.d_truediv, Dn.__truediv__, self, other)
+
+    def __rtruediv__(self, other): return _apply(propagation.d_truediv, Dn.__truediv__, other, self)
+
+    def __pow__(self, other): return _apply(propagation.d_power, None, self, other)
+
+    def __rpow__(self, other): return _apply(propagation.d_power, None, other, self)
+
+    def __neg__(self) -> 'TypicalValueWithUncertainty':
+        ids, c = self._dependencies()
+        return TypicalValueWithUncertainty._from_dependencies(-self.t, self.u, (ids, -c))
+
+    def __str__(self) -> str:
+        return self.__format__('console')
+
+    def __format__(self, format_spec) -> str:
+        """Formats with format_tvu; format_spec is 'console', 'latex' or 'plain'."""
+        from .formatting import format_tvu
+        return format_tvu(self, format_spec or 'console')
+
+    # NumPy ufuncs: propagation with the derivatives of the ufunc
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or kwargs or not ufuncs.supports(ufunc):
+            return NotImplemented
+        if any(isinstance(x, np.ndarray) for x in inputs):
+            # broadcast against the array as a TvuArray of length one
+            from .tvu_array import TvuArray
+            return ufunc(*(TvuArray([x]) if isinstance(x, TypicalValueWithUncertainty) else x for x in inputs))
+        inputs = [float(x) if isinstance(x, np.floating) else x for x in inputs]
+        if ufunc in _OPERATORS:
+            return _OPERATORS[ufunc](*inputs)
+        try:
+            operands = [_OPERAND.lookup(type(x))(x) for x in inputs]
+        except TypeError:
+            return NotImplemented
+        y, *d = ufuncs.derivatives(ufunc, *(float(t) for t, _ in operands))
+        if not d:
+            return y
+        if len(d) == 1:
+            ids, c = correlation.combine(operands[0][1], d[0], correlation.EMPTY, 0.0)
+        else:
+            ids, c = correlation.combine(operands[0][1], d[0], operands[1][1], d[1])
+        u = float(np.sqrt(c @ c))
+        _check_domain(ufunc.__name__, [t for t, _ in operands], float(y), u)
+        return TypicalValueWithUncertainty._from_dependencies(Dn(float(y)), Dn(u), (ids, c))
+
+
+_set_t = TypicalValueWithUncertainty.t.__set__
+_set_u = TypicalValueWithUncertainty.u.__set__
+_set_deps = TypicalValueWithUncertainty._deps.__set__
+
+_VALUE = TypeDispatcher('TypicalValueWithUncertainty value')
+_VALUE.reject(np.floating)
+_VALUE.register(Dn)(lambda x: x)
+_VALUE.register(int, float)(Dn.interned)
+_VALUE.register(np.integer)(Dn)
+
+_INIT = TypeDispatcher('TypicalValueWithUncertainty')
+_INIT.reject(np.floating)
+
+
+@_INIT.register(Dn, int, float, np.integer)
+def _init_value(x: Dn | int | float | np.integer) -> tuple[Dn, Dn]:
+    return _VALUE.lookup(type(x))(x), Dn.interned(0)
+
+
+@_INIT.register(TypicalValueWithUncertainty)
+def _init_copy(x: TypicalValueWithUncertainty) -> tuple[Dn, Dn]:
+    return x.t, x.u
+
+
+@_INIT.register(np.ndarray)
+def _init_ndarray(x: np.ndarray) -> tuple[Dn, Dn]:
+    if x.ndim != 1:
+        raise TypeError(f'Unsupported number of dimensions: {x.ndim}')
+    t, u = mean_stderr(x[None, :])
+    return Dn(float(t[0])), Dn(float(u[0]))
+
+
+_OPERATORS = {
+    np.add: operator.add,
+    np.subtract: operator.sub,
+    np.multiply: operator.mul,
+    np.true_divide: operator.truediv,
+    np.power: operator.pow,
+    np.negative: operator.neg,
+}
+
+_OPERAND = TypeDispatcher('TypicalValueWithUncertainty operand')
+_OPERAND.reject(np.floating)
+_OPERAND.register(TypicalValueWithUncertainty)(lambda x: (x.t, x._dependencies()))
+_OPERAND.register(Dn, int, float, np.integer)(lambda x: (_VALUE.lookup(type(x))(x), correlation.EMPTY))
+
+
+def _apply(partials, exact, a, b) -> TypicalValueWithUncertainty:
+    """Evaluates partials on two operands; exact computes the typical value in decimal arithmetic if given."""
+    try:
+        ta, deps_a = _OPERAND.lookup(type(a))(a)
+        tb, deps_b = _OPERAND.lookup(type(b))(b)
+    except TypeError:
+        return NotImplemented
+    t, da, db = partials(float(ta), float(tb))
+    ids, c = correlation.combine(deps_a, da, deps_b, db)
+    u = float(np.sqrt(c @ c))
+    _check_domain(partials.__name__.removeprefix('d_'), (ta, tb), float(t) if exact is None else 0.0, u)
+    return TypicalValueWithUncertainty._from_dependencies(Dn(float(t)) if exact is None else exact(ta, tb), Dn(u), (ids, c))
+
+
+def _check_domain(name: str, operands, t: float, u: float) -> None:
+    """Raises a domain error naming the operation if its typical value or uncertainty is not finite."""
+    if not (np.isfinite(t) and np.isfinite(u)):
+        args = ', '.join(str(float(x)) for x in operands)
+        raise ValueError(f'math domain error: {name}({args}) gives {t} with uncertainty {u}')
@@ -0,0 +1,107 @@
+"""Derivatives of NumPy ufuncs for first-order propagation.
+
+The derivatives of common ufuncs are given in closed form. Any other
+float ufunc is differentiated numerically: by the complex step if it has a
+complex loop, otherwise by central differences. Every function works on
+floats and on float64 arrays alike, so one call propagates a whole column.
+"""
+import numpy as np
+from . import propagation
+
+# unary ufuncs: derivative as a function of the input x and the output y
+_UNARY = {
+    np.negative: lambda x, y: -1.0,
+    np.positive: lambda x, y: 1.0,
+    np.absolute: lambda x, y: np.sign(x),
+    np.sqrt: lambda x, y: 0.5 / y,
+    np.cbrt: lambda x, y: 1.0 / (3.0 * y * y),
+    np.square: lambda x, y: 2.0 * x,
+    np.reciprocal: lambda x, y: -y * y,
+    np.exp: lambda x, y: y,
+    np.exp2: lambda x, y: y * np.log(2.0),
+    np.expm1: lambda x, y: y + 1.0,
+    np.log: lambda x, y: 1.0 / x,
+    np.log2: lambda x, y: 1.0 / (x * np.log(2.0)),
+    np.log10: lambda x, y: 1.0 / (x * np.log(10.0)),
+    np.log1p: lambda x, y: 1.0 / (1.0 + x),
+    np.sin: lambda x, y: np.cos(x),
+    np.cos: lambda x, y: -np.sin(x),
+    np.tan: lambda x, y: 1.0 + y * y,
+    np.arcsin: lambda x, y: 1.0 / np.sqrt(1.0 - x * x),
+    np.arccos: lambda x, y: -1.0 / np.sqrt(1.0 - x * x),
+    np.arctan: lambda x, y: 1.0 / (1.0 + x * x),
+    np.sinh: lambda x, y: np.cosh(x),
+    np.cosh: lambda x, y: np.sinh(x),
+    np.tanh: lambda x, y: 1.0 - y * y,
+    np.arcsinh: lambda x, y: 1.0 / np.sqrt(x * x + 1.0),
+    np.arccosh: lambda x, y: 1.0 / np.sqrt(x * x - 1.0),
+    np.arctanh: lambda x, y: 1.0 / (1.0 - x * x),
+    np.deg2rad: lambda x, y: np.pi / 180.0,
+    np.rad2deg: lambda x, y: 180.0 / np.pi,
+    np.floor: lambda x, y: 0.0,
+    np.ceil: lambda x, y: 0.0,
+    np.trunc: lambda x, y: 0.0,
+    np.rint: lambda x, y: 0.0,
+}
+_UNARY[np.radians] = _UNARY[np.deg2rad]
+_UNARY[np.degrees] = _UNARY[np.rad2deg]
+
+# binary ufuncs: the value and both partial derivatives
+_BINARY = {
+    np.add: propagation.d_add,
+    np.subtract: propagation.d_sub,
+    np.multiply: propagation.d_mul,
+    np.true_divide: propagation.d_truediv,
+    np.power: propagation.d_power,
+    np.float_power: propagation.d_power,
+    np.arctan2: lambda y, x: (np.arctan2(y, x), x / (x * x + y * y), -y / (x * x + y * y)),
+    np.hypot: lambda x, y: (lambda h: (h, x / h, y / h))(np.hypot(x, y)),
+}
+
+_COMPLEX_STEP = 1e-20
+
+
+def supports(ufunc: np.ufunc) -> bool:
+    """Tells whether derivatives of ufunc can be propagated."""
+    return ufunc.nout == 1 and ufunc.nin in (1, 2)
+
+
+def derivatives(ufunc: np.ufunc, *x):
+    """Evaluates ufunc with its partial derivatives.
+
+    Parameters
+    ----------
+    ufunc : np.ufunc
+        A ufunc with one or two inputs and one output.
+    *x : float | np.ndarray
+        The typical values of the inputs.
+
+    Returns
+    -------
+    tuple
+        The value followed by one partial derivative per input. For a
+        ufunc whose output is not a float, e.g. a comparison, only the
+        value is returned.
+
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if len(x) == 1 and ufunc in _UNARY:
+            y = ufunc(x[0])
+            return y, _UNARY[ufunc](x[0], y)
+        if len(x) == 2 and ufunc in _BINARY:
+            return _BINARY[ufunc](*x)
+        y = ufunc(*x)
+        if np.asarray(y).dtype.kind != 'f':
+            return (y,)
+        return (y, *(_numeric(ufunc, x, i) for i in range(len(x))))
+
+
+def _numeric(ufunc: np.ufunc, x: tuple, i: int):
+    if any(t[-1] == 'D' and t.startswith('D' * ufunc.nin) for t in ufunc.types):
+        shifted = list(x)
+        shifted[i] = x[i] + 1j * _COMPLEX_STEP
+        return ufunc(*shifted).imag / _COMPLEX_STEP
+    h = 1e-7 * np.maximum(1.0, np.abs(x[i]))
+    up, down = list(x), list(x)
+    up[i], down[i] = x[i] + h, x[i] - h
+    return (ufunc(*up) - ufunc(*down)) / (2 * h)
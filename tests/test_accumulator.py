@@ -0,0 +1,70 @@
+import math
+import pickle
+import pytest
+import numpy as np
+from tvu import Tvu, TvuAccumulator
+
+
+class TestTvuAccumulator:
+    """Test TvuAccumulator"""
+
+    samples = np.random.default_rng(0).normal(1e6, 3.0, 10_000)
+
+    def __assert_matches(self, acc, samples):
+        assert acc.n == len(samples)
+        assert acc.mean == pytest.approx(np.mean(samples), rel=1e-12)
+        assert acc.variance == pytest.approx(np.var(samples, ddof=1), rel=1e-9)
+        assert acc.stderr == pytest.approx(np.std(samples, ddof=1) / math.sqrt(len(samples)), rel=1e-9)
+
+    def test_update_scalar(self):
+        acc = TvuAccumulator()
+        for v in self.samples.tolist(): acc.update(v)
+        self.__assert_matches(acc, self.samples)
+
+    def test_update_numpy_scalar(self):
+        acc = TvuAccumulator()
+        for v in self.samples[:100]: acc.update(v)
+        self.__assert_matches(acc, self.samples[:100])
+        assert type(acc.mean) is float
+        assert float(acc.tvu().T) == pytest.approx(np.mean(self.samples[:100]), rel=1e-12)
+
+    @pytest.mark.parametrize('key, size', [('1', 1), ('7', 7), ('1000', 1000), ('10000', 10_000)])
+    def test_update_chunks(self, key, size):
+        acc = TvuAccumulator()
+        for i in range(0, len(self.samples), size): acc.update(self.samples[i:i + size])
+        self.__assert_matches(acc, self.samples)
+
+    def test_update_mixed(self):
+        acc = TvuAccumulator()
+        acc.update(np.array([[1, 2], [3, 4]]))
+        acc.update(5)
+        acc.update(np.int64(6))
+        acc.update(np.array([]))
+        self.__assert_matches(acc, np.arange(1.0, 7.0))
+
+    def test_merge(self):
+        workers = [TvuAccumulator() for _ in range(4)]
+        for acc, chunk in zip(workers, np.array_split(self.samples, 4)): acc.update(chunk)
+        workers = [pickle.loads(pickle.dumps(acc)) for acc in workers]
+        total = TvuAccumulator()
+        for acc in workers: total.merge(acc)
+        total.merge(TvuAccumulator())
+        self.__assert_matches(total, self.samples)
+        assert workers[0].n == 2500
+
+    def test_tvu(self):
+        acc = TvuAccumulator()
+        acc.update(self.samples)
+        expected = Tvu(self.samples)
+        tvu = acc.tvu()
+        assert tvu.T == pytest.approx(expected.T, rel=1e-12)
+        assert tvu.U == pytest.approx(expected.U, rel=1e-9)
+
+    def test___slots__(self):
+        assert not hasattr(TvuAccumulator(), '__dict__')
+
+    def test_raise(self):
+        acc = TvuAccumulator()
+        acc.update(1.0)
+        with pytest.raises(ValueError): acc.tvu()
+        with pytest.raises(TypeError): acc.merge(Tvu(1.0))
@@ -0,0 +1,54 @@
+import json
+import pytest
+from tvu.bench import suite
+from tvu.bench.__main__ import main
+
+
+class TestSuite:
+    """Test the benchmark suite"""
+
+    def test_cases(self):
+        cases = suite.cases(max_size=1000)
+        assert {key.split('/')[0] for key in cases} == set(suite.GROUPS)
+        assert 'arrays/Tvu(float64[10])' in cases and 'arrays/Tvu(float64[1000])' in cases
+        assert 'arrays/Tvu(float64[10000])' not in cases
+        for f in cases.values():
+            f()
+
+    def test_memory(self):
+        report = suite.run(('memory',), pattern='Dn(int)', max_size=1000)
+        assert suite.unit('memory/Dn(int)') == 'bytes' and suite.unit('power/int_power(10^0+1)') == 'ns'
+        assert 32 < report['results']['memory/Dn(int)'] < 1000
+
+    def test_run(self):
+        report = suite.run(('power',), pattern='int_power(10^', repeat=1, min_time=0)
+        assert report['format'] == suite.FORMAT
+        assert len(report['results']) == 6 and all(ns > 0 for ns in report['results'].values())
+
+    @pytest.mark.parametrize('key, ns, expected', [
+        ('faster', 50.0, {}),
+        ('within', 120.0, {}),
+        ('slower', 150.0, {'a': 1.5}),
+    ])
+    def test_compare(self, key, ns, expected):
+        baseline = {'format': suite.FORMAT, 'version': suite.VERSION, 'results': {'a': 100.0, 'b': 100.0}}
+        report = {'results': {'a': ns, 'c': 1000.0}}
+        assert suite.compare(report, baseline, threshold=0.25) == expected
+
+    @pytest.mark.parametrize('key, groups', [
+        ('group', ('constructors', 'unknown')),
+    ])
+    def test_raise(self, key, groups):
+        with pytest.raises(ValueError): suite.cases(groups)
+        with pytest.raises(ValueError): suite.compare({'results': {}}, {'results': {}})
+
+    def test_main(self, tmp_path, capsys):
+        output, baseline = tmp_path / 'report.json', tmp_path / 'baseline.json'
+        args = ['power', '-k', 'int_power(10^0', '--repeat', '1', '--min-time', '0', '-q']
+        assert main([*args, '-o', str(output)]) == 0
+        report = json.loads(output.read_text())
+        assert list(report['results']) == ['power/int_power(10^0+1)']
+        report['results']['power/int_power(10^0+1)'] = 1e-3  # the baseline was impossibly fast
+        baseline.write_text(json.dumps(report))
+        assert main([*args, '-b', str(baseline)]) == 1
+        assert 'REGRESSION power/int_power(10^0+1)' in capsys.readouterr().err
@@ -0,0 +1,100 @@
+import pytest
+import numpy as np
+from tvu import ColumnarWriter, DecimalArray, Dn, Tvu, TvuArray, load_columnar, open_columns, save_columnar
+
+BIG = 123456789012345678901234567890123456789012345678901234567890
+
+
+class TestColumnar:
+    """Test save_columnar, load_columnar and open_columns"""
+
+    @pytest.mark.parametrize('key, values', [
+        ('int64', DecimalArray([Dn(15, -1), Dn(-7), Dn(0, 3), Dn(12345678, -20)])),
+        ('overflow', DecimalArray([Dn(15, -1), Dn(-BIG, -5), Dn(3), Dn(10 ** 19 + 1, 2)])),
+        ('empty', DecimalArray([])),
+        ('strings', ['1.5', '-2e3', '0.001']),
+    ])
+    def test_decimal(self, key, values, tmp_path):
+        save_columnar(tmp_path / 'ds', values)
+        result = load_columnar(tmp_path / 'ds')
+        expected = values if isinstance(values, DecimalArray) else DecimalArray(values)
+        assert isinstance(result, DecimalArray)
+        assert [(d.s, d.x, d.e) for d in result] == [(d.s, d.x, d.e) for d in expected]
+
+    def test_memmap(self, tmp_path):
+        save_columnar(tmp_path, DecimalArray(np.arange(1000) * 0.5))
+        result = load_columnar(tmp_path)
+        assert isinstance(result.s, np.memmap) and isinstance(result.x, np.memmap) and isinstance(result.e, np.memmap)
+        assert result[500] == Dn(250)
+        assert (result[10:12] == DecimalArray([5, 5.5])).all()
+        with pytest.raises(ValueError): result.x[0] = 1
+
+    def test_tvu(self, tmp_path):
+        values = [Tvu(Dn('1.25'), Dn('0.05')), Tvu(-3, 1), Tvu(Dn(BIG, -50), Dn(1, -60))]
+        save_columnar(tmp_path, values)
+        columns = open_columns(tmp_path)
+        assert columns['t'].tolist() == [v.t for v in values]
+        assert columns['u'].tolist() == [v.u for v in values]
+        result = load_columnar(tmp_path)
+        assert isinstance(result, TvuArray)
+        assert result.T.tolist() == pytest.approx([1.25, -3.0, BIG * 1e-50])
+
+    def test_tvu_array(self, tmp_path):
+        values = TvuArray([1.5, -0.1, 2e300], [0.1, 0.0, 1e299])
+        save_columnar(tmp_path, values)
+        result = load_columnar(tmp_path)
+        assert result.T.tolist() == values.T.tolist()
+        assert result.U.tolist() == values.U.tolist()
+
+    def test_incomplete(self, tmp_path):
+        with pytest.raises(ValueError): load_columnar(tmp_path)
+        (tmp_path / 'header.json').write_text('{"format": "other"}')
+        with pytest.raises(ValueError): load_columnar(tmp_path)
+
+
+class TestColumnarWriter:
+    """Test ColumnarWriter"""
+
+    def test_write(self, tmp_path):
+        chunks = [DecimalArray([1.5, -2]), [Dn(BIG), Dn(7)], DecimalArray([]), ['0.25'], [Dn(-BIG, 3)]]
+        with ColumnarWriter(tmp_path, 'decimal') as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+            assert writer.length == 6
+        result = load_columnar(tmp_path)
+        assert result.tolist() == [Dn(1.5), Dn(-2), Dn(BIG), Dn(7), Dn('0.25'), Dn(-BIG, 3)]
+
+    def test_write_tvu(self, tmp_path):
+        with ColumnarWriter(tmp_path, 'tvu') as writer:
+            writer.write(TvuArray([1.0, 2.0], [0.1, 0.2]))
+            writer.write([Tvu(3.0, 0.3)])
+        result = load_columnar(tmp_path)
+        assert result.T.tolist() == [1.0, 2.0, 3.0]
+        assert result.U.tolist() == [0.1, 0.2, 0.3]
+
+    def test_overwrite(self, tmp_path):
+        save_columnar(tmp_path, DecimalArray([1, 2, 3]))
+        save_columnar(tmp_path, DecimalArray([4]))
+        assert load_columnar(tmp_path).tolist() == [Dn(4)]
+
+    def test_exception(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            with ColumnarWriter(tmp_path) as writer:
+                writer.write([1, 2])
+                raise RuntimeError
+        with pytest.raises(ValueError): load_columnar(tmp_path)
+
+    def test_closed(self, tmp_path):
+        writer = ColumnarWriter(tmp_path)
+        writer.close()
+        with pytest.raises(ValueError): writer.write([1])
+
+    @pytest.mark.parametrize('key, kind, values, error', [
+        ('kind', 'float', None, ValueError),
+        ('tvu in decimal', 'decimal', [Tvu(1, 0.1)], TypeError),
+        ('decimal in tvu', 'tvu', [Dn(1)], TypeError),
+    ])
+    def test_raise(self, key, kind, values, error, tmp_path):
+        with pytest.raises(error):
+            with ColumnarWriter(tmp_path, kind) as writer:
+                writer.write(values)
@@ -0,0 +1,125 @@
+import pytest
+import numpy as np
+from tvu import Tvu, TvuArray, covariance_matrix, correlation_matrix
+from tvu.typical_value import correlation
+
+
+class TestCombine:
+    """Test correlation.combine"""
+
+    @pytest.mark.parametrize('key, a, b, expected', [
+        ('disjoint', ([1, 3], [1.0, 2.0]), ([4, 9], [3.0, 4.0]), ([1, 3, 4, 9], [2.0, 4.0, -3.0, -4.0])),
+        ('disjoint reversed', ([4, 9], [3.0, 4.0]), ([1, 3], [1.0, 2.0]), ([1, 3, 4, 9], [-1.0, -2.0, 6.0, 8.0])),
+        ('interleaved', ([1, 4, 7], [1.0, 1.0, 1.0]), ([2, 4, 8], [1.0, 1.0, 1.0]), ([1, 2, 4, 7, 8], [2.0, -1.0, 1.0, 2.0, -1.0])),
+        ('cancel', ([1, 2], [1.0, 2.0]), ([2], [4.0]), ([1], [2.0])),
+        ('empty', ([], []), ([5], [1.0]), ([5], [-1.0])),
+    ])
+    def test_combine(self, key, a, b, expected):
+        a = np.array(a[0], dtype=np.int64), np.array(a[1])
+        b = np.array(b[0], dtype=np.int64), np.array(b[1])
+        ids, c = correlation.combine(a, 2.0, b, -1.0)
+        assert ids.tolist() == expected[0]
+        assert c.tolist() == expected[1]
+
+    def test_combine_same(self):
+        a = np.array([3, 5], dtype=np.int64), np.array([1.0, 2.0])
+        ids, c = correlation.combine(a, 2.0, a, -2.0)
+        assert len(ids) == len(c) == 0
+
+
+class TestCorrelatedArithmetic:
+    """Test the propagation of correlated TypicalValueWithUncertainty"""
+
+    @pytest.mark.parametrize('key, f, expected', [
+        ('a - a', lambda a, b: a - a, 0.0),
+        ('a / a', lambda a, b: a / a, 0.0),
+        ('a * b / a', lambda a, b: a * b / a, 0.2),
+        ('a + a', lambda a, b: a + a, 0.2),
+        ('a * a', lambda a, b: a * a, 0.4),
+        ('a - Tvu(a)', lambda a, b: a - Tvu(a), 0.0),
+        ('(a + b) - b', lambda a, b: (a + b) - b, 0.1),
+        ('-a + a', lambda a, b: -a + a, 0.0),
+    ])
+    def test_uncertainty(self, key, f, expected):
+        assert float(f(Tvu(2.0, 0.1), Tvu(3.0, 0.2)).U) == pytest.approx(expected, abs=1e-15)
+
+    def test_view(self):
+        arr = TvuArray([2.0, 3.0], [0.1, 0.2])
+        assert float((arr[0] - arr[0]).U) == 0.0
+        assert float((arr[0] * arr[1] / arr[0]).U) == pytest.approx(0.2)
+
+    def test_array_self(self):
+        arr = TvuArray([2.0, 3.0], [0.1, 0.2])
+        assert (arr - arr).u.tolist() == [0.0, 0.0]
+        assert (arr * arr).u.tolist() == pytest.approx([0.4, 1.2])
+
+    @pytest.mark.parametrize('key, f, expected', [
+        ('(x * 2)[0] - 2 * x[0]', lambda x, a: (x * 2)[0] - 2 * x[0], 0.0),
+        ('TvuArray([a])[0] - a', lambda x, a: TvuArray([a])[0] - a, 0.0),
+        ('TvuArray([a, x[1]])[1] - x[1]', lambda x, a: TvuArray([a, x[1]])[1] - x[1], 0.0),
+        ('(x + a)[1] - a', lambda x, a: (x + a)[1] - a, 0.2),
+        ('(-x)[0] + x[0]', lambda x, a: (-x)[0] + x[0], 0.0),
+        ('x[1:][0] - x[1]', lambda x, a: x[1:][0] - x[1], 0.0),
+        ('np.sort(x * 1)[0] - x[0]', lambda x, a: np.sort(x * 1)[0] - x[0], 0.0),
+        ('np.concatenate([x, x])[2] - x[0]', lambda x, a: np.concatenate([x, x])[2] - x[0], 0.0),
+        ('np.sin(x)[0] - np.sin(x[0])', lambda x, a: np.sin(x)[0] - np.sin(x[0]), 0.0),
+        ('x.tolist()[1] - x[1]', lambda x, a: x.tolist()[1] - x[1], 0.0),
+        ('TvuArray(x)[0] - x[0]', lambda x, a: TvuArray(x)[0] - x[0], 0.0),
+        ('np.sum(x * 2) - 2 * np.sum(x)', lambda x, a: np.sum(x * 2) - 2 * np.sum(x), 0.0),
+    ])
+    def test_array_derived(self, key, f, expected):
+        x, a = TvuArray([2.0, 3.0], [0.1, 0.2]), Tvu(2.0, 0.1)
+        assert float(f(x, a).U) == pytest.approx(expected, abs=1e-15)
+
+    @pytest.mark.parametrize('key, f, expected', [
+        ('x[1:] - x[:-1]', lambda x: x[1:] - x[:-1], [np.hypot(0.1, 0.2), np.hypot(0.2, 0.3)]),
+        ('x[::2] - x[:2]', lambda x: x[::2] - x[:2], [0.0, np.hypot(0.3, 0.2)]),
+        ('2 * x - x', lambda x: 2 * x - x, [0.1, 0.2, 0.3]),
+        ('x ** 2 / x', lambda x: x ** 2 / x, [0.1, 0.2, 0.3]),
+    ])
+    def test_array_overlap(self, key, f, expected):
+        x = TvuArray([1.0, 2.0, 3.0], [0.1, 0.2, 0.3])
+        assert f(x).u.tolist() == pytest.approx(expected, abs=1e-15)
+
+    def test_array_covariance(self):
+        x = TvuArray([2.0, 3.0], [0.1, 0.2])
+        y = x * 2
+        assert covariance_matrix([y[0], x[0], y[1]]) == pytest.approx(np.array([
+            [0.04, 0.02, 0.0],
+            [0.02, 0.01, 0.0],
+            [0.0, 0.0, 0.16],
+        ]))
+
+    def test_long_sum(self):
+        values = [Tvu(1.0, 0.01) for _ in range(2000)]
+        total = values[0]
+        for v in values[1:]: total = total + v
+        assert float(total.U) == pytest.approx(0.01 * np.sqrt(2000))
+        assert float((total - values[0]).U) == pytest.approx(0.01 * np.sqrt(1999))
+
+
+class TestCovarianceMatrix:
+    """Test covariance_matrix and correlation_matrix"""
+
+    def test_covariance_matrix(self):
+        a, b = Tvu(2.0, 0.1), Tvu(3.0, 0.2)
+        covariance = covariance_matrix([a, 2 * a, a + b, b, Tvu(1)])
+        expected = np.array([
+            [0.01, 0.02, 0.01, 0.00, 0.0],
+            [0.02, 0.04, 0.02, 0.00, 0.0],
+            [0.01, 0.02, 0.05, 0.04, 0.0],
+            [0.00, 0.00, 0.04, 0.04, 0.0],
+            [0.00, 0.00, 0.00, 0.00, 0.0],
+        ])
+        assert covariance == pytest.approx(expected)
+
+    def test_correlation_matrix(self):
+        a, b = Tvu(2.0, 0.1), Tvu(3.0, 0.2)
+        correlation = correlation_matrix([a, -a, a + b, Tvu(1)])
+        assert correlation[0, 1] == pytest.approx(-1.0)
+        assert correlation[0, 2] == pytest.approx(0.1 / np.sqrt(0.05))
+        assert correlation[3].tolist() == [0.0, 0.0, 0.0, 1.0]
+        assert np.diag(correlation).tolist() == [1.0, 1.0, 1.0, 1.0]
+
+    def test_empty(self):
+        assert covariance_matrix([]).shape == (0, 0)
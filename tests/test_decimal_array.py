@@ -0,0 +1,203 @@
+import pytest
+import numpy as np
+from tvu.decimal_value import DECIMAL_DTYPE, Dn, DecimalArray
+
+
+VALUES = [0, 1, -1, 123, -1234567890, 1000000000000000000, 12.3, -12345.6789, 0.001,
+          123456789012345678901234567890123456789012345678901234567890123456789012345678901234567890]
+
+
+class TestDecimalArray_constructor:
+    """Test DecimalArray.__init__"""
+
+    @pytest.mark.parametrize('key, arg', [
+        ('list[int]', [0, 1, -1, 123, -1234567890]),
+        ('list[float]', [0.0, 1.0, -12.3, 12345.6789]),
+        ('list[mixed]', VALUES),
+        ('np.int64', np.array([0, 10, -200, 123], dtype=np.int64)),
+        ('np.float64', np.array([0.0, 1.5, -2.25])),
+    ])
+    def test___init__(self, key, arg):
+        da = DecimalArray(arg)
+        assert len(da) == len(arg)
+        for d, v in zip(da, arg):
+            expected = Dn(float(v)) if isinstance(v, np.floating) else Dn(v)
+            assert (d.s, d.x, d.e) == (expected.s, expected.x, expected.e)
+
+    def test_from_numbers(self):
+        numbers = [Dn(v) for v in VALUES] + [Dn(1200, -2)]
+        da = DecimalArray.from_numbers(numbers)
+        assert da.x.dtype == object
+        assert [(d.s, d.x, d.e) for d in da] == [(n.s, n.x, n.e) for n in numbers]
+        assert DecimalArray.from_numbers([Dn(1.5)]).x.dtype == np.int64
+
+    def test___init___overflow(self):
+        assert DecimalArray([1, 2, 3]).x.dtype == np.int64
+        assert DecimalArray(VALUES).x.dtype == object
+
+    def test___init___signed(self):
+        da = DecimalArray(np.array([-15, 0, 7]), -1)
+        assert da.s.tolist() == [-1, 0, 1]
+        assert da.x.tolist() == [15, 0, 7]
+        assert da.e.tolist() == [-1, -1, -1]
+
+    def test___init___signed_uint64(self):
+        da = DecimalArray(np.array([2 ** 64 - 1, 5], dtype=np.uint64), 0)
+        assert da.x.dtype == object
+        assert da.x.tolist() == [2 ** 64 - 1, 5]
+        assert DecimalArray(np.array([7], dtype=np.uint64), 0).x.dtype == np.int64
+
+    @pytest.mark.parametrize('key, arg', [
+        ('float64', np.array([1.5, 2.0])),
+        ('list of floats', [1.5, 2]),
+        ('str', np.array(['1'])),
+        ('bool', np.array([True])),
+    ])
+    def test___init___signed_raise(self, key, arg):
+        with pytest.raises(TypeError): DecimalArray(arg, 0)
+
+    def test___init___signed_min(self):
+        da = DecimalArray([-2 ** 63, 0], e=0)
+        assert da.s.tolist() == [-1, 0]
+        assert da.x.tolist() == [2 ** 63, 0]
+        assert str((DecimalArray([1, 2], e=0) - da)[0]) == '9223372036854775809e0'
+
+    @pytest.mark.parametrize('key, invalid_arg', [
+        ('"1.2"', "1.2"),
+        ('1.2', 1.2),
+        ('np.array([[1]])', np.array([[1]])),
+        ('[1.2j]', [1.2j]),
+    ])
+    def test___init___raise(self, key, invalid_arg):
+        with pytest.raises(TypeError): DecimalArray(invalid_arg)
+
+    @pytest.mark.parametrize('key, arg', [
+        ('non-ascii', np.array(['1.5', '２'])),
+        ('exponent', np.array(['1.5', '1e99999999999999999999'])),
+    ])
+    def test___init___raise_row(self, key, arg):
+        with pytest.raises(ValueError, match='at row 1'): DecimalArray(arg)
+
+
+class TestDecimalArray_arithmetic:
+    """Test that DecimalArray operators match DecimalNumber element by element."""
+
+    def __test_binary(self, op, arg1, arg2):
+        result = op(DecimalArray(arg1), DecimalArray(arg2))
+        for r, a, b in zip(result, arg1, arg2):
+            expected = op(Dn(a), Dn(b))
+            assert (r.s, r.x, r.e) == (expected.s, expected.x, expected.e)
+
+    @pytest.mark.parametrize('key, op', [
+        ('add', lambda a, b: a + b),
+        ('sub', lambda a, b: a - b),
+        ('mul', lambda a, b: a * b),
+    ])
+    def test_arithmetic(self, key, op): self.__test_binary(op, VALUES, VALUES[::-1])
+
+    @pytest.mark.parametrize('key, op', [
+        ('eq', lambda a, b: a == b),
+        ('ne', lambda a, b: a != b),
+        ('lt', lambda a, b: a < b),
+        ('le', lambda a, b: a <= b),
+        ('gt', lambda a, b: a > b),
+        ('ge', lambda a, b: a >= b),
+    ])
+    def test_compare(self, key, op):
+        result = op(DecimalArray(VALUES), DecimalArray(VALUES[::-1]))
+        assert result.tolist() == [op(Dn(a), Dn(b)) for a, b in zip(VALUES, VALUES[::-1])]
+
+    def test_overflow(self):
+        result = DecimalArray([2 ** 62, -2 ** 62]) + DecimalArray([2 ** 62, 1])
+        assert result.x.dtype == object
+        assert [int(d) for d in result] == [2 ** 63, -2 ** 62 + 1]
+        assert (result - DecimalArray([2 ** 62, 0])).x.dtype == np.int64
+
+    def test_scalar(self):
+        da = DecimalArray([1, 2.5, -3])
+        assert (da + 1 == DecimalArray([2, 3.5, -2])).all()
+        assert (2 * da == DecimalArray([2, 5, -6])).all()
+        assert (np.int64(1) - da == DecimalArray([0, -1.5, 4])).all()
+
+
+class TestDecimalArray_round:
+    """Test DecimalArray.round, floor and ceil."""
+
+    @pytest.mark.parametrize('key, ndigits, expected', [
+        ('round(0)', 0, [1, 2, -2, 3, 12, 0]),
+        ('round(1)', 1, [1.2, 1.6, -1.5, 2.5, 12.3, 0]),
+        ('round(-1)', -1, [0, 0, 0, 0, 10, 0]),
+    ])
+    def test_round(self, key, ndigits, expected):
+        result = DecimalArray([1.234, 1.56, -1.5, 2.5, 12.345, 0]).round(ndigits)
+        assert (result == DecimalArray(expected)).all()
+
+    def test_round_object(self):
+        result = DecimalArray([Dn(123456789012345678901234567890, -20), Dn(-15, -1)]).round(1)
+        assert result.tolist() == [Dn(12345678901, -1), Dn(-15, -1)]
+
+    def test_floor(self):
+        result = DecimalArray([1.234, -1.234, 2.0]).floor(1)
+        assert (result == DecimalArray([1.2, -1.3, 2.0])).all()
+
+    def test_ceil(self):
+        result = DecimalArray([1.234, -1.234, 2.0]).ceil(1)
+        assert (result == DecimalArray([1.3, -1.2, 2.0])).all()
+
+    @pytest.mark.parametrize('key, mode, expected', [
+        ('half-up', 'half-up', [-1.3, 1.3, 1.4, -1.4, 2.0]),
+        ('half-even', 'half-even', [-1.2, 1.2, 1.4, -1.4, 2.0]),
+        ('toward-zero', 'toward-zero', [-1.2, 1.2, 1.3, -1.3, 2.0]),
+    ])
+    def test_round_mode(self, key, mode, expected):
+        result = DecimalArray(['-1.25', '1.25', '1.35', '-1.35', '2']).round(1, mode)
+        assert (result == DecimalArray(expected)).all()
+
+    def test_round_invalid_mode(self):
+        with pytest.raises(ValueError):
+            DecimalArray([1.25]).round(1, 'up')
+        with pytest.raises(ValueError):
+            DecimalArray([1.25]).round(5, 'up')
+
+
+class TestDecimalArray_to_integers:
+    """Test DecimalArray.to_integers"""
+
+    def test_to_integers(self):
+        a = DecimalArray([1.25, -0.5, 300.0])
+        assert a.to_integers(-2).tolist() == [125, -50, 30000]
+        assert a.to_integers(np.array([-2, -1, -1])).tolist() == [125, -5, 3000]
+        assert a.to_integers(-30).tolist() == [125 * 10 ** 28, -5 * 10 ** 29, 3 * 10 ** 32]
+
+    def test_to_integers_raise(self):
+        with pytest.raises(ValueError): DecimalArray([1.25]).to_integers(-1)
+
+
+class TestDecimalArray_structured:
+    """Test DecimalArray.to_structured and from_structured"""
+
+    def test_roundtrip(self, tmp_path):
+        da = DecimalArray([1.5, -2, 0, 12345.678])
+        a = da.to_structured()
+        assert a.dtype == DECIMAL_DTYPE
+        np.save(tmp_path / 'a.npy', a)
+        result = DecimalArray.from_structured(np.load(tmp_path / 'a.npy', mmap_mode='r'))
+        assert result.tolist() == da.tolist()
+
+    def test_from_structured_view(self):
+        a = DecimalArray([1.5, -2]).to_structured()
+        da = DecimalArray.from_structured(a)
+        a['x'][0] = 25
+        assert da[0] == Dn(2.5)
+        assert np.shares_memory(da.e, a)
+
+    def test_to_structured_overflow(self):
+        with pytest.raises(OverflowError): DecimalArray(VALUES).to_structured()
+
+    @pytest.mark.parametrize('key, arg', [
+        ('float64', np.zeros(2)),
+        ('2-D', np.zeros((2, 2), dtype=DECIMAL_DTYPE)),
+        ('list', [(1, 1, 0)]),
+    ])
+    def test_from_structured_raise(self, key, arg):
+        with pytest.raises(TypeError): DecimalArray.from_structured(arg)
@@ -1,7 +1,9 @@
 import random
 import pytest
+from decimal import Decimal
+from fractions import Fraction
 import numpy as np
-from tvu.decimal_value import Dn
+from tvu.decimal_value import DecimalArray, Dn
 
 
 class TestDecimalNumber_constructor:
@@ -44,6 +46,14 @@ class TestDecimalNumber_constructor:
     ])
     def test___init___int(self, key, arg, params, _str_, _repr_): self.__test___init__(key, arg, params, _str_, _repr_)
 
+    @pytest.mark.parametrize('key, arg, params, _str_, _repr_', [
+        ('np.int64(-5)', np.int64(-5), (-1, 5, 0), '-5e0', 'DecimalNumber(-5e0)'),
+        ('np.int64(min)', np.int64(-2 ** 63), (-1, 2 ** 63, 0), '-9223372036854775808e0', 'DecimalNumber(-9223372036854775808e0)'),
+        ('np.int8(min)', np.int8(-128), (-1, 128, 0), '-128e0', 'DecimalNumber(-128e0)'),
+        ('np.uint64(max)', np.uint64(2 ** 64 - 1), (1, 2 ** 64 - 1, 0), '18446744073709551615e0', 'DecimalNumber(18446744073709551615e0)'),
+    ])
+    def test___init___npint(self, key, arg, params, _str_, _repr_): self.__test___init__(key, arg, params, _str_, _repr_)
+
     @pytest.mark.parametrize('key, arg, params, _str_, _repr_', [
         ('float(0)', 0.0, (0, 0, 0), '0e0', 'DecimalNumber(0e0)'),
         ('float(1)', 1.0, (1, 10, -1), '10e-1', 'DecimalNumber(10e-1)'),
@@ -54,6 +64,10 @@ class TestDecimalNumber_constructor:
         ('float(-12.3)', -12.3, (-1, 123, -1), '-123e-1', 'DecimalNumber(-123e-1)'),
         ('float(12345.67890)', 12345.67890, (1, 123456789, -4), '123456789e-4', 'DecimalNumber(123456789e-4)'),
         ('float(-12345.67890)', -12345.67890, (-1, 123456789, -4), '-123456789e-4', 'DecimalNumber(-123456789e-4)'),
+        ('float(0.29)', 0.29, (1, 29, -2), '29e-2', 'DecimalNumber(29e-2)'),
+        ('float(1e-7)', 1e-7, (1, 1, -7), '1e-7', 'DecimalNumber(1e-7)'),
+        ('float(-1.5e-7)', -1.5e-7, (-1, 15, -8), '-15e-8', 'DecimalNumber(-15e-8)'),
+        ('float(1e22)', 1e22, (1, 1, 22), '1e22', 'DecimalNumber(1e22)'),
         # The following tests will fail because of overflow in the float constructor.
         # [Task]: Make the following tests pass by using string representation of the float.
         # ('float(1234567890.1234567890)', 1234567890.1234567890, (1, 1234567890123456789, -9), '1234567890123456789e-9', 'DecimalNumber(1234567890123456789e-9)'),
@@ -65,6 +79,19 @@ class TestDecimalNumber_constructor:
     ])
     def test___init___float(self, key, arg, params, _str_, _repr_): self.__test___init__(key, arg, params, _str_, _repr_)
 
+    @pytest.mark.parametrize('key, arg, params, _str_, _repr_', [
+        ('str(1.2)', '1.2', (1, 12, -1), '12e-1', 'DecimalNumber(12e-1)'),
+        ('str(-1.20)', '-1.20', (-1, 120, -2), '-120e-2', 'DecimalNumber(-120e-2)'),
+        ('str(15e-3)', '15e-3', (1, 15, -3), '15e-3', 'DecimalNumber(15e-3)'),
+        ('str(1.5E+3)', '1.5E+3', (1, 15, 2), '15e2', 'DecimalNumber(15e2)'),
+        ('str(-0)', '-0', (0, 0, 0), '0e0', 'DecimalNumber(0e0)'),
+    ])
+    def test___init___str(self, key, arg, params, _str_, _repr_): self.__test___init__(key, arg, params, _str_, _repr_)
+
+    @pytest.mark.parametrize('key, arg', [('empty', ''), ('two dots', '1.2.3'), ('word', 'abc'), ('space', ' 1')])
+    def test___init___str_raise(self, key, arg):
+        with pytest.raises(ValueError): Dn(arg)
+
     @pytest.mark.parametrize('key, invalid_arg, expected_exception', [
         # ('"1.2"', "1.2", TypeError), # Added support for str in DecimalNumber.__init__
         ('1.2j', 1.2j, TypeError),
@@ -79,6 +106,67 @@ class TestDecimalNumber_constructor:
         with pytest.raises(expected_exception): Dn(invalid_arg)
 
 
+class TestDecimalNumber_slots:
+    """Test DecimalNumber.__slots__"""
+
+    def test___slots__(self):
+        dn = Dn(12.3)
+        assert not hasattr(dn, '__dict__')
+        with pytest.raises(AttributeError): dn._x = 1
+
+
+class TestDecimalNumber_immutable:
+    """Test the immutability of DecimalNumber"""
+
+    @pytest.mark.parametrize('key, name', [('s', 's'), ('x', 'x'), ('e', 'e'), ('_hash', '_hash')])
+    def test___setattr__(self, key, name):
+        d = Dn(12.5)
+        hash(d)
+        with pytest.raises(AttributeError): setattr(d, name, 1)
+        with pytest.raises(AttributeError): delattr(d, name)
+        assert (d.s, d.x, d.e) == (1, 125, -1)
+
+    def test_ie(self):
+        d = Dn(12)
+        result = d.ie(2)
+        assert (result.s, result.x, result.e) == (1, 1200, 2)
+        assert (d.s, d.x, d.e) == (1, 12, 0)
+
+    def test_ie_negative(self):
+        with pytest.warns(UserWarning):
+            result = Dn(-1200).ie(-2)
+        assert result == Dn(-12, -2)
+
+    @pytest.mark.parametrize('key, arg', [('positive', 1.5), ('zero', 0), ('big', 10 ** 40)])
+    def test_identity(self, key, arg):
+        d = Dn(arg)
+        assert +d is d
+        assert abs(d) is d
+        assert d.round(5) is d
+
+    def test_identity_negative(self):
+        d = Dn(-1.5)
+        assert +d is d
+        assert abs(d) is not d and abs(d) == Dn(1.5)
+
+    def test_copy(self):
+        d = Dn(10 ** 40 + 1)
+        c = Dn(d)
+        assert c is not d and c == d
+
+
+class TestDecimalNumber_from_parts:
+    """Test DecimalNumber.from_parts"""
+
+    def test_from_parts(self):
+        dn = Dn.from_parts(-1, 123, -2)
+        assert (dn.s, dn.x, dn.e) == (-1, 123, -2)
+        assert dn == Dn(-1.23)
+
+    def test___init___exponent_raise(self):
+        with pytest.raises(TypeError): Dn('1.5', 2)
+
+
 class TestDecimalNumber___eq__:
     """Test DecimalNumber.__eq__()."""
 
@@ -124,6 +212,133 @@ class TestDecimalNumber___eq__:
     def test___eq___float(self, key, arg): self.__test___eq__(key, arg)
 
 
+    @pytest.mark.parametrize('key, arg1, arg2, expected', [
+        ('1e0 == 10e-1', Dn(1, 0), Dn(10, -1), True),
+        ('12e2 == 1200e0', Dn(12, 2), Dn(1200, 0), True),
+        ('0e5 == 0e-3', Dn(0, 5), Dn(0, -3), True),
+        ('1e0 != -10e-1', Dn(1, 0), Dn(-10, -1), False),
+        ('15e-1 != 1e0', Dn(15, -1), Dn(1, 0), False),
+        ('same exponent', Dn(-15, -1), Dn(-15, -1), True),
+        ('same exponent, different sign', Dn(-15, -1), Dn(15, -1), False),
+    ])
+    def test___eq___representation(self, key, arg1, arg2, expected):
+        assert (arg1 == arg2) is expected
+        assert (arg2 == arg1) is expected
+
+    @pytest.mark.parametrize('key, other', [
+        ('None', None),
+        ('str', '1'),
+        ('invalid str', 'abc'),
+        ('list', [1]),
+        ('nan', float('nan')),
+    ])
+    def test___eq___other(self, key, other):
+        assert (Dn(1) == other) is False and (Dn(1) != other) is True
+        assert Dn(1) in [other, 1] and Dn(2) not in [other, 1]
+
+    @pytest.mark.parametrize('key, other', [
+        ('None', None),
+        ('str', '1'),
+    ])
+    def test___lt___raise(self, key, other):
+        with pytest.raises(TypeError): Dn(1) < other
+        with pytest.raises(TypeError): Dn(1) >= other
+
+    def test___lt___inf(self):
+        assert Dn(10 ** 400) < float('inf') and Dn(-1) > float('-inf')
+        assert not (Dn(1) <= float('nan')) and not (Dn(1) >= float('nan'))
+
+
+class TestDecimalNumber___hash__:
+    """Test DecimalNumber.__hash__"""
+
+    @pytest.mark.parametrize('key, arg', [
+        ('int(0)', 0),
+        ('int(-1)', -1),
+        ('int(123)', 123),
+        ('int(2 ** 61 - 1)', 2 ** 61 - 1),
+        ('int(-(10 ** 40))', -(10 ** 40)),
+        ('float(1)', 1.0),
+        ('float(-2.25)', -2.25),
+        ('float(1e10)', 1e10),
+        ('np.int64(-5)', np.int64(-5)),
+    ])
+    def test___hash___builtin(self, key, arg):
+        assert hash(Dn(arg)) == hash(arg)
+
+    @pytest.mark.parametrize('key, arg', [
+        ('0.1', '0.1'),
+        ('-1.25e-30', '-1.25e-30'),
+        ('123456789012345678901234567890.5', '123456789012345678901234567890.5'),
+    ])
+    def test___hash___decimal(self, key, arg):
+        assert hash(Dn(arg)) == hash(Decimal(arg)) == hash(Fraction(arg))
+
+    def test___hash___representation(self):
+        assert len({Dn(1), Dn(1.0), Dn('1.000'), Dn(10, -1)}) == 1
+        assert {Dn(0.5): 'half'}[Dn(5, -1)] == 'half'
+
+    @pytest.mark.parametrize('key, arg', [
+        ('0.1', '0.1'),
+        ('0.5', '0.5'),
+        ('1', '1'),
+        ('-12.25', '-12.25'),
+        ('1e-30', '1e-30'),
+        ('3', '3.000'),
+    ])
+    def test___hash___eq(self, key, arg):
+        # a == b implies hash(a) == hash(b) for every number type
+        d = Dn(arg)
+        for other in (int(Fraction(arg)) if Fraction(arg).denominator == 1 else None, Fraction(arg), Decimal(arg), arg):
+            if d == other:
+                assert hash(d) == hash(other)
+        # floats compare at their shortest repr and share the hash only if exact
+        assert d == float(arg)
+        if Fraction(float(arg)) == Fraction(arg):
+            assert hash(d) == hash(float(arg))
+        assert len({d, float(arg)}) == (1 if Fraction(float(arg)) == Fraction(arg) else 2)
+        assert (d == Fraction(arg)) and (d == Decimal(arg)) and (d != arg)
+
+    def test___hash___float(self):
+        assert Dn(0.5) == 0.5 and 0.5 in {Dn(0.5)}
+        assert Dn(0.1) == 0.1 and 0.1 not in {Dn(0.1)}
+        assert Dn(0.1) < Dn('0.10000000000000001') and 0.1 < Dn('0.10000000000000001')
+
+    def test___eq___float(self):
+        # comparisons agree with arithmetic and DecimalArray on floats
+        d = Dn(0.3)
+        assert d == 0.3 and 0.3 == d and d == np.float64(0.3)
+        assert not (d < 0.3) and not (d > 0.3) and d <= 0.3 and d >= 0.3
+        assert d - 0.3 == 0
+        assert (DecimalArray([0.3]) == 0.3).tolist() == [True]
+        assert Dn('0.30000000000000001') > 0.3
+
+    def test___hash___ie(self):
+        d = Dn(12)
+        assert hash(d) == hash(12)
+        scaled = d.ie(2)
+        assert hash(scaled) == hash(Dn(1200, 2)) and hash(d) == hash(12)
+
+
+class TestDecimalNumber_normalize:
+    """Test DecimalNumber.normalize"""
+
+    @pytest.mark.parametrize('key, arg, expected', [
+        ('float(1)', 1.0, (1, 1, 0)),
+        ('int(1200)', 1200, (1, 12, 2)),
+        ('float(-12.30)', Dn(-1230, -2), (-1, 123, -1)),
+        ('zero', Dn(0, -5), (0, 0, 0)),
+        ('canonical', Dn(7, 3), (1, 7, 3)),
+        ('big', Dn(10 ** 40, -50), (1, 1, -10)),
+        ('huge', Dn(-3 * 10 ** 5000, 0), (-1, 3, 5000)),
+    ])
+    def test_normalize(self, key, arg, expected):
+        d = Dn(arg)
+        n = d.normalize()
+        assert (n.s, n.x, n.e) == expected
+        assert n == d and hash(n) == hash(d)
+
+
 class TestDecimalNumber___ne__:
     """Test DecimalNumber.__ne__()."""
 
@@ -551,6 +766,14 @@ class TestDecimalNumber___truediv__:
     ])
     def test___truediv___int(self, key, arg1, arg2, arg3): self.__test___truediv__(key, arg1, arg2, arg3)
 
+    @pytest.mark.parametrize('key, arg1, arg2, arg3', [
+        ('float(1.0) / float(0.5)', 1.0, 0.5, 1.0 / 0.5),
+        ('int(1) / float(0.5)', 1, 0.5, 1 / 0.5),
+        ('float(0.3) / int(3)', 0.3, 3, 0.1),
+        ('int(100) / float(0.25)', 100, 0.25, 100 / 0.25),
+    ])
+    def test___truediv___float(self, key, arg1, arg2, arg3): self.__test___truediv__(key, arg1, arg2, arg3)
+
     @pytest.mark.parametrize('key, arg1, arg2, expected_exception', [
         ('int(1) / int(0)', 1, 0, ZeroDivisionError),
         ('float(1.0) / float(0.0)', 1.0, 0.0, ZeroDivisionError),
@@ -652,5 +875,68 @@ class TestDecimalNumber___int__:
         ('float(-12.3)', -12.3, -12),
         ('float(12345.67890)', 12345.67890, 12345),
         ('float(-12345.67890)', -12345.67890, -12345),
+        ('float(0.5)', 0.5, 0),
+        ('float(-0.05)', -0.05, 0),
     ])
     def test___int___float(self, key, arg1, arg2): self.__test___int__(key, arg1, arg2)
+
+
+class TestDecimalNumber_round:
+    """Test class for DecimalNumber.round, floor and ceil"""
+
+    @pytest.mark.parametrize('key, arg, ndigits, mode, expected', [
+        ('1.25 half-up', '1.25', 1, 'half-up', Dn(13, -1)),
+        ('-1.25 half-up', '-1.25', 1, 'half-up', Dn(-13, -1)),
+        ('1.25 half-even', '1.25', 1, 'half-even', Dn(12, -1)),
+        ('-1.35 half-even', '-1.35', 1, 'half-even', Dn(-14, -1)),
+        ('-1.25 toward-zero', '-1.25', 1, 'toward-zero', Dn(-12, -1)),
+        ('-1.21 floor', '-1.21', 1, 'floor', Dn(-13, -1)),
+        ('-1.29 ceil', '-1.29', 1, 'ceil', Dn(-12, -1)),
+        ('123.456 to tens', '123.456', -1, 'half-up', Dn(12, 1)),
+        ('-0.5 to units', '-0.5', 0, 'half-up', Dn(-1)),
+        ('0.5 half-even', '0.5', 0, 'half-even', Dn(0)),
+    ])
+    def test_round(self, key, arg, ndigits, mode, expected):
+        result = Dn(arg).round(ndigits, mode)
+        assert result == expected
+        assert result.e == -ndigits
+
+    @pytest.mark.parametrize('key, arg, ndigits', [
+        ('int', 1200, 0),
+        ('more digits than stored', '1.5', 3),
+        ('negative ndigits', 1200, -2),
+    ])
+    def test_round_exact(self, key, arg, ndigits):
+        # the value has no digits below 10 ** -ndigits, so nothing changes
+        d = Dn(arg)
+        for result in (d.round(ndigits), d.floor(ndigits), d.ceil(ndigits)):
+            assert (result.s, result.x, result.e) == (d.s, d.x, d.e)
+            assert type(result.x) is int
+
+    def test_floor_ceil(self):
+        assert Dn(-1.234).floor(1) == Dn(-1.3)
+        assert Dn(-1.234).ceil(1) == Dn(-1.2)
+        assert Dn(1.234).floor(2) == Dn(1.23)
+        assert Dn(1.234).ceil(2) == Dn(1.24)
+
+    def test_round_invalid_mode(self):
+        with pytest.raises(ValueError):
+            Dn('1.25').round(1, 'up')
+        with pytest.raises(ValueError):
+            Dn(1200).round(0, 'bogus')
+
+
+class TestDecimalNumber___format__:
+    """Test class for DecimalNumber.__format__"""
+
+    @pytest.mark.parametrize('key, arg, console, latex', [
+        ('15e-1', Dn(15, -1), '1.5', '\\num{1.5}'),
+        ('-12e-4', Dn(-12, -4), '-0.0012', '\\num{-0.0012}'),
+        ('12e3', Dn(12, 3), '12000', '\\num{12000}'),
+        ('10e-1', Dn(1.0), '1.0', '\\num{1.0}'),
+        ('0e0', Dn(0), '0', '\\num{0}'),
+    ])
+    def test___format__(self, key, arg, console, latex):
+        assert f'{arg:console}' == console
+        assert f'{arg:latex}' == latex
+        assert f'{arg}' == str(arg)
@@ -0,0 +1,39 @@
+import pytest
+import numpy as np
+from tvu.dispatch import TypeDispatcher
+
+
+class TestTypeDispatcher:
+    """Test TypeDispatcher"""
+
+    def __dispatcher(self) -> TypeDispatcher:
+        d = TypeDispatcher('test')
+        d.register(int)(lambda x: 'int')
+        d.register(float, np.integer)(lambda x: 'number')
+        d.register(str)(lambda x, suffix: 'str' + suffix)
+        d.reject(np.floating)
+        return d
+
+    @pytest.mark.parametrize('key, arg, expected', [
+        ('int', 1, 'int'),
+        ('bool', True, 'int'),
+        ('float', 1.5, 'number'),
+        ('np.int32', np.int32(1), 'number'),
+    ])
+    def test___call__(self, key, arg, expected): assert self.__dispatcher()(arg) == expected
+
+    def test___call___args(self): assert self.__dispatcher()('a', '!') == 'str!'
+
+    @pytest.mark.parametrize('key, arg', [
+        ('np.float64', np.float64(1.5)),
+        ('complex', 1j),
+        ('list', [1]),
+    ])
+    def test___call___raise(self, key, arg):
+        with pytest.raises(TypeError): self.__dispatcher()(arg)
+
+    def test_register_after_lookup(self):
+        d = self.__dispatcher()
+        with pytest.raises(TypeError): d(1j)
+        d.register(complex)(lambda x: 'complex')
+        assert d(1j) == 'complex'
@@ -0,0 +1,63 @@
+import pytest
+import numpy as np
+from tvu import Dn, Tvu, TvuArray, format_tvu
+
+
+class TestFormatTvu:
+    """Test format_tvu"""
+
+    @pytest.mark.parametrize('key, t, u, digits, expected', [
+        ('basic', 1.23456, 0.0123, 2, '1.235 ± 0.012'),
+        ('1 digit', 1.23456, 0.0123, 1, '1.23 ± 0.01'),
+        ('3 digits', 1.23456, 0.0123, 3, '1.2346 ± 0.0123'),
+        ('half away from zero', 2.25, 0.15, 1, '2.3 ± 0.2'),
+        ('negative', -2.25, 0.15, 1, '-2.3 ± 0.2'),
+        ('carry', 0.0996, 0.0996, 2, '0.10 ± 0.10'),
+        ('carry to units', 9.96, 0.996, 2, '10.0 ± 1.0'),
+        ('padding', 2.0, 0.5, 2, '2.00 ± 0.50'),
+        ('integer quantum', 12345.0, 432.0, 2, '12350 ± 430'),
+        ('large', 123456789.0, 4321.0, 2, '(1.234568 ± 0.000043)e8'),
+        ('small', -0.000123456, 0.0000456, 2, '(-1.23 ± 0.46)e-4'),
+        ('zero uncertainty', 1.5, 0.0, 2, '1.5 ± 0.0'),
+        ('zero', 0.0, 0.0, 2, '0 ± 0'),
+        ('zero value', 0.0, 0.25, 2, '0.00 ± 0.25'),
+        ('rounds to zero', -0.001, 0.25, 2, '0.00 ± 0.25'),
+        ('huge span', 1e30, 1e-5, 2, '(1.000000000000000000000000000000000000 ± 0.000000000000000000000000000000000010)e30'),
+    ])
+    def test_console(self, key, t, u, digits, expected):
+        assert format_tvu(TvuArray([t], [u]), digits=digits).tolist() == [expected]
+        assert format_tvu(Tvu(t, u), digits=digits) == expected
+
+    @pytest.mark.parametrize('key, style, expected', [
+        ('console', 'console', ['1.235 ± 0.012', '(-1.23 ± 0.46)e-4']),
+        ('plain', 'plain', ['1.235 +/- 0.012', '(-1.23 +/- 0.46)e-4']),
+        ('latex', 'latex', ['\\num{1.235 \\pm 0.012}', '\\num{-1.23 \\pm 0.46e-4}']),
+    ])
+    def test_style(self, key, style, expected):
+        assert format_tvu(TvuArray([1.23456, -0.000123456], [0.0123, 0.0000456]), style).tolist() == expected
+
+    def test_sequence(self):
+        values = [Tvu(Dn(1) / Dn(3), Dn(1, -2)), Tvu(Dn(123456789012345678901234567890, -20), Dn(5, -20))]
+        assert format_tvu(values).tolist() == ['0.333 ± 0.010', '(1.234567890123456789012345678900 ± 0.000000000000000000000000000050)e9']
+
+    def test_not_mutated(self):
+        arr = TvuArray(np.random.default_rng(0).normal(0, 1e3, 1000), np.random.default_rng(1).uniform(0, 10, 1000))
+        t, u = arr.t.copy(), arr.u.copy()
+        result = format_tvu(arr, 'latex')
+        assert len(result) == 1000
+        assert (arr.t == t).all() and (arr.u == u).all()
+
+    def test___format__(self):
+        tvu = Tvu(1.23456, 0.0123)
+        assert str(tvu) == '1.235 ± 0.012'
+        assert f'{tvu:latex}' == '\\num{1.235 \\pm 0.012}'
+        assert f'{tvu:plain}' == '1.235 +/- 0.012'
+
+    @pytest.mark.parametrize('key, args, exception', [
+        ('style', (TvuArray([1.0], [0.1]), 'html'), ValueError),
+        ('digits', (TvuArray([1.0], [0.1]), 'console', 0), ValueError),
+        ('type', ([1.0],), TypeError),
+        ('nan', (TvuArray([np.nan], [0.1]),), ValueError),
+    ])
+    def test_raise(self, key, args, exception):
+        with pytest.raises(exception): format_tvu(*args)
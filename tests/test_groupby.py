@@ -0,0 +1,63 @@
+import pytest
+import numpy as np
+from tvu import Tvu, groupby_reduce
+
+
+def _loop(values, labels):
+    keys = sorted(set(labels.tolist()))
+    return keys, [Tvu(values[labels == k]) if (labels == k).sum() > 1 else None for k in keys]
+
+
+class TestGroupbyReduce:
+    """Test groupby_reduce"""
+
+    @pytest.mark.parametrize('key, labels', [
+        ('int', np.array([3, 1, 3, 2, 1, 3, 2, 2])),
+        ('str', np.array(['c', 'a', 'c', 'b', 'a', 'c', 'b', 'b'])),
+        ('object', np.array(['run-3', 'run-1', 'run-3', 'run-2', 'run-1', 'run-3', 'run-2', 'run-2'], dtype=object)),
+    ])
+    def test_groupby_reduce(self, key, labels):
+        values = np.array([1.0, 2.0, 4.0, 0.5, 3.0, 7.0, 1.5, 2.5])
+        result = groupby_reduce(values, labels)
+        keys, expected = _loop(values, labels)
+        assert result.labels.tolist() == keys
+        assert result.counts.tolist() == [2, 3, 3]
+        assert result.tvu.T.tolist() == pytest.approx([float(t.T) for t in expected])
+        assert result.tvu.U.tolist() == pytest.approx([float(t.U) for t in expected])
+
+    def test_single_reading(self):
+        result = groupby_reduce(np.array([1.0, 2.0, 3.0]), np.array([0, 1, 1]))
+        assert result.tvu.T.tolist() == [1.0, 2.5]
+        assert np.isnan(result.tvu.U[0]) and result.tvu.U[1] == pytest.approx(0.5)
+
+    def test_empty(self):
+        result = groupby_reduce(np.zeros(0), np.zeros(0, dtype=np.int64))
+        assert len(result.labels) == len(result.tvu) == len(result.counts) == 0
+
+    def test_offset(self):
+        # a large common offset must not cancel the deviations
+        values = 1e9 + np.array([1.0, 2.0, 3.0, 4.0])
+        result = groupby_reduce(values, np.zeros(4, dtype=np.int64))
+        assert result.tvu.U[0] == pytest.approx(np.std([1.0, 2.0, 3.0, 4.0], ddof=1) / 2)
+
+    def test_processes(self):
+        rng = np.random.default_rng(0)
+        values = rng.standard_normal(10000) + 1e3
+        labels = rng.integers(0, 50, 10000)
+        serial = groupby_reduce(values, labels)
+        parallel = groupby_reduce(values, labels, processes=3)
+        assert (parallel.labels == serial.labels).all()
+        assert (parallel.counts == serial.counts).all()
+        assert parallel.tvu.T == pytest.approx(serial.tvu.T)
+        assert parallel.tvu.U == pytest.approx(serial.tvu.U)
+
+    @pytest.mark.parametrize('key, values, labels, error', [
+        ('length', np.zeros(3), np.zeros(2), ValueError),
+        ('2-D', np.zeros((2, 2)), np.zeros((2, 2)), ValueError),
+    ])
+    def test_raise(self, key, values, labels, error):
+        with pytest.raises(error): groupby_reduce(values, labels)
+
+    def test_raise_object_processes(self):
+        labels = np.array([f'run-{i % 2}' for i in range(10)], dtype=object)
+        with pytest.raises(TypeError): groupby_reduce(np.zeros(10), labels, processes=2)
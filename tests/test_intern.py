@@ -0,0 +1,132 @@
+import sys
+import threading
+import pytest
+from tvu import Tvu
+from tvu.decimal_value import Dn, intern_cache_clear, intern_cache_configure, intern_cache_info
+from tvu.decimal_value.intern import MAXSIZE, SMALL_INTS, InternCache
+
+
+class TestInternCache:
+    """Test InternCache"""
+
+    @pytest.mark.parametrize('key, arg', [
+        ('small int', 7),
+        ('negative small int', -SMALL_INTS),
+        ('big int', 10 ** 30),
+        ('float', 12.5),
+        ('str', '1.25e-3'),
+    ])
+    def test___call__(self, key, arg):
+        cache = InternCache(Dn)
+        d = cache(arg)
+        assert cache(arg) is d
+        assert (d.s, d.x, d.e) == (Dn(arg).s, Dn(arg).x, Dn(arg).e)
+
+    def test___call___types(self):
+        cache = InternCache(Dn)
+        assert cache(1) is not cache(1.0)
+        assert cache(1.0).e == -1 and cache(1).e == 0
+
+    def test___call___uncached_type(self):
+        cache = InternCache(Dn)
+        d = Dn(3)
+        assert cache(d) is not cache(d)
+        assert cache.info()['misses'] == 0
+
+    def test_info(self):
+        cache = InternCache(Dn, maxsize=2, small_ints=1)
+        for x in (1, 1, 2, 2, 0.5):
+            cache(x)
+        assert cache.info() == {'small_hits': 1, 'hits': 1, 'misses': 3, 'evictions': 0, 'size': 2, 'maxsize': 2}
+
+    @pytest.mark.parametrize('key, eviction, kept, evictions', [
+        ('lru', 'lru', [1.0, 3.0], 1),
+        ('fifo', 'fifo', [2.0, 3.0], 1),
+        ('clear', 'clear', [3.0], 2),
+    ])
+    def test_eviction(self, key, eviction, kept, evictions):
+        cache = InternCache(Dn, maxsize=2, eviction=eviction)
+        first = cache(1.0)
+        cache(2.0)
+        cache(1.0)
+        cache(3.0)
+        assert sorted(x for _, x in cache._recent) == kept
+        assert cache.info()['evictions'] == evictions
+        assert (cache(1.0) is first) == (1.0 in kept)
+
+    def test_maxsize_zero(self):
+        cache = InternCache(Dn, maxsize=0, small_ints=0)
+        assert cache(0) is cache(0)
+        assert cache(1) is not cache(1)
+        assert cache.info()['size'] == 0
+
+    @pytest.mark.parametrize('key, eviction', [
+        ('lru', 'lru'),
+        ('fifo', 'fifo'),
+        ('clear', 'clear'),
+    ])
+    def test___call___threads(self, key, eviction):
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # switch threads as often as possible
+        try:
+            cache = InternCache(Dn, maxsize=8, eviction=eviction)
+            errors = []
+
+            def work(seed):
+                try:
+                    for i in range(20000):
+                        x = (i * seed) % 13 + 0.5
+                        assert cache(x) == Dn(x)
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=work, args=(seed,)) for seed in range(1, 9)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert errors == []
+        assert cache.info()['size'] <= 8
+
+    @pytest.mark.parametrize('key, kwargs', [
+        ('eviction', {'eviction': 'random'}),
+        ('maxsize', {'maxsize': -1}),
+        ('small_ints', {'small_ints': -1}),
+    ])
+    def test_configure_raise(self, key, kwargs):
+        with pytest.raises(ValueError): InternCache(Dn).configure(**kwargs)
+
+
+class TestInternCacheGlobal:
+    """Test DecimalNumber.interned and the intern_cache_* functions"""
+
+    def setup_method(self):
+        intern_cache_configure(MAXSIZE, SMALL_INTS, 'lru')
+
+    def teardown_method(self):
+        intern_cache_configure(MAXSIZE, SMALL_INTS, 'lru')
+
+    def test_interned(self):
+        assert Dn.interned(5) is Dn.interned(5)
+        assert Dn.interned('0.5') is Dn.interned('0.5')
+        assert Dn.interned(0.1) == Dn(0.1)
+
+    def test_operands(self):
+        a = Dn(12.5)
+        intern_cache_clear()
+        for _ in range(10):
+            assert a + 0.5 > 1
+        info = intern_cache_info()
+        assert (info['misses'], info['small_hits'] + info['hits']) == (2, 18)
+
+    def test_tvu(self):
+        assert Tvu(3).u is Tvu(4.5).u
+        assert Tvu(3).t is Tvu(3).t
+
+    def test_configure(self):
+        intern_cache_configure(maxsize=0)
+        assert intern_cache_info()['maxsize'] == 0
+        assert Dn.interned(0.5) is not Dn.interned(0.5)
+        assert Dn.interned(5) is Dn.interned(5)
@@ -0,0 +1,76 @@
+import pytest
+import tvu
+from tvu import Dn, Tvu, lazy
+from tvu.typical_value import Expression, Variable
+
+
+class TestExpression:
+    """Test the lazy expression DAG"""
+
+    def test_evaluate(self):
+        x, y = lazy(Tvu(2.0, 0.1)), lazy(Tvu(3.0, 0.2))
+        expr = (x * y + 1) / x - 2 ** y
+        expected = (x.value * y.value + 1) / x.value - 2 ** y.value
+        result = expr.evaluate()
+        assert isinstance(result, Tvu)
+        assert (result.T, result.U) == pytest.approx((expected.T, expected.U))
+
+    def test_correlation(self):
+        x, y = lazy(Tvu(2.0, 0.1)), lazy(Tvu(3.0, 0.2))
+        assert float((x - x).evaluate().U) == 0.0
+        assert float((x * y / x).evaluate().U) == pytest.approx(0.2)
+
+    @pytest.mark.parametrize('key, f', [
+        ('x * y', lambda x, y: (x * y, x * y)),
+        ('y * x', lambda x, y: (x * y, y * x)),
+        ('x + 1', lambda x, y: (x + 1, x + 1)),
+        ('x - Dn(1)', lambda x, y: (x - Dn(1), x - Dn(1))),
+        ('-(x ** 2)', lambda x, y: (-(x ** 2), -(x ** 2))),
+    ])
+    def test_hash_consing(self, key, f):
+        x, y = lazy(Tvu(2.0, 0.1)), lazy(Tvu(3.0, 0.2))
+        a, b = f(x, y)
+        assert a is b
+
+    def test_distinct(self):
+        x, y = lazy(Tvu(2.0, 0.1)), lazy(Tvu(3.0, 0.2))
+        assert x - y is not y - x
+        assert x + 1 is not x + 1.0
+        assert x + Tvu(1.0) is not x + Tvu(1.0)
+
+    def test_update(self):
+        x, y = lazy(Tvu(2.0, 0.1)), lazy(Tvu(3.0, 0.2))
+        left, right = x * x, y + 1
+        expr = left * right
+        assert expr.evaluate().T == 16.0
+        cached = right.evaluate()
+        y.value = Tvu(5.0, 0.2)
+        assert left._value is not None and right._value is None
+        assert expr.evaluate().T == 24.0
+        assert left.evaluate().T == 4.0
+        x.value = 1
+        assert right.evaluate() is not cached and right._value is not None
+        assert expr.evaluate().T == 6.0
+
+    def test_deep(self):
+        x = lazy(Tvu(1.0, 0.01))
+        expr = x
+        for _ in range(5000): expr = expr + x
+        assert expr.evaluate().T == 5001.0
+        assert float(expr.evaluate().U) == pytest.approx(50.01)
+
+    def test_variable(self):
+        x = lazy(2)
+        assert isinstance(x, Variable) and isinstance(x, Expression)
+        assert x.value.T == 2
+
+    def test_raise(self):
+        with pytest.raises(TypeError): lazy(Tvu(1.0)) + '1'
+        with pytest.raises(TypeError): lazy('1')
+
+
+@pytest.mark.parametrize('name', ['lazy', 'monte_carlo', 'weighted_mean'])
+def test_exports(name):
+    """The package attributes are the functions, not the submodules that define them."""
+    assert callable(getattr(tvu, name))
+    assert callable(getattr(tvu.typical_value, name))
@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+from tvu import Tvu, lazy, monte_carlo
+from tvu.typical_value.simulation import _Reservoir
+
+
+class TestMonteCarlo:
+    """Test monte_carlo"""
+
+    def test_linear(self):
+        x, y = lazy(Tvu(2.0, 0.1)), lazy(Tvu(3.0, 0.2))
+        result = monte_carlo(x * y / x, n=200000, seed=0)
+        assert result.n == 200000 and result.invalid == 0
+        assert result.tvu.T == pytest.approx(3.0, abs=3e-3)
+        assert result.tvu.U == pytest.approx(0.2, rel=1e-2)
+        assert result.percentiles[50.0] == pytest.approx(3.0, abs=3e-3)
+        assert result.percentiles[97.5] - result.percentiles[2.5] == pytest.approx(2 * 1.96 * 0.2, rel=2e-2)
+
+    def test_callable(self):
+        result = monte_carlo(np.exp, Tvu(1.0, 0.1), n=200000, seed=0)
+        assert result.tvu.T == pytest.approx(np.exp(1.0 + 0.1 ** 2 / 2), rel=1e-3)
+        assert result.percentiles[50.0] == pytest.approx(np.exp(1.0), rel=1e-3)
+
+    def test_nonlinear(self):
+        result = monte_carlo(lazy(Tvu(1.0, 0.5)) ** 2, n=200000, seed=0)
+        assert result.tvu.T == pytest.approx(1.25, rel=1e-2)
+        assert (Tvu(1.0, 0.5) ** 2).T == 1.0
+
+    def test_invalid(self):
+        result = monte_carlo(lazy(Tvu(1.0, 0.5)) ** 0.5, n=100000, seed=0)
+        assert result.invalid == pytest.approx(100000 * 0.02275, rel=0.1)
+
+    def test_seed(self):
+        x = lazy(Tvu(2.0, 0.1))
+        a = monte_carlo(x * x, n=25000, chunk_size=10000, seed=42)
+        b = monte_carlo(x * x, n=25000, chunk_size=10000, seed=42)
+        c = monte_carlo(x * x, n=25000, chunk_size=10000, seed=43)
+        assert (a.tvu.T, a.tvu.U, a.percentiles) == (b.tvu.T, b.tvu.U, b.percentiles)
+        assert a.tvu.T != c.tvu.T
+
+    def test_processes(self):
+        x, y = lazy(Tvu(2.0, 0.1)), lazy(Tvu(3.0, 0.2))
+        serial = monte_carlo(x / y + x, n=40000, chunk_size=10000, seed=7)
+        pooled = monte_carlo(x / y + x, n=40000, chunk_size=10000, seed=7, processes=2)
+        assert (serial.tvu.T, serial.tvu.U, serial.percentiles) == (pooled.tvu.T, pooled.tvu.U, pooled.percentiles)
+
+    def test_early_stop(self):
+        result = monte_carlo(lazy(Tvu(2.0, 0.1)) + 1, n=1000000, chunk_size=10000, seed=0, rtol=1e-2)
+        assert result.n < 1000000
+        assert result.tvu.U == pytest.approx(0.1, rel=2e-2)
+
+    def test_percentile_samples(self):
+        expr = lazy(Tvu(2.0, 0.1)) + 1  # one expression, so every run draws its leaves in the same order
+        exact = monte_carlo(expr, n=50000, chunk_size=10000, seed=3, percentile_samples=None)
+        bounded = monte_carlo(expr, n=50000, chunk_size=10000, seed=3, percentile_samples=50000)
+        assert exact.percentiles == bounded.percentiles  # all samples fit in the reservoir
+        sampled = monte_carlo(expr, n=50000, chunk_size=10000, seed=3, percentile_samples=20000)
+        assert sampled.tvu.T == exact.tvu.T
+        assert sampled.percentiles[50.0] == pytest.approx(3.0, abs=5e-3)
+        assert sampled.percentiles[97.5] == pytest.approx(3.0 + 1.96 * 0.1, abs=1e-2)
+
+    def test_reservoir(self):
+        reservoir = _Reservoir(5000, np.random.SeedSequence(0))
+        for start in range(0, 100000, 1000):
+            reservoir.update(np.arange(start, start + 1000, dtype=np.float64))
+            assert len(reservoir.values()) <= 5000 + 1000
+        values = reservoir.values()
+        assert len(values) == 5000 and len(np.unique(values)) == 5000
+        assert np.median(values) == pytest.approx(50000, rel=5e-2)
+
+    def test_raise(self):
+        with pytest.raises(TypeError): monte_carlo(lazy(Tvu(1.0)) + 1, Tvu(1.0))
@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+from tvu import parse_decimals
+from tvu.decimal_value import DecimalArray, Dn
+
+
+class TestParseDecimals:
+    """Test parse_decimals"""
+
+    @pytest.mark.parametrize('key, values', [
+        ('list', ['1.5', '-2e3', '.25', '0']),
+        ('tuple of bytes', (b'1.5', b'-2e3', b'.25', b'0')),
+        ('np.array(str)', np.array(['1.5', '-2e3', '.25', '0'])),
+        ('np.array(bytes)', np.array([b'1.5', b'-2e3', b'.25', b'0'])),
+        ('generator', (v for v in ['1.5', '-2e3', '.25', '0'])),
+    ])
+    def test_parse_decimals(self, key, values):
+        a = parse_decimals(values)
+        assert isinstance(a, DecimalArray)
+        assert a.s.tolist() == [1, -1, 1, 0]
+        assert a.x.tolist() == [15, 2, 25, 0]
+        assert a.e.tolist() == [-1, 3, -2, 0]
+
+    def test_parse_decimals_as_list(self):
+        numbers = parse_decimals(np.array(['1.5', '15e-3']), as_list=True)
+        assert [(n.s, n.x, n.e) for n in numbers] == [(1, 15, -1), (1, 15, -3)]
+        assert all(type(n) is Dn for n in numbers)
+
+    def test_parse_decimals_large(self):
+        a = parse_decimals(['123456789012345678901234567890', '1'])
+        assert a.x.dtype == object
+        assert a[0] == Dn(123456789012345678901234567890)
+
+    def test_parse_decimals_empty(self):
+        assert len(parse_decimals([])) == 0
+        assert len(parse_decimals(np.array([], dtype='S1'))) == 0
+
+    @pytest.mark.parametrize('key, values', [
+        ('list', ['1', '2', '1.2.3']),
+        ('np.array(str)', np.array(['1', '2', '1.2.3'])),
+        ('np.array(bytes)', np.array([b'1', b'2', b'1.2.3'])),
+        ('non-ascii', np.array(['1', '2', '１'])),
+        ('exponent', np.array(['1', '2', '1e12345678901234567890'])),
+        ('list exponent', ['1', '2', '1e12345678901234567890']),
+    ])
+    def test_parse_decimals_raise_row(self, key, values):
+        with pytest.raises(ValueError, match='at row 2'): parse_decimals(values)
+
+    def test_parse_decimals_raise_type(self):
+        with pytest.raises(TypeError, match='at row 1'): parse_decimals(['1', 1.5])
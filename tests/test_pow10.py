@@ -0,0 +1,33 @@
+import pytest
+from tvu.decimal_value import Dn, pow10, pow10_cache_info, pow10_cache_clear
+from tvu.decimal_value.pow10 import TABLE_SIZE
+
+
+class TestPow10:
+    """Test pow10"""
+
+    @pytest.mark.parametrize('key, k', [
+        ('0', 0),
+        ('1', 1),
+        ('TABLE_SIZE - 1', TABLE_SIZE - 1),
+        ('TABLE_SIZE', TABLE_SIZE),
+        ('5000', 5000),
+        ('-3', -3),
+    ])
+    def test_pow10(self, key, k): assert pow10(k) == 10 ** k
+
+    def test_pow10_cache_info(self):
+        pow10_cache_clear()
+        pow10(2)
+        pow10(TABLE_SIZE + 10)
+        pow10(TABLE_SIZE + 10)
+        info = pow10_cache_info()
+        assert (info['lru_hits'], info['misses'], info['lru_size']) == (1, 1, 1)
+
+    def test_alignment(self):
+        a, b, c = Dn(1.5), Dn(1), Dn(10 ** 100)
+        pow10_cache_clear()
+        assert a + b == Dn(2.5)
+        assert pow10_cache_info()['misses'] == 0
+        assert a + c - c == a
+        assert (pow10_cache_info()['misses'], pow10_cache_info()['lru_hits']) == (1, 1)
@@ -0,0 +1,143 @@
+import pytest
+import numpy as np
+from tvu.decimal_value.power.float_power import float_power, float_power_array
+from tvu.decimal_value.power.int_power import int_power, strip_zeros
+from tvu.decimal_value.power.npint_power import npint_power
+from tvu.decimal_value.power.str_power import str_power, str_power_array
+
+
+class TestIntPower:
+    """Test int_power"""
+
+    @pytest.mark.parametrize('key, arg, expected', [
+        ('0', 0, (0, 0)),
+        ('1', 1, (1, 0)),
+        ('120', 120, (12, 1)),
+        ('10**18', 10 ** 18, (1, 18)),
+        ('10**19', 10 ** 19, (1, 19)),
+        ('123 * 10**777', 123 * 10 ** 777, (123, 777)),
+        ('(10**100 + 1) * 10**64', (10 ** 100 + 1) * 10 ** 64, (10 ** 100 + 1, 64)),
+    ])
+    def test_int_power(self, key, arg, expected): assert int_power(arg) == expected
+
+    def test_int_power_large(self): assert int_power(10 ** 5000) == (1, 5000)
+
+    @pytest.mark.parametrize('key, zeros', [(str(k), k) for k in (1, 2, 3, 31, 32, 33, 1000, 4097)])
+    def test_strip_zeros(self, key, zeros): assert strip_zeros(7 * 10 ** zeros) == (7, zeros)
+
+
+class TestNpintPower:
+    """Test npint_power"""
+
+    @pytest.mark.parametrize('key, arg, expected', [
+        ('np.int64(0)', np.int64(0), (0, 0)),
+        ('np.int32(120)', np.int32(120), (12, 1)),
+        ('np.int64(10**18)', np.int64(10 ** 18), (1, 18)),
+    ])
+    def test_npint_power(self, key, arg, expected): assert npint_power(arg) == expected
+
+    @pytest.mark.parametrize('key, dtype', [
+        ('int8', np.int8), ('int16', np.int16), ('int32', np.int32), ('int64', np.int64), ('uint64', np.uint64),
+    ])
+    def test_npint_power_array(self, key, dtype):
+        info = np.iinfo(dtype)
+        values = np.array([0, 1, 10, 100, 120, info.max, info.min], dtype=dtype)
+        x, e = npint_power(values)
+        assert [(int(a), int(b)) for a, b in zip(x, e)] == [int_power(abs(int(v))) for v in values]
+
+    def test_npint_power_array_overflow(self):
+        x, e = npint_power(np.array([2 ** 64 - 1, 10 ** 19], dtype=np.uint64))
+        assert x.dtype == object
+        assert x.tolist() == [2 ** 64 - 1, 1]
+        assert e.tolist() == [0, 19]
+
+    def test_npint_power_array_raise(self):
+        with pytest.raises(TypeError): npint_power(np.array([1.5]))
+
+
+class TestFloatPower:
+    """Test float_power"""
+
+    @pytest.mark.parametrize('key, arg, expected', [
+        ('0.0', 0.0, (0, 0)),
+        ('1.0', 1.0, (10, -1)),
+        ('1.2', 1.2, (12, -1)),
+        ('0.29', 0.29, (29, -2)),
+        ('0.0001', 0.0001, (1, -4)),
+        ('1e-07', 1e-07, (1, -7)),
+        ('1.5e-07', 1.5e-07, (15, -8)),
+        ('1e+22', 1e22, (1, 22)),
+        ('1.7976931348623157e+308', 1.7976931348623157e308, (17976931348623157, 292)),
+        ('5e-324', 5e-324, (5, -324)),
+        ('1234567890.1234567890', 1234567890.1234567890, (12345678901234567, -7)),
+    ])
+    def test_float_power(self, key, arg, expected): assert float_power(arg) == expected
+
+    @pytest.mark.parametrize('key, values', [
+        ('random', np.random.default_rng(0).random(2000)),
+        ('2 decimals', np.round(np.random.default_rng(1).random(2000) * 100, 2)),
+        ('wide range', 10 ** np.random.default_rng(2).uniform(-30, 30, 2000)),
+        ('special', np.array([0.0, -0.0, 1.0, -2.5, 0.5, 0.25, 1024.0, 2.0 ** 52, 1e15 - 1, 1e16, 1e-4, 1e-5, 0.1, 0.3, 2.675, 5e-324])),
+    ])
+    def test_float_power_array(self, key, values):
+        x, e = float_power_array(values)
+        assert x.dtype == np.int64 and e.dtype == np.int64
+        assert list(zip(x.tolist(), e.tolist())) == [float_power(abs(v)) for v in values.tolist()]
+
+    @pytest.mark.parametrize('key, arg', [('inf', float('inf')), ('-inf', float('-inf')), ('nan', float('nan'))])
+    def test_float_power_raise(self, key, arg):
+        with pytest.raises(ValueError, match='Cannot decompose inf or nan'): float_power(arg)
+
+    def test_float_power_array_raise(self):
+        with pytest.raises(ValueError): float_power_array(np.array([1.0, np.nan]))
+
+
+class TestStrPower:
+    """Test str_power"""
+
+    @pytest.mark.parametrize('key, arg, expected', [
+        ('0', '0', (0, 0, 0)),
+        ('-0', '-0', (0, 0, 0)),
+        ('1.50', '1.50', (1, 150, -2)),
+        ('-12.5', '-12.5', (-1, 125, -1)),
+        ('.5', '.5', (1, 5, -1)),
+        ('5.', '5.', (1, 5, 0)),
+        ('+7', '+7', (1, 7, 0)),
+        ('15e-3', '15e-3', (1, 15, -3)),
+        ('1.5E+3', '1.5E+3', (1, 15, 2)),
+        ("b'-2e3'", b'-2e3', (-1, 2, 3)),
+        ('20 digits', '12345678901234567890', (1, 12345678901234567890, 0)),
+    ])
+    def test_str_power(self, key, arg, expected): assert str_power(arg) == expected
+
+    @pytest.mark.parametrize('key, arg', [
+        ('empty', ''), ('sign', '-'), ('dot', '.'), ('e', 'e5'), ('no exponent', '1e'), ('two dots', '1.2.3'),
+        ('two signs', '+-1'), ('space', ' 1'), ('nan', 'nan'), ('inf', 'inf'), ('comma', '1,5'),
+    ])
+    def test_str_power_raise(self, key, arg):
+        with pytest.raises(ValueError): str_power(arg)
+
+    @pytest.mark.parametrize('key, values', [
+        ('valid', ['0', '-0', '1.50', '-12.5', '.5', '5.', '+7', '15e-3', '1.5E+3', '-0.000120', '00012', '1e-0']),
+        ('long', ['12345678901234567890', '-0.12345678901234567890123', '1e1234567890123456789', '000000000000000000001']),
+        ('invalid', ['', '-', '.', 'e5', '1e', '1.2.3', '+-1', ' 1', '1 ', 'nan', '1e+', '1e5.0', '1-2']),
+        ('non-ascii', ['1', '１', '1é', '2.5', '٣']),
+        ('random', [f'{v:.{k}e}' for k, v in zip(range(2000), np.random.default_rng(0).normal(0, 1e6, 2000))]),
+    ])
+    def test_str_power_array(self, key, values):
+        s, x, e, invalid = str_power_array(np.array(values))
+        for i, v in enumerate(values):
+            try:
+                expected = str_power(v)
+            except ValueError:
+                assert invalid[i]
+            else:
+                assert not invalid[i]
+                assert (s[i], x[i], e[i]) == expected
+
+    @pytest.mark.parametrize('key, values', [
+        ('str', np.array(['1', '1e12345678901234567890'])),
+        ('bytes', np.array([b'1', b'-1.5e-12345678901234567890'])),
+    ])
+    def test_str_power_array_raise(self, key, values):
+        with pytest.raises(ValueError, match='at row 1'): str_power_array(values)
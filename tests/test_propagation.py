@@ -0,0 +1,42 @@
+import operator
+import pytest
+import numpy as np
+from tvu.typical_value import propagation
+
+
+def numeric(f, ta, tb, h=1e-6):
+    """Differentiates by central differences, for comparison."""
+    da = (f(ta + h, tb) - f(ta - h, tb)) / (2 * h)
+    db = (f(ta, tb + h) - f(ta, tb - h)) / (2 * h)
+    return f(ta, tb), da, db
+
+
+class TestPropagation:
+    """Test the propagation kernels"""
+
+    @pytest.mark.parametrize('key, kernel, f', [
+        ('add', propagation.d_add, operator.add),
+        ('sub', propagation.d_sub, operator.sub),
+        ('mul', propagation.d_mul, operator.mul),
+        ('truediv', propagation.d_truediv, operator.truediv),
+        ('power', propagation.d_power, operator.pow),
+    ])
+    @pytest.mark.parametrize('operands', [(1.5, 2.5), (0.7, -1.3), (3.0, 0.5)])
+    def test_kernel(self, key, kernel, f, operands):
+        t, da, db = kernel(*operands)
+        expected_t, expected_da, expected_db = numeric(f, *operands)
+        assert float(t) == pytest.approx(expected_t)
+        assert (float(da), float(db)) == pytest.approx((expected_da, expected_db), rel=1e-6)
+
+    def test_kernel_array(self):
+        rng = np.random.default_rng(0)
+        ta, tb = rng.uniform(1, 2, 100), rng.uniform(1, 2, 100)
+        t, da, db = propagation.d_power(ta, tb)
+        for i in range(100):
+            assert (t[i], da[i], db[i]) == pytest.approx(propagation.d_power(ta[i], tb[i]))
+
+    def test_power_negative_base(self):
+        with np.errstate(all='raise'):
+            t, da, db = propagation.d_power(-2.0, 3.0)
+        assert (float(t), float(da)) == pytest.approx((-8.0, 12.0))
+        assert np.isnan(db)
@@ -0,0 +1,67 @@
+import pytest
+import numpy as np
+from decimal import Decimal, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_EVEN, ROUND_HALF_UP
+from tvu.decimal_value.rounding import ROUNDING_MODES, quantize, quantize_array
+
+_DECIMAL = {
+    'half-up': ROUND_HALF_UP,
+    'half-even': ROUND_HALF_EVEN,
+    'toward-zero': ROUND_DOWN,
+    'floor': ROUND_FLOOR,
+    'ceil': ROUND_CEILING,
+}
+VALUES = [0, 1, -1, 5, -5, 15, -15, 25, -25, 149, -150, 151, 250, -250, 999, -1001, 123456789, -987654321]
+
+
+def _expected(v: int, shift: int, mode: str) -> int:
+    return int((Decimal(v).scaleb(-shift)).quantize(Decimal(1), rounding=_DECIMAL[mode]))
+
+
+class TestQuantize:
+    """Test quantize"""
+
+    @pytest.mark.parametrize('key, mode', [(m, m) for m in ROUNDING_MODES])
+    def test_quantize(self, key, mode):
+        for shift in (1, 2, 3):
+            for v in VALUES:
+                assert quantize(v, shift, mode) == _expected(v, shift, mode), (v, shift)
+
+    @pytest.mark.parametrize('key, shift', [('zero', 0), ('negative', -3)])
+    def test_quantize_no_shift(self, key, shift):
+        result = quantize(-125, shift, 'half-even')
+        assert result == -125 and type(result) is int
+
+    def test_quantize_big(self):
+        v = 10 ** 40 + 5 * 10 ** 19
+        assert quantize(v, 20, 'half-even') == 10 ** 20
+        assert quantize(-v, 20, 'half-up') == -(10 ** 20 + 1)
+
+    def test_quantize_invalid_mode(self):
+        with pytest.raises(ValueError):
+            quantize(15, 1, 'up')
+
+
+class TestQuantizeArray:
+    """Test quantize_array"""
+
+    @pytest.mark.parametrize('key, mode', [(m, m) for m in ROUNDING_MODES])
+    def test_quantize_array(self, key, mode):
+        v = np.array(VALUES, dtype=np.int64)
+        shift = np.arange(len(VALUES)) % 4
+        result = quantize_array(v, shift, mode)
+        assert result.dtype == np.int64
+        assert result.tolist() == [quantize(a, k, mode) for a, k in zip(VALUES, shift.tolist())]
+
+    @pytest.mark.parametrize('key, mode', [(m, m) for m in ROUNDING_MODES])
+    def test_quantize_array_object(self, key, mode):
+        v = np.array([10 ** 40 + 5 * 10 ** 19, -(10 ** 40 + 5 * 10 ** 19), 25], dtype=object)
+        shift = np.array([20, 20, 25])
+        result = quantize_array(v, shift, mode)
+        assert result.tolist() == [quantize(a, k, mode) for a, k in zip(v.tolist(), shift.tolist())]
+
+    def test_quantize_array_scalar_shift(self):
+        assert quantize_array(np.array([15, -15, 25]), 1, 'half-even').tolist() == [2, -2, 2]
+
+    def test_quantize_array_invalid_mode(self):
+        with pytest.raises(ValueError):
+            quantize_array(np.array([15]), np.array([1]), 'up')
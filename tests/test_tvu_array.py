@@ -0,0 +1,157 @@
+import math
+import pytest
+import numpy as np
+from tvu import TVU_DTYPE, Tvu, TvuArray, from_structured, to_structured
+
+
+class TestTvuArray_constructor:
+    """Test TvuArray.__init__"""
+
+    def test___init___ndarray(self):
+        samples = np.random.default_rng(0).normal(10.0, 2.0, size=(50, 8))
+        arr = TvuArray(samples)
+        for i, row in enumerate(samples):
+            assert arr.t[i] == pytest.approx(np.average(row))
+            assert arr.u[i] == pytest.approx(np.std(row, ddof=1) / math.sqrt(len(row)))
+        assert arr.t.flags.c_contiguous and arr.u.flags.c_contiguous
+
+    def test___init___columns(self):
+        arr = TvuArray([1.0, 2.0], [0.1, -0.2])
+        assert arr.t.tolist() == [1.0, 2.0]
+        assert arr.u.tolist() == [0.1, 0.2]
+
+    def test___init___list(self):
+        arr = TvuArray([Tvu(1, 2), Tvu(3), 4])
+        assert arr.t.tolist() == [1.0, 3.0, 4.0]
+        assert arr.u.tolist() == [2.0, 0.0, 0.0]
+
+    @pytest.mark.parametrize('key, args', [
+        ('1.2', (1.2,)),
+        ('np.zeros((1, 1, 1))', (np.zeros((1, 1, 1)),)),
+        ('(1, 2, 3)', (1, 2, 3)),
+    ])
+    def test___init___raise(self, key, args):
+        with pytest.raises(TypeError): TvuArray(*args)
+
+    def test___init___ndarray_raise(self):
+        with pytest.raises(ValueError, match='At least two samples'): TvuArray(np.ones((3, 1)))
+
+
+class TestTvuArray___getitem__:
+    """Test TvuArray.__getitem__"""
+
+    def test___getitem___view(self):
+        arr = TvuArray([1.5, 2.5], [0.5, 0.25])
+        view = arr[-1]
+        assert isinstance(view, Tvu)
+        assert (view.T, view.U) == (2.5, 0.25)
+        assert view.t == 2.5
+        arr.t[1] = 7.0
+        assert view.T == 7.0
+
+    def test___getitem___slice(self):
+        arr = TvuArray([1.0, 2.0, 3.0], [0.1, 0.2, 0.3])
+        part = arr[1:]
+        assert len(part) == 2
+        assert np.shares_memory(part.t, arr.t)
+
+    def test___getitem___raise(self):
+        with pytest.raises(IndexError): TvuArray([1.0], [0.1])[1]
+
+
+class TestTvuArray_arithmetic:
+    """Test the arithmetic operators of TvuArray"""
+
+    @pytest.mark.parametrize('key, f', [
+        ('a + b', lambda a, b: a + b),
+        ('a - b', lambda a, b: a - b),
+        ('a * b', lambda a, b: a * b),
+        ('a / b', lambda a, b: a / b),
+        ('a ** b', lambda a, b: a ** b),
+        ('a * 2', lambda a, b: a * 2),
+        ('1 / a', lambda a, b: 1 / a),
+        ('a - Tvu', lambda a, b: a - Tvu(1.5, 0.1)),
+        ('Tvu ** a', lambda a, b: Tvu(1.5, 0.1) ** a),
+        ('-a', lambda a, b: -a),
+    ])
+    def test_operator(self, key, f):
+        rng = np.random.default_rng(0)
+        a = TvuArray(rng.uniform(1, 2, 20), rng.uniform(0, 0.1, 20))
+        b = TvuArray(rng.uniform(1, 2, 20), rng.uniform(0, 0.1, 20))
+        result = f(a, b)
+        assert isinstance(result, TvuArray)
+        for i, tvu in enumerate(result):
+            expected = f(a[i], b[i])
+            assert (tvu.T, tvu.U) == pytest.approx((expected.T, expected.U))
+
+    def test_operator_ndarray(self):
+        result = np.array([1.0, 2.0]) * TvuArray([3.0, 4.0], [0.1, 0.2])
+        assert isinstance(result, TvuArray)
+        assert result.t.tolist() == [3.0, 8.0]
+        assert result.u.tolist() == pytest.approx([0.1, 0.4])
+
+    def test_operator_raise(self):
+        with pytest.raises(TypeError): TvuArray([1.0], [0.1]) + 'a'
+        with pytest.raises(ValueError): TvuArray([1.0, 2.0], [0.1, 0.1]) + TvuArray([1.0, 2.0, 3.0], [0.1, 0.1, 0.1])
+
+
+class TestTvuArray_structured:
+    """Test TvuArray.to_structured, from_structured and the module functions"""
+
+    def test_roundtrip(self, tmp_path):
+        a = TvuArray([1.5, -2.0, 3.25], [0.1, 0.2, 0.0])
+        rec = a.to_structured()
+        assert rec.dtype == TVU_DTYPE
+        np.save(tmp_path / 'a.npy', rec)
+        result = TvuArray.from_structured(np.load(tmp_path / 'a.npy', mmap_mode='r'))
+        assert result.t.tolist() == a.t.tolist() and result.u.tolist() == a.u.tolist()
+
+    def test_zero_copy(self):
+        rec = np.zeros(3, dtype=TVU_DTYPE)
+        a = TvuArray.from_structured(rec)
+        assert np.shares_memory(a.t, rec) and np.shares_memory(a.u, rec)
+        assert a.to_structured() is rec
+        rec['t'][1] = 5.0
+        assert a.T[1] == 5.0
+
+    def test_numpy(self):
+        rec = to_structured([Tvu(3.0, 0.3), Tvu(1.0, 0.1), Tvu(2.0, 0.2)])
+        joined = np.concatenate([rec, rec[[0]]])
+        assert joined['t'].tolist() == [3.0, 1.0, 2.0, 3.0]
+        assert np.sort(rec, order='t')['u'].tolist() == [0.1, 0.2, 0.3]
+        total = np.sum(from_structured(joined))
+        assert (total.T, total.U) == pytest.approx((9.0, math.sqrt(0.09 * 2 + 0.01 + 0.04)))
+
+    def test_scalar(self):
+        record = to_structured(Tvu(1.5, 0.25))
+        assert isinstance(record, np.void) and record.dtype == TVU_DTYPE
+        tvu = from_structured(record)
+        assert (tvu.T, tvu.U) == (1.5, 0.25)
+
+    def test_arithmetic(self):
+        a = from_structured(to_structured([Tvu(1.0, 0.1), Tvu(2.0, 0.2)]))
+        result = a * a + a
+        assert result.T.tolist() == [2.0, 6.0]
+        assert result.U.tolist() == pytest.approx([(2 * 1.0 + 1) * 0.1, (2 * 2.0 + 1) * 0.2])  # a * a depends on a
+
+    @pytest.mark.parametrize('key, arg', [
+        ('float64', np.zeros(2)),
+        ('2-D', np.zeros((2, 2), dtype=TVU_DTYPE)),
+        ('record of another dtype', np.zeros(1, dtype=[('a', '<f8')])[0]),
+    ])
+    def test_from_structured_raise(self, key, arg):
+        with pytest.raises(TypeError): from_structured(arg)
+
+
+class TestTvuArray_sort:
+    """Test np.sort and np.argsort on TvuArray"""
+
+    def test_sort(self):
+        a = TvuArray([3.0, 1.0, 2.0], [0.3, 0.1, 0.2])
+        assert np.argsort(a).tolist() == [1, 2, 0]
+        result = np.sort(a)
+        assert result.t.tolist() == [1.0, 2.0, 3.0]
+        assert result.u.tolist() == [0.1, 0.2, 0.3]
+
+    def test_sort_raise(self):
+        with pytest.raises(ValueError): np.sort(TvuArray([1.0]), axis=1)
@@ -1,9 +1,98 @@
 import math
+import pytest
 import numpy as np
-from tvu import Typu
+from tvu import Dn, Tvu
 
 
 class TestTypicalValueWithUncertainty_constructor:
     """Test TypicalValueWithUncertainty.__init__"""
 
-    
\ No newline at end of file
+    
+    def test___init___ndarray(self):
+        samples = np.array([1.0, 2.0, 3.0, 4.0])
+        tvu = Tvu(samples)
+        assert tvu.T == pytest.approx(np.average(samples))
+        assert tvu.U == pytest.approx(np.std(samples, ddof=1) / math.sqrt(len(samples)))
+
+    @pytest.mark.parametrize('key, args', [
+        ('1.2j', (1.2j,)),
+        ('np.array([[1.2]])', (np.array([[1.2]]),)),
+        ('(1, 2, 3)', (1, 2, 3)),
+    ])
+    def test___init___raise(self, key, args):
+        with pytest.raises(TypeError): Tvu(*args)
+
+    @pytest.mark.parametrize('key, samples', [
+        ('empty', np.array([])),
+        ('one', np.array([1.0])),
+    ])
+    def test___init___ndarray_raise(self, key, samples):
+        with pytest.raises(ValueError, match='At least two samples'): Tvu(samples)
+
+    def test___slots__(self):
+        assert not hasattr(Tvu(1, 2), '__dict__')
+
+    def test_from_parts(self):
+        tvu = Tvu.from_parts(Dn(1.5), Dn(0.1))
+        assert (tvu.T, tvu.U) == (1.5, 0.1)
+
+    def test___init___tvu(self):
+        a = Tvu(1.5, 0.1)
+        b = Tvu(a)
+        assert b is a
+        assert (b - a).U == 0
+
+    @pytest.mark.parametrize('key, name', [('t', 't'), ('u', 'u'), ('_deps', '_deps')])
+    def test___setattr__(self, key, name):
+        a = Tvu(1.5, 0.1)
+        a - a
+        with pytest.raises(AttributeError): setattr(a, name, Dn(1))
+        with pytest.raises(AttributeError): delattr(a, name)
+        assert (a.T, a.U) == (1.5, 0.1) and (Tvu(a) - a).U == 0
+
+    def test___init___view(self):
+        from tvu import TvuArray
+        view = TvuArray([1.5], [0.1])[0]
+        tvu = Tvu(view)
+        assert tvu is not view and (tvu.T, tvu.U) == (1.5, 0.1)
+        assert (tvu - view).U == 0
+
+
+class TestTypicalValueWithUncertainty_arithmetic:
+    """Test the arithmetic operators of TypicalValueWithUncertainty"""
+
+    @pytest.mark.parametrize('key, result, expected', [
+        ('a + b', lambda a, b: a + b, (4.0, math.hypot(0.1, 0.2))),
+        ('a - b', lambda a, b: a - b, (-1.0, math.hypot(0.1, 0.2))),
+        ('a * b', lambda a, b: a * b, (3.75, math.hypot(0.1 * 2.5, 0.2 * 1.5))),
+        ('a / b', lambda a, b: a / b, (0.6, math.hypot(0.1 / 2.5, 0.2 * 1.5 / 2.5 ** 2))),
+        ('a ** b', lambda a, b: a ** b, (1.5 ** 2.5, math.hypot(2.5 * 1.5 ** 1.5 * 0.1, 1.5 ** 2.5 * math.log(1.5) * 0.2))),
+        ('a + 1', lambda a, b: a + 1, (2.5, 0.1)),
+        ('1 - a', lambda a, b: 1 - a, (-0.5, 0.1)),
+        ('2 * a', lambda a, b: 2 * a, (3.0, 0.2)),
+        ('a / Dn(2)', lambda a, b: a / Dn(2), (0.75, 0.05)),
+        ('3 / a', lambda a, b: 3 / a, (2.0, 3 * 0.1 / 1.5 ** 2)),
+        ('a ** 2', lambda a, b: a ** 2, (2.25, 0.3)),
+        ('2 ** a', lambda a, b: 2 ** a, (2 ** 1.5, 2 ** 1.5 * math.log(2) * 0.1)),
+        ('-a', lambda a, b: -a, (-1.5, 0.1)),
+    ])
+    def test_operator(self, key, result, expected):
+        tvu = result(Tvu(1.5, 0.1), Tvu(2.5, 0.2))
+        assert type(tvu) is Tvu
+        assert (tvu.T, tvu.U) == pytest.approx(expected)
+
+    def test_exact_typical_value(self):
+        tvu = Tvu(Dn(1, -1), Dn(1, -2)) + Tvu(Dn(2, -1), Dn(1, -2))
+        assert tvu.t == Dn(3, -1)
+
+    @pytest.mark.parametrize('key, other', [('"1"', '1'), ('1j', 1j), ('[1]', [1])])
+    def test_operator_raise(self, key, other):
+        with pytest.raises(TypeError): Tvu(1.5, 0.1) + other
+
+    @pytest.mark.parametrize('key, f, match', [
+        ('negative ** 0.5', lambda: Tvu(-2.0, 0.1) ** 0.5, r'power\(-2.0, 0.5\)'),
+        ('0 ** -1', lambda: Tvu(0.0, 0.1) ** -1, r'power\(0.0, -1.0\)'),
+        ('np.sqrt(negative)', lambda: np.sqrt(Tvu(-1.0, 0.1)), r'sqrt\(-1.0\)'),
+    ])
+    def test_operator_domain(self, key, f, match):
+        with pytest.raises(ValueError, match='math domain error: ' + match): f()
@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+from tvu import Tvu, TvuArray
+from tvu.typical_value import ufuncs
+
+UNARY = [np.sin, np.cos, np.tan, np.exp, np.exp2, np.expm1, np.log, np.log2, np.log10, np.log1p, np.sqrt, np.cbrt,
+         np.square, np.reciprocal, np.arcsin, np.arccos, np.arctan, np.sinh, np.cosh, np.tanh, np.arcsinh, np.arctanh,
+         np.negative, np.absolute, np.deg2rad, np.rad2deg]
+BINARY = [np.add, np.subtract, np.multiply, np.true_divide, np.power, np.arctan2, np.hypot, np.logaddexp, np.copysign]
+
+
+def central(f, x, h=1e-6):
+    return (f(x + h) - f(x - h)) / (2 * h)
+
+
+class TestDerivatives:
+    """Test ufuncs.derivatives"""
+
+    @pytest.mark.parametrize('key, ufunc', [(u.__name__, u) for u in UNARY])
+    def test_unary(self, key, ufunc):
+        x = np.array([0.3, 0.45, 0.7])
+        y, d = ufuncs.derivatives(ufunc, x)
+        assert y == pytest.approx(ufunc(x))
+        assert d == pytest.approx(central(ufunc, x), rel=1e-6)
+
+    @pytest.mark.parametrize('key, ufunc', [(u.__name__, u) for u in BINARY])
+    def test_binary(self, key, ufunc):
+        a, b = np.array([0.3, 1.5]), np.array([0.7, 0.4])
+        y, da, db = ufuncs.derivatives(ufunc, a, b)
+        assert y == pytest.approx(ufunc(a, b))
+        assert da == pytest.approx(central(lambda x: ufunc(x, b), a), rel=1e-6)
+        assert db == pytest.approx(central(lambda x: ufunc(a, x), b), rel=1e-6, abs=1e-9)
+
+    def test_numeric_complex_step(self):
+        assert ufuncs._numeric(np.cosh, (0.5,), 0) == pytest.approx(np.sinh(0.5), rel=1e-12)
+
+    def test_numeric_central(self):
+        expected = central(lambda x: np.logaddexp2(x, 0.0), 0.5)
+        assert ufuncs._numeric(np.logaddexp2, (0.5, 0.0), 0) == pytest.approx(expected, rel=1e-6)
+
+    def test_not_float(self):
+        assert len(ufuncs.derivatives(np.isfinite, np.array([1.0]))) == 1
+        assert len(ufuncs.derivatives(np.greater, 1.0, 2.0)) == 1
+
+
+class TestArrayUfunc:
+    """Test __array_ufunc__ of TypicalValueWithUncertainty and TvuArray"""
+
+    @pytest.mark.parametrize('key, ufunc', [(u.__name__, u) for u in (np.sin, np.exp, np.log, np.sqrt, np.arctan, np.negative)])
+    def test_unary(self, key, ufunc):
+        arr = TvuArray([0.3, 0.7], [0.01, 0.02])
+        result = ufunc(arr)
+        assert isinstance(result, TvuArray)
+        assert result.t == pytest.approx(ufunc(arr.t))
+        assert result.u == pytest.approx(np.abs(central(ufunc, arr.t)) * arr.u, rel=1e-6)
+        scalar = ufunc(arr[1])
+        assert type(scalar) is Tvu
+        assert (scalar.T, scalar.U) == pytest.approx((result.t[1], result.u[1]))
+
+    @pytest.mark.parametrize('key, ufunc', [(u.__name__, u) for u in (np.add, np.multiply, np.power, np.arctan2, np.hypot)])
+    def test_binary(self, key, ufunc):
+        a, b = TvuArray([0.3, 0.7], [0.01, 0.02]), TvuArray([1.5, 2.5], [0.1, 0.0])
+        result = ufunc(a, b)
+        for i in range(2):
+            scalar = ufunc(a[i], b[i])
+            assert (result.t[i], result.u[i]) == pytest.approx((scalar.T, scalar.U))
+
+    def test_correlated(self):
+        arr = TvuArray([0.3, 0.7], [0.01, 0.02])
+        assert np.subtract(arr, arr).u.tolist() == [0.0, 0.0]
+        assert np.hypot(arr, arr).u == pytest.approx(np.sqrt(2) * arr.u)
+        x = Tvu(0.5, 0.1)
+        assert float((np.sin(x) - np.sin(x)).U) == 0.0
+        assert float((np.arctan2(x, x)).U) == pytest.approx(0.0, abs=1e-17)
+
+    def test_mixed(self):
+        result = np.add(Tvu(1.0, 0.1), np.array([1.0, 2.0]))
+        assert isinstance(result, TvuArray)
+        assert result.u.tolist() == pytest.approx([0.1, 0.1])
+        result = np.array([1.0, 2.0]) * TvuArray([3.0, 4.0], [0.1, 0.2])
+        assert isinstance(result, TvuArray)
+        assert np.exp(Tvu(1.0, 0.1)).U == pytest.approx(np.e * 0.1)
+        assert (np.float64(2.0) * Tvu(1.5, 0.1)).T == 3.0
+
+    def test_not_float(self):
+        assert np.greater(TvuArray([1.0, 3.0], [0.1, 0.1]), 2.0).tolist() == [False, True]
+        assert np.isfinite(Tvu(1.0, 0.1))
+
+    def test_unsupported(self):
+        arr = TvuArray([1.0, 3.0], [0.1, 0.1])
+        with pytest.raises(TypeError): np.add.reduce(arr)
+        with pytest.raises(TypeError): np.sin(arr, out=np.zeros(2))
+        with pytest.raises(TypeError): np.modf(arr)
+
+
+class TestArrayFunction:
+    """Test __array_function__ of TvuArray"""
+
+    def test_sum(self):
+        arr = TvuArray([1.0, 2.0, 3.0], [0.1, 0.0, 0.2])
+        total = np.sum(arr)
+        assert type(total) is Tvu
+        assert (total.T, total.U) == pytest.approx((6.0, np.hypot(0.1, 0.2)))
+        assert float((total - arr[0]).U) == pytest.approx(0.2)
+
+    def test_mean(self):
+        mean = np.mean(TvuArray([1.0, 2.0, 3.0, 4.0], [0.2, 0.2, 0.2, 0.2]))
+        assert (mean.T, mean.U) == pytest.approx((2.5, 0.1))
+
+    def test_concatenate(self):
+        result = np.concatenate([TvuArray([1.0], [0.1]), np.array([2.0, 3.0]), TvuArray([4.0], [0.4])])
+        assert result.t.tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert result.u.tolist() == [0.1, 0.0, 0.0, 0.4]
+
+    def test_unsupported(self):
+        with pytest.raises(TypeError): np.median(TvuArray([1.0], [0.1]))
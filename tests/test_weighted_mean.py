@@ -0,0 +1,101 @@
+import pytest
+import numpy as np
+from tvu import Tvu, TvuArray, covariance_matrix, weighted_mean
+
+
+def _loop(t, u):
+    w = [1 / v ** 2 for v in u]
+    mean = sum(a * b for a, b in zip(w, t)) / sum(w)
+    chi2 = sum(a * (b - mean) ** 2 for a, b in zip(w, t))
+    return mean, sum(w) ** -0.5, (chi2 / (len(t) - 1)) ** 0.5 if len(t) > 1 else float('nan')
+
+
+class TestWeightedMean:
+    """Test weighted_mean"""
+
+    @pytest.mark.parametrize('key, t, u', [
+        ('equal', [1.0, 2.0, 3.0], [1.0, 1.0, 1.0]),
+        ('unequal', [10.0, 12.0], [1.0, 2.0]),
+        ('single', [5.0], [0.5]),
+        ('consistent', [1.00, 1.01, 0.99, 1.02], [0.1, 0.2, 0.1, 0.3]),
+    ])
+    def test_weighted_mean(self, key, t, u):
+        mean, sigma, _ = _loop(t, u)
+        result = weighted_mean(TvuArray(t, u))
+        assert result.T == pytest.approx(mean)
+        assert result.U == pytest.approx(sigma)
+
+    @pytest.mark.parametrize('key, t, u', [
+        ('scattered', [10.0, 14.0], [1.0, 1.0]),
+        ('consistent', [1.00, 1.01, 0.99, 1.02], [0.1, 0.2, 0.1, 0.3]),
+        ('single', [5.0], [0.5]),
+    ])
+    def test_birge(self, key, t, u):
+        mean, sigma, ratio = _loop(t, u)
+        result = weighted_mean(TvuArray(t, u), birge=True)
+        assert result.T == pytest.approx(mean)
+        assert result.U == pytest.approx(sigma * ratio if ratio > 1 else sigma)
+
+    def test_sequence(self):
+        result = weighted_mean([Tvu(10, 1), Tvu(12, 2)])
+        assert result.T == pytest.approx(10.4)
+        assert result.U == pytest.approx(0.8 ** 0.5)
+
+    def test_correlation(self):
+        # the mean is 0.8 * a[0] + 0.2 * a[1], so it shares their uncertainties
+        a = TvuArray([10.0, 12.0], [1.0, 2.0])
+        result = weighted_mean(a)
+        assert (result - a[0]).U == pytest.approx(0.2 ** 0.5)
+        assert (result - result).U == 0
+
+    def test_correlation_sequence(self):
+        a, b = Tvu(10, 1), Tvu(12, 2)
+        result = weighted_mean([a, b])
+        assert (result - a).U == pytest.approx(0.2 ** 0.5)
+        assert (result - 0.8 * a - 0.2 * b).U == pytest.approx(0, abs=1e-15)
+
+    @pytest.mark.parametrize('key, labels', [
+        ('int', np.array([3, 1, 3, 2, 1, 3, 2])),
+        ('str', np.array(['c', 'a', 'c', 'b', 'a', 'c', 'b'])),
+    ])
+    @pytest.mark.parametrize('birge', [False, True])
+    def test_labels(self, key, labels, birge):
+        t = np.array([1.0, 2.0, 4.0, 0.5, 3.0, 7.0, 1.5])
+        u = np.array([0.5, 1.0, 2.0, 0.1, 0.5, 1.0, 0.2])
+        result = weighted_mean(TvuArray(t, u), labels, birge=birge)
+        keys = sorted(set(labels.tolist()))
+        assert result.labels.tolist() == keys
+        assert result.counts.tolist() == [2, 2, 3]
+        for i, k in enumerate(keys):
+            mean, sigma, ratio = _loop(t[labels == k], u[labels == k])
+            assert result.tvu.T[i] == pytest.approx(mean)
+            assert result.tvu.U[i] == pytest.approx(sigma * ratio if birge and ratio > 1 else sigma)
+
+    @pytest.mark.parametrize('birge', [False, True])
+    def test_labels_correlation(self, birge):
+        # the mean of group 1 is 0.8 * a[0] + 0.2 * a[2] (times the Birge ratio), like the ungrouped mean
+        a = TvuArray([10.0, 5.0, 12.0, 6.0], [1.0, 0.5, 2.0, 0.5]) * 1
+        result = weighted_mean(a, np.array([1, 2, 1, 2]), birge=birge)
+        expected = weighted_mean(a[np.array([0, 2])], birge=birge)
+        assert result.tvu[0].U == pytest.approx(expected.U)
+        assert covariance_matrix([result.tvu[0], a[0], a[1]]) == pytest.approx(covariance_matrix([expected, a[0], a[1]]))
+        assert covariance_matrix([result.tvu[0], a[0]])[0, 1] == pytest.approx(0.8 * 1.0 ** 2 * (expected.U / 0.8 ** 0.5))
+        assert (result.tvu[1] - result.tvu.tolist()[1]).U == 0
+
+    def test_labels_large(self):
+        rng = np.random.default_rng(0)
+        t, u = rng.standard_normal(100000), rng.uniform(0.5, 2.0, 100000)
+        labels = rng.integers(0, 100, 100000)
+        result = weighted_mean(TvuArray(t, u), labels, birge=True)
+        expected = weighted_mean(TvuArray(t[labels == 42], u[labels == 42]), birge=True)
+        assert result.tvu.T[42] == pytest.approx(expected.T)
+        assert result.tvu.U[42] == pytest.approx(expected.U)
+
+    @pytest.mark.parametrize('key, values, labels', [
+        ('empty', TvuArray([], []), None),
+        ('exact', TvuArray([1.0, 2.0], [1.0, 0.0]), None),
+        ('nan', TvuArray([1.0, 2.0], [1.0, np.nan]), None),
+        ('length', TvuArray([1.0, 2.0], [1.0, 1.0]), np.zeros(3)),
+    ])
+    def test_raise(self, key, values, labels):
+        with pytest.raises(ValueError): weighted_mean(values, labels)